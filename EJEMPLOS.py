@@ -47,6 +47,9 @@ import math
 class MovingPlatform(Platform):
     """Plataforma que se mueve en un patrón"""
     
+    # Se mueve: no puede tratarse como geometría estática
+    static = False
+    
     def __init__(self, x: float, y: float, width: int, height: int):
         super().__init__(x, y, width, height)
         self.start_x = x
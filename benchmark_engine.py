@@ -0,0 +1,513 @@
+"""
+BENCHMARKS DEL ENGINE
+
+Mide el rendimiento del engine en modo headless (sin ventana ni límite de FPS).
+
+Uso:
+    python benchmark_engine.py                # todos los benchmarks
+    python benchmark_engine.py pipeline       # solo los indicados
+"""
+
+import sys
+import os
+import time
+
+# Añadir el directorio al path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def populate_level(level, enemies: int = 1000, collectibles: int = 1000):
+    """Llena un nivel con muchas entidades para estresar update y draw"""
+    from src.entities.enemy import SimpleEnemy
+    from src.entities.world import Collectible
+    from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    for i in range(enemies):
+        x = 40 + (i * 37) % (SCREEN_WIDTH - 120)
+        y = 60 + (i * 53) % (SCREEN_HEIGHT - 160)
+        enemy = SimpleEnemy(x, y, patrol_range=40 + i % 60, speed=1 + (i % 3) * 0.5)
+        level.enemies.append(enemy)
+        level.add_entity(enemy)
+
+    for i in range(collectibles):
+        collectible = Collectible(40 + (i * 29) % (SCREEN_WIDTH - 80), 40 + (i * 31) % (SCREEN_HEIGHT - 120))
+        level.collectibles.append(collectible)
+        level.add_entity(collectible)
+
+
+def load_level(engine, level):
+    """Activa un nivel y ejecuta ya todas sus cargas diferidas"""
+    engine.initialize()
+    engine.register_scene("level", level)
+    engine.set_scene("level")
+    engine.scheduler.flush()
+
+
+def run_frames(engine, frames: int) -> float:
+    """Simula y dibuja frames; devuelve frames por segundo"""
+    engine.step(10, render=True)  # Calentamiento (cachés)
+    start = time.perf_counter()
+    engine.step(frames, render=True)
+    return frames / (time.perf_counter() - start)
+
+
+def benchmark_pipeline(frames: int = 300):
+    """Compara el bucle secuencial con la simulación en tubería"""
+    from src.engine import GameEngine
+    from src.scenes.level import LevelScene
+
+    print("\nSimulación y dibujo: secuencial vs en tubería")
+    results = {}
+    for pipelined in (False, True):
+        with GameEngine(headless=True, pipelined=pipelined) as engine:
+            level = LevelScene(1280, 720)
+            populate_level(level)
+            load_level(engine, level)
+            results[pipelined] = run_frames(engine, frames)
+
+    # La tubería solo puede ganar con más de un núcleo
+    print(f"  Entidades: {len(level.entities)} - CPUs: {os.cpu_count()}")
+    print(f"  Secuencial:  {results[False]:8.1f} FPS")
+    print(f"  En tubería:  {results[True]:8.1f} FPS ({results[True] / results[False]:.2f}x)")
+    return results
+
+
+def benchmark_render_queue(frames: int = 200):
+    """Compara draw() por entidad con la cola de dibujo y blits() por capa"""
+    from src.engine import GameEngine
+    from src.scenes.level import LevelScene
+
+    print("\nDibujo de entidades: draw() por entidad vs cola con blits()")
+    with GameEngine(headless=True) as engine:
+        level = LevelScene(1280, 720)
+        populate_level(level)
+        load_level(engine, level)
+        entities = [entity for entity in level.entities if not entity.static]
+        screen = engine.screen
+
+        level.draw_entities(screen, entities)  # Calentamiento (imágenes cacheadas)
+        start = time.perf_counter()
+        for _ in range(frames):
+            for entity in entities:
+                entity.draw(screen)
+        direct_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            level.draw_entities(screen, entities)
+        queue_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+    print(f"  Entidades móviles: {len(entities)} - llamadas a blits(): {level.render_queue.blit_calls}")
+    print(f"  draw() por entidad: {direct_ms:7.2f} ms/frame")
+    print(f"  Cola + blits():     {queue_ms:7.2f} ms/frame ({direct_ms / queue_ms:.2f}x)")
+    return direct_ms, queue_ms
+
+
+def benchmark_bitmap_font(frames: int = 2000):
+    """Compara dibujar los contadores con pygame.font y con la fuente de mapa de bits"""
+    import pygame
+    from src.engine import GameEngine
+    from src.render.bitmap_font import load_bitmap_font
+
+    print("\nContadores del HUD: pygame.font vs fuente de mapa de bits")
+    with GameEngine(headless=True) as engine:
+        engine.initialize()
+        screen = engine.screen
+        font = pygame.font.Font(None, 36)
+        bitmap = load_bitmap_font("lums", 26)
+
+        # Como lo hacía el HUD antes de la caché de fuentes
+        start = time.perf_counter()
+        for i in range(frames):
+            screen.blit(pygame.font.Font(None, 36).render(f"{i * 10}", True, (255, 215, 0)), (50, 25))
+        new_font_us = (time.perf_counter() - start) * 1e6 / frames
+
+        start = time.perf_counter()
+        for i in range(frames):
+            screen.blit(font.render(f"{i * 10}", True, (255, 215, 0)), (50, 25))
+        ttf_us = (time.perf_counter() - start) * 1e6 / frames
+
+        start = time.perf_counter()
+        for i in range(frames):
+            bitmap.draw(screen, f"{i * 10}", (50, 25))
+        bitmap_us = (time.perf_counter() - start) * 1e6 / frames
+
+    print(f"  Font nueva + render: {new_font_us:7.1f} us/contador")
+    print(f"  Font cacheada:       {ttf_us:7.1f} us/contador")
+    print(f"  Mapa de bits:        {bitmap_us:7.1f} us/contador ({new_font_us / bitmap_us:.1f}x)")
+    return new_font_us, ttf_us, bitmap_us
+
+
+def benchmark_camera(frames: int = 200):
+    """Coste de dibujo con la misma densidad de entidades en niveles de 1 y 8 pantallas"""
+    from src.engine import GameEngine
+    from src.scenes.level import LevelScene
+    from src.entities.world import Collectible
+
+    print("\nDibujo con cámara: nivel de 1 pantalla vs 8 pantallas")
+    results = {}
+    for screens in (1, 8):
+        with GameEngine(headless=True) as engine:
+            level = LevelScene(1280, 720)
+            level.set_world_size(1280 * screens, 720)
+            for i in range(500 * screens):
+                collectible = Collectible(40 + (i * 7) % (1280 * screens - 80), 40 + (i * 31) % 600)
+                level.collectibles.append(collectible)
+                level.add_entity(collectible)
+            load_level(engine, level)
+            screen = engine.screen
+
+            level.draw(screen)  # Calentamiento (capa estática)
+            start = time.perf_counter()
+            for _ in range(frames):
+                level.draw(screen)
+            results[screens] = (time.perf_counter() - start) * 1000.0 / frames
+            print(f"  {screens} pantalla(s), {len(level.entities):5d} entidades: "
+                  f"{results[screens]:6.2f} ms/frame ({level.render_queue.items} dibujadas)")
+    return results
+
+
+def benchmark_parallax(frames: int = 200):
+    """Compara el fondo parallax pre-escalado con escalar las capas en cada frame"""
+    import pygame
+    from src.engine import GameEngine
+    from src.scenes.level import LevelScene
+
+    print("\nFondo parallax: capas escaladas en cada frame vs pre-escaladas")
+    with GameEngine(headless=True) as engine:
+        level = LevelScene(1280, 720)
+        load_level(engine, level)
+        screen = engine.screen
+        background = level.background
+        if background is None:
+            print("  Sin hoja de fondo")
+            return None
+        sheet = pygame.image.load(level.asset_files()[0]).convert_alpha()
+        layers = [(sheet.subsurface(area), factor, y, height)
+                  for area, factor, y, height in level.BACKGROUND_LAYERS]
+
+        start = time.perf_counter()
+        for i in range(frames):
+            for image, factor, y, height in layers:
+                width = image.get_width() * height // image.get_height()
+                scaled = pygame.transform.smoothscale(image, (width, height))
+                x = -(int(i * 8 * factor) % width)
+                screen.blits([(scaled, (x + n * width, y)) for n in range(1280 // width + 2)], doreturn=False)
+        scaled_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+        start = time.perf_counter()
+        for i in range(frames):
+            background.draw(screen, (i * 8, 0))
+        prescaled_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+    print(f"  Capas: {len(background.layers)}")
+    print(f"  Escaladas por frame: {scaled_ms:7.2f} ms/frame")
+    print(f"  Pre-escaladas:       {prescaled_ms:7.2f} ms/frame ({scaled_ms / prescaled_ms:.1f}x)")
+    return scaled_ms, prescaled_ms
+
+
+def benchmark_render_scale(frames: int = 100):
+    """Coste de un frame en una ventana de 2560x1440 según la resolución interna"""
+    from src.engine import GameEngine
+    from src.scenes.level import LevelScene
+
+    print("\nVentana de 2560x1440: dibujo nativo vs resolución interna escalada")
+    results = {}
+    cases = (("nativa 2560x1440", 2560, 1440, "nativa"),
+             ("1280x720 entero", 1280, 720, "nitida"),
+             ("1280x720 suave", 1280, 720, "suave"))
+    for name, width, height, preset in cases:
+        with GameEngine(width, height, headless=True, render_preset=preset, window_size=(2560, 1440)) as engine:
+            level = LevelScene(width, height)
+            populate_level(level, enemies=200, collectibles=200)
+            load_level(engine, level)
+            results[name] = 1000.0 / run_frames(engine, frames)
+        print(f"  {name:<18} {results[name]:7.2f} ms/frame")
+    return results
+
+
+def benchmark_backends(frames: int = 200):
+    """Mismo nivel con el backend de superficies y con el de texturas de SDL2"""
+    from src.engine import GameEngine
+    from src.scenes.level import LevelScene
+
+    print("\nBackends de dibujo: pygame.Surface vs Renderer/Texture de SDL2")
+    results = {}
+    for backend in ("surface", "texture"):
+        with GameEngine(headless=True, backend=backend) as engine:
+            level = LevelScene(1280, 720)
+            populate_level(level)
+            load_level(engine, level)
+            screen = engine.screen
+
+            level.draw(screen)  # Calentamiento (capas y texturas)
+            start = time.perf_counter()
+            for _ in range(frames):
+                screen.fill((0, 0, 0))
+                level.draw(screen)
+                engine.backend.scale()
+                engine.backend.present()
+            results[engine.backend.name] = (time.perf_counter() - start) * 1000.0 / frames
+        print(f"  {engine.backend.name:<8} {results[engine.backend.name]:7.2f} ms/frame")
+    if "texture" in results:
+        print(f"  Texturas: {results['surface'] / results['texture']:.2f}x")
+    return results
+
+
+def benchmark_particles(frames: int = 200, count: int = 10000):
+    """Partículas en arrays de NumPy vs una entidad de Python por partícula"""
+    import numpy as np
+    from src.engine import GameEngine
+    from src.render.particles import ParticleEmitter, particle_frames
+    from src.render.queue import RenderQueue
+
+    class ParticleEntity:
+        """Partícula como objeto de Python (lo que se evita)"""
+
+        def __init__(self, image, x, y, vx, vy, life):
+            self.image, self.x, self.y, self.vx, self.vy = image, x, y, vx, vy
+            self.age, self.life = 0.0, life
+
+        def update(self, dt):
+            self.vy += 300.0 * dt / 1000.0
+            self.x += self.vx * dt / 1000.0
+            self.y += self.vy * dt / 1000.0
+            self.age += dt
+
+        def submit(self, queue):
+            queue.submit(self.image, (int(self.x) - 4, int(self.y) - 4), 3)
+
+    print(f"\nPartículas: {count} vivas, NumPy vs una entidad por partícula")
+    dt = 1000.0 / 60
+    with GameEngine(headless=True) as engine:
+        engine.initialize()
+        screen = engine.screen
+        variants = [particle_frames(color, 4) for color in ((255, 215, 0), (255, 240, 120))]
+        # Vidas largas y reposición continua: siempre hay count partículas vivas
+        emitter = ParticleEmitter(variants, capacity=count, gravity=300.0, seed=1)
+        emitter.emit(640, 360, count, speed=(0.0, 200.0), life=(2000.0, 4000.0), spread=300.0)
+        queue = RenderQueue()
+        start = time.perf_counter()
+        live = 0
+        for _ in range(frames):
+            screen.fill((0, 0, 0))
+            emitter.update(dt)
+            emitter.emit(640, 360, count - emitter.count, speed=(0.0, 200.0), life=(2000.0, 4000.0), spread=300.0)
+            emitter.submit(queue)
+            queue.flush(screen)
+            live += emitter.count
+        numpy_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+        rng = np.random.default_rng(1)
+        images = emitter.frames
+        particles = [ParticleEntity(images[i % len(images)], 640 + rng.uniform(-300, 300), 360 + rng.uniform(-300, 300),
+                                    rng.uniform(-150, 150), rng.uniform(-150, 150), 1e9) for i in range(count)]
+        start = time.perf_counter()
+        for _ in range(frames):
+            screen.fill((0, 0, 0))
+            for particle in particles:
+                particle.update(dt)
+            for particle in particles:
+                particle.submit(queue)
+            queue.flush(screen)
+        objects_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+    print(f"  Vivas de media: {live / frames:.0f}")
+    print(f"  Una entidad por partícula: {objects_ms:7.2f} ms/frame")
+    print(f"  Arrays de NumPy:           {numpy_ms:7.2f} ms/frame ({1000.0 / numpy_ms:.0f} FPS, {objects_ms / numpy_ms:.2f}x)")
+    return objects_ms, numpy_ms
+
+
+def benchmark_postfx(frames: int = 100):
+    """Coste de cada efecto de postproceso sobre un frame de 1280x720"""
+    import numpy as np
+    import pygame
+    from src.engine import GameEngine
+    from src.render.postfx import PostEffects
+
+    print("\nEfectos de postproceso a 1280x720")
+    results = {}
+    with GameEngine(headless=True) as engine:
+        engine.initialize()
+        screen = engine.screen
+        screen.fill((90, 160, 220))
+        cases = (("tinte", "world", lambda effects: effects.tint((255, 0, 0), 0.3)),
+                 ("destello", "world", lambda effects: effects.flash((255, 255, 255), 0.6, 1e9)),
+                 ("desaturado", "world", lambda effects: effects.desaturate(0.5)),
+                 ("fundido", "screen", lambda effects: effects.fade_out(0.0)))
+        for name, stage, start in cases:
+            effects = PostEffects()
+            start(effects)
+            begin = time.perf_counter()
+            for _ in range(frames):
+                effects.apply(screen, stage)
+            results[name] = (time.perf_counter() - begin) * 1000.0 / frames
+            print(f"  {name:<11} {results[name]:6.2f} ms/frame")
+
+        # Referencia: el mismo tinte con pixels3d (un canal por byte) y un búfer uint16
+        pixels = pygame.surfarray.pixels3d(screen)
+        work = np.empty(pixels.shape, dtype=np.uint16)
+        color = np.array((255, 0, 0), dtype=np.uint16) * 77
+        begin = time.perf_counter()
+        for _ in range(frames):
+            np.multiply(pixels, 256 - 77, out=work, dtype=np.uint16)
+            np.add(work, color, out=work)
+            np.right_shift(work, 8, out=work)
+            np.copyto(pixels, work, casting="unsafe")
+        del pixels
+        naive_ms = (time.perf_counter() - begin) * 1000.0 / frames
+    print(f"  Tinte con pixels3d: {naive_ms:6.2f} ms/frame ({naive_ms / results['tinte']:.1f}x más lento)")
+    return results
+
+
+def benchmark_tilemap(frames: int = 200):
+    """Coste de dibujar el mapa de tiles según el tamaño del nivel"""
+    import numpy as np
+    from src.engine import GameEngine
+    from src.render.tilemap import TileMap, make_tiles
+    from src.config import TILE_SIZE
+
+    print("\nMapa de tiles: bloques visibles en caché vs todos los tiles en cada frame")
+    results = {}
+    with GameEngine(headless=True) as engine:
+        engine.initialize()
+        screen = engine.screen
+        viewport = screen.get_rect()
+        tiles = make_tiles([(100, 150, 100), (120, 90, 60), (90, 90, 110)])
+        rng = np.random.default_rng(1)
+        for columns in (100, 1000, 10000):
+            rows = 720 // TILE_SIZE + 1
+            tilemap = TileMap(columns, rows, tiles)
+            tilemap.fill(0, rows - 3, columns, 3, 2)
+            tilemap.fill(0, rows - 4, columns, 1, 1)
+            # Plataformas sueltas por todo el nivel
+            for x in range(0, columns - 8, 6):
+                tilemap.fill(x, int(rng.integers(4, rows - 6)), int(rng.integers(2, 6)), 1, 3)
+            scroll = tilemap.width - viewport.width
+
+            start = time.perf_counter()
+            for i in range(frames):
+                screen.fill((0, 0, 0))
+                viewport.x = i * 37 % scroll
+                tilemap.draw(screen, viewport)
+            chunked_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+            # Referencia: un blit por tile del nivel en cada frame (cada frame
+            # reconstruye la lista, como un nivel hecho de entidades)
+            ys, xs = np.nonzero(tilemap.data)
+            indices = tilemap.data[ys, xs].tolist()
+            start = time.perf_counter()
+            for i in range(frames // 10):
+                screen.fill((0, 0, 0))
+                ox = i * 37 % scroll
+                screen.blits([(tiles[index], (x * TILE_SIZE - ox, y * TILE_SIZE))
+                              for index, x, y in zip(indices, xs.tolist(), ys.tolist())], doreturn=False)
+            naive_ms = (time.perf_counter() - start) * 1000.0 / (frames // 10)
+            results[columns] = (chunked_ms, naive_ms)
+            print(f"  {columns:>5} columnas ({len(indices):>6} tiles): bloques {chunked_ms:6.2f} ms/frame "
+                  f"({tilemap.builds} dibujados, {tilemap.cached_chunks} en caché) - "
+                  f"todos los tiles {naive_ms:7.2f} ms/frame")
+
+    # Nivel completo con LevelScene.set_tilemap: el mundo crece con el mapa,
+    # la capa estática no
+    from src.scenes.level import LevelScene
+    print("  Nivel con set_tilemap (el jugador recorre el mapa):")
+    for columns in (100, 5000):
+        with GameEngine(headless=True) as engine:
+            level = LevelScene(1280, 720)
+            tilemap = TileMap(columns, 23, tiles)
+            tilemap.fill(0, 20, columns, 3, 2)
+            level.set_tilemap(tilemap)
+            load_level(engine, level)
+            start = time.perf_counter()
+            engine.step(1, render=True)
+            first_ms = (time.perf_counter() - start) * 1000.0
+            start = time.perf_counter()
+            for i in range(frames):
+                level.player.set_position(i * 97 % (tilemap.width - 200), 500)
+                engine.step(1, render=True)
+            level_ms = (time.perf_counter() - start) * 1000.0 / frames
+            layer = level.static_layer
+            layer_mb = layer.builds * layer.chunk_size ** 2 * 4 / 2 ** 20
+            results[f"level_{columns}"] = (first_ms, level_ms)
+            print(f"  {columns:>5} columnas: primer frame {first_ms:7.2f} ms, {level_ms:6.2f} ms/frame - "
+                  f"capa estática {layer.builds} bloques dibujados ({layer_mb:.0f} MB)")
+    return results
+
+
+def benchmark_replay(frames: int = 100):
+    """Coste de grabar los comandos de dibujo y de reproducirlos fuera de pantalla"""
+    import os
+    import tempfile
+    import pygame
+    from src.engine import GameEngine
+    from src.scenes.level import LevelScene
+    from src.render.recorder import RenderRecording
+
+    print("\nGrabación de dibujo: dibujar vs grabar vs reproducir")
+    with GameEngine(headless=True, dirty_rects=False) as engine:
+        level = LevelScene(1280, 720)
+        populate_level(level)
+        load_level(engine, level)
+        engine.step(10, render=True)
+
+        start = time.perf_counter()
+        engine.step(frames, render=True)
+        draw_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+        engine.start_recording()
+        start = time.perf_counter()
+        engine.step(frames, render=True)
+        record_ms = (time.perf_counter() - start) * 1000.0 / frames
+        recording = engine.stop_recording()
+
+        path = os.path.join(tempfile.mkdtemp(), "replay.rec")
+        recording.save(path)
+        size_kb = os.path.getsize(path) / 1024.0
+        loaded = RenderRecording.load(path)
+        target = pygame.Surface(engine.screen.get_size()).convert()
+        start = time.perf_counter()
+        for frame in range(frames):
+            loaded.replay(target, frame)
+        replay_ms = (time.perf_counter() - start) * 1000.0 / frames
+        commands = sum(len(frame) for frame in recording.frames) / frames
+
+    print(f"  paso + dibujo       {draw_ms:6.2f} ms/frame")
+    print(f"  paso + grabación    {record_ms:6.2f} ms/frame ({commands:.0f} comandos/frame)")
+    print(f"  reproducción        {replay_ms:6.2f} ms/frame")
+    print(f"  archivo             {size_kb:8.0f} KB ({frames} frames, {len(loaded.surfaces)} superficies)")
+    return {"draw": draw_ms, "record": record_ms, "replay": replay_ms, "size_kb": size_kb}
+
+
+BENCHMARKS = {
+    "pipeline": benchmark_pipeline,
+    "render_queue": benchmark_render_queue,
+    "bitmap_font": benchmark_bitmap_font,
+    "camera": benchmark_camera,
+    "parallax": benchmark_parallax,
+    "render_scale": benchmark_render_scale,
+    "backends": benchmark_backends,
+    "particles": benchmark_particles,
+    "postfx": benchmark_postfx,
+    "tilemap": benchmark_tilemap,
+    "replay": benchmark_replay,
+}
+
+
+def main():
+    """Ejecuta los benchmarks pedidos (todos por defecto)"""
+    print("=" * 50)
+    print("BENCHMARKS DEL RAYMAN ENGINE")
+    print("=" * 50)
+
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Benchmark desconocido: {name} (disponibles: {', '.join(BENCHMARKS)})")
+            return 1
+        BENCHMARKS[name]()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,64 @@
 """Archivo principal del juego"""
 
+import time
+
+# Origen de la cronología de arranque (antes de importar pygame)
+PROCESS_START = time.perf_counter()
+
+import argparse
 import sys
 import os
 
 # Añadir directorio actual a sys.path para importaciones
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from src.utils.startup import StartupTimer
+
+startup = StartupTimer(PROCESS_START)
+
+from src.config import RENDER_BACKEND, RENDER_PRESET, RENDER_PRESETS
 from src.engine import GameEngine
-from src.scenes.level import LevelScene
+from src.render.backend import BACKENDS
+from src.utils.assets import assets
+
+startup.mark("imports")
+
+
+def parse_args():
+    """Lee los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Rayman - Fangame Engine")
+    parser.add_argument("--trace", type=int, metavar="FRAMES", default=0,
+                        help="Graba una traza Chrome trace-event de los primeros FRAMES frames")
+    parser.add_argument("--trace-file", default="rayman_trace.json",
+                        help="Archivo de salida de la traza")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="Imprime la cronología del arranque hasta el primer frame")
+    parser.add_argument("--render-preset", choices=sorted(RENDER_PRESETS), default=RENDER_PRESET,
+                        help="Tamaño de ventana y modo de escalado de la resolución interna")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default=RENDER_BACKEND,
+                        help="Backend de dibujo: pygame.Surface o Renderer/Texture de SDL2")
+    return parser.parse_args()
 
 
 def main():
     """Función principal"""
+    args = parse_args()
+    
     # Crear el motor del juego
-    game = GameEngine()
+    game = GameEngine(render_preset=args.render_preset, backend=args.backend)
+    game.startup = startup
+    game.startup_report = args.startup_report
+    if args.trace:
+        # Antes de run() para que también se tracen las cargas de recursos
+        game.start_trace(args.trace, args.trace_file)
+    
+    # Decodificar los PNG del nivel en segundo plano mientras se crea la ventana
+    from src.scenes.level import LevelScene
+    assets.preload(LevelScene.asset_files())
+    startup.mark("precarga")
     
-    # Crear y registrar escenas
-    level_scene = LevelScene(1280, 720)
-    game.register_scene("level_1", level_scene)
+    # Registrar escenas: se construyen al activarse, con la ventana ya creada
+    game.register_scene_factory("level_1", lambda: LevelScene(1280, 720))
     
     # Establecer la escena inicial
     game.set_scene("level_1")
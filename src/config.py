@@ -6,6 +6,61 @@ SCREEN_HEIGHT = 720
 FPS = 60
 GAME_TITLE = "Rayman - Fangame Engine"
 
+# Presentación: "capped" (limita a FPS), "vsync" (sincroniza con el monitor)
+# o "uncapped" (sin límite; la simulación sigue a paso fijo)
+PRESENT_MODE = "capped"
+
+# Bucle de simulación (paso fijo)
+FIXED_TIMESTEP = True
+SIMULATION_HZ = 60
+MAX_FRAME_TIME = 250  # ms, evita la "espiral de la muerte" tras un bloqueo
+
+# Trabajo diferido (cargas de recursos, cachés...) en el tiempo libre de cada frame
+DEFER_ASSET_LOADING = True
+SCHEDULER_MARGIN_MS = 2  # ms que se reservan al final del frame
+SCHEDULER_MIN_SLICE_MS = 4  # no se empieza una porción con menos tiempo libre
+
+# Simulación en un hilo mientras se dibuja el frame anterior (ver benchmark_engine.py)
+PIPELINED_RENDERING = False
+
+# Rectángulos sucios: redibujar y presentar solo lo que cambia (opcional)
+DIRTY_RECTS = False
+DIRTY_RECT_THRESHOLD = 0.5  # fracción de pantalla a partir de la cual se hace flip completo
+
+# Resolución interna: las escenas dibujan a SCREEN_WIDTH x SCREEN_HEIGHT y el
+# frame se escala a una ventana window_scale veces mayor. "integer" escala por
+# un factor entero (píxeles nítidos, bandas negras si sobra); "smooth" usa
+# smoothscale (admite cualquier factor, pero cuesta más)
+RENDER_PRESET = "nativa"
+RENDER_PRESETS = {
+    "nativa": {"window_scale": 1.0, "mode": "integer"},
+    "nitida": {"window_scale": 2.0, "mode": "integer"},
+    "suave": {"window_scale": 1.5, "mode": "smooth"},
+}
+
+# Backend de dibujo: "surface" (blits de pygame.Surface) o "texture"
+# (Renderer/Texture de SDL2, con GPU si hay driver acelerado)
+RENDER_BACKEND = "surface"
+
+# Duración del fundido de entrada al cambiar de escena (ms)
+SCENE_FADE_MS = 300
+
+# Memoria para sprites volteados/escalados/rotados ya calculados
+TRANSFORM_CACHE_BYTES = 64 * 1024 * 1024
+
+# Calidad adaptativa: recorta trabajo opcional si no se llega a FPS
+ADAPTIVE_QUALITY = True
+
+# Recolector de basura: congelar tras cargar y retrasar recolecciones completas
+GC_POLICY = True
+
+# Perfilador (F3 muestra/oculta el overlay)
+PROFILER_WINDOW = 300  # frames por ventana de estadísticas
+
+# Trazas Chrome trace-event (F5 captura TRACE_FRAMES frames)
+TRACE_FRAMES = 120
+TRACE_FILE = "rayman_trace.json"
+
 # Colores
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -25,6 +80,12 @@ PLAYER_MAX_FALL_SPEED = 20
 PLAYER_WIDTH = 80
 PLAYER_HEIGHT = 120
 TILE_SIZE = 32
+# Lado en tiles de los bloques pre-dibujados del mapa de tiles y cuántos se guardan
+TILE_CHUNK_TILES = 16
+TILE_CHUNK_CACHE = 64
+# Lado en píxeles de los bloques de la capa estática y cuántos se guardan
+STATIC_CHUNK_SIZE = 512
+STATIC_CHUNK_CACHE = 32
 
 # Controles
 JUMP_KEY = "space"
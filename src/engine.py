@@ -1,16 +1,45 @@
 """Motor principal del juego"""
 
+import os
+import time
 import pygame
 import sys
-from typing import Dict
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE, BLACK
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+from src.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE, BLACK,
+    FIXED_TIMESTEP, SIMULATION_HZ, MAX_FRAME_TIME, PROFILER_WINDOW,
+    TRACE_FRAMES, TRACE_FILE, DEFER_ASSET_LOADING, SCHEDULER_MARGIN_MS, GC_POLICY,
+    PIPELINED_RENDERING, ADAPTIVE_QUALITY, PRESENT_MODE, DIRTY_RECTS, DIRTY_RECT_THRESHOLD,
+    RENDER_PRESET, RENDER_PRESETS, RENDER_BACKEND, SCENE_FADE_MS
+)
+from src.entities.enemy import Enemy
+from src.entities.world import Collectible
+from src.render.backend import create_backend
+from src.render.dirty import DirtyRectRenderer
+from src.render.recorder import RecordingCanvas, RenderRecording
+from src.render.scaler import RenderScaler
+from src.render.text import text_cache
+from src.render.transform_cache import transform_cache
 from src.scenes.scene import Scene
+from src.utils.input import InputManager, KeyState, NO_KEYS
+from src.utils.profiler import FrameProfiler
+from src.utils.scheduler import FrameScheduler
+from src.utils.gc_policy import GCManager
+from src.utils.quality import QualityGovernor
+from src.utils.startup import StartupTimer
+from src.utils.tracing import tracer
 
 
 class GameEngine:
     """Motor principal del juego Rayman"""
     
-    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT, title: str = GAME_TITLE):
+    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT, title: str = GAME_TITLE,
+                 fixed_timestep: bool = FIXED_TIMESTEP, simulation_hz: int = SIMULATION_HZ,
+                 headless: bool = False, defer_assets: bool = DEFER_ASSET_LOADING,
+                 pipelined: bool = PIPELINED_RENDERING, present_mode: str = PRESENT_MODE,
+                 dirty_rects: bool = DIRTY_RECTS, render_preset: str = RENDER_PRESET,
+                 window_size: Optional[Tuple[int, int]] = None, backend: str = RENDER_BACKEND):
         """
         Inicializa el motor del juego
         
@@ -18,36 +47,193 @@ class GameEngine:
             width: Ancho de la pantalla
             height: Alto de la pantalla
             title: Título de la ventana
+            fixed_timestep: Si la simulación avanza en pasos fijos con interpolación al dibujar
+            simulation_hz: Pasos de simulación por segundo en modo de paso fijo
+            headless: Sin ventana real (driver de vídeo dummy), para CI y bots
+            defer_assets: Si las escenas cargan sus recursos como trabajo diferido
+            pipelined: Si la simulación del frame N+1 corre en un hilo mientras
+                se dibuja el frame N a partir de una instantánea
+            present_mode: "capped", "vsync" o "uncapped"
+            dirty_rects: Si solo se redibujan y presentan las regiones que cambian
+            render_preset: Preset de RENDER_PRESETS (tamaño de ventana y modo de escalado)
+            window_size: Tamaño de la ventana (por defecto, el del preset); las
+                escenas siguen dibujando a width x height
+            backend: Backend de dibujo ("surface" o "texture")
         """
         self.width = width
         self.height = height
         self.title = title
         self.clock = pygame.time.Clock()
         self.running = True
+        # screen: donde dibujan las escenas (la ventana, la superficie a
+        # resolución interna o el destino del backend de texturas); window: la ventana
         self.screen = None
+        self.window = None
+        # Variables de entorno de SDL que cambia el modo headless (se restauran al cerrar)
+        self._saved_env: Dict[str, Optional[str]] = {}
         self.scenes: Dict[str, Scene] = {}
+        # Escenas que se construyen al activarse por primera vez
+        self.scene_factories: Dict[str, Callable[[], Scene]] = {}
         self.current_scene_name = None
         self.current_scene = None
         self.fps = FPS
         self.dt = 0
+        
+        # Paso fijo: la simulación avanza en pasos de step_ms y el dibujo
+        # interpola entre el estado anterior y el actual con alpha
+        self.fixed_timestep = fixed_timestep
+        self.step_ms = 1000.0 / simulation_hz
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        
+        self.headless = headless
+        self.frame_count = 0
+        
+        # Entrada de baja latencia y modo de presentación
+        self.input = InputManager()
+        self.present_mode = present_mode
+        self.fps_cap = self.fps if present_mode == "capped" else 0
+        # Duración de la última presentación (con vsync incluye la espera al refresco)
+        self.present_ms = 0.0
+        self.profiler = FrameProfiler(window=PROFILER_WINDOW)
+        preset = RENDER_PRESETS[render_preset]
+        if window_size is None:
+            window_size = (round(width * preset["window_scale"]), round(height * preset["window_scale"]))
+        self.scaler = RenderScaler((width, height), window_size, preset["mode"])
+        self.backend = create_backend(backend, self.scaler)
+        # Los rectángulos sucios necesitan un backend que presente por regiones
+        self.dirty_renderer: Optional[DirtyRectRenderer] = (
+            DirtyRectRenderer((width, height), DIRTY_RECT_THRESHOLD)
+            if dirty_rects and self.backend.partial_updates else None)
+        
+        # Trabajo diferido que se ejecuta con el tiempo sobrante de cada frame
+        self.scheduler = FrameScheduler()
+        self.defer_assets = defer_assets
+        self.frame_budget_ms = 1000.0 / self.fps
+        
+        self.gc_manager = GCManager(enabled=GC_POLICY)
+        self.gc_manager.profiler = self.profiler
+        
+        self.quality = QualityGovernor(target_fps=self.fps, enabled=ADAPTIVE_QUALITY)
+        
+        # Modo en tubería: instantánea inmutable que dibuja el hilo principal
+        self.pipelined = pipelined
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._render_snapshot: Optional[Scene] = None
+        
+        # Grabación de los comandos de dibujo (start_recording / stop_recording)
+        self.recorder: Optional[RecordingCanvas] = None
+        self._snapshot_alpha = 1.0
+        
+        # Cronología del arranque hasta el primer frame (main.py --startup-report)
+        self.startup: Optional[StartupTimer] = StartupTimer()
+        self.startup_report = False
     
     def initialize(self):
         """Inicializa Pygame y la pantalla"""
-        pygame.init()
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        pygame.display.set_caption(self.title)
-        print(f"[ENGINE] Inicializado: {self.width}x{self.height} - {self.title}")
+        if self.headless:
+            # Los drivers dummy permiten set_mode() y convert() sin pantalla ni
+            # audio; shutdown() deja las variables como estaban
+            for name in ("SDL_VIDEODRIVER", "SDL_AUDIODRIVER"):
+                self._saved_env.setdefault(name, os.environ.get(name))
+                os.environ[name] = "dummy"
+        # Solo los módulos que usa el engine (pygame.init() también arranca
+        # audio, joystick, etc.)
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = self.create_display()
+        self.window = self.backend.window
+        self.input.install_filter()
+        self.gc_manager.install()
+        self.mark_startup("display")
+        if self.scaler.active:
+            window_width, window_height = self.scaler.window_size
+            print(f"[ENGINE] Inicializado: {self.width}x{self.height} escalado a {window_width}x{window_height} "
+                  f"({self.scaler.mode}, {self.backend.name}) - {self.title}")
+        else:
+            print(f"[ENGINE] Inicializado: {self.width}x{self.height} ({self.backend.name}) - {self.title}")
+        
+        if self.current_scene:
+            self.prepare_scene(self.current_scene)
+        elif self.current_scene_name:
+            # La escena inicial se construye ya con la ventana creada
+            self.set_scene(self.current_scene_name)
+    
+    def mark_startup(self, phase: str):
+        """
+        Cierra una fase del arranque; tras el primer frame y los recursos
+        iniciales se imprime el informe (si se pidió) y se deja de medir
+        
+        Args:
+            phase: Nombre de la fase
+        """
+        startup = self.startup
+        if startup is None:
+            return
+        startup.mark(phase)
+        done = {name for name, _ in startup.marks}
+        if "primer frame" in done and "recursos" in done:
+            if self.startup_report:
+                startup.report()
+            self.startup = None
+    
+    def create_display(self):
+        """Crea la ventana con el backend de dibujo según el modo de presentación"""
+        return self.backend.open(self.title, vsync=self.present_mode == "vsync" and not self.headless)
+    
+    def prepare_scene(self, scene: Scene):
+        """Carga (o planifica la carga de) los recursos de una escena"""
+        # Las transiciones son buen momento para recolectar lo anterior
+        self.gc_manager.begin_loading()
+        if self.defer_assets:
+            loads = scene.schedule_assets(self.scheduler) or []
+            # El arranque y el GC esperan a que terminen todas las cargas
+            # (aunque alguna espere a una decodificación)
+            self.scheduler.schedule(lambda: self.mark_startup("recursos"), name="startup", priority=99,
+                                    after=loads)
+            self.scheduler.schedule(self.gc_manager.settle, name="gc.settle", priority=100, after=loads)
+        else:
+            scene.load_assets()
+            self.mark_startup("recursos")
+            self.gc_manager.settle()
     
     def register_scene(self, name: str, scene: Scene):
         """Registra una escena"""
         self.scenes[name] = scene
+        scene.profiler = self.profiler
+        scene.quality = self.quality
         print(f"[ENGINE] Escena registrada: {name}")
     
+    def register_scene_factory(self, name: str, factory: Callable[[], Scene]):
+        """
+        Registra una escena que se construye al activarse por primera vez
+        
+        Args:
+            name: Nombre de la escena
+            factory: Función sin argumentos que crea la escena
+        """
+        self.scene_factories[name] = factory
+    
     def set_scene(self, name: str):
         """Cambia a una escena específica"""
+        if name not in self.scenes and name in self.scene_factories:
+            if self.screen is None:
+                # Se construirá en initialize(), después de crear la ventana
+                self.current_scene_name = name
+                return
+            self.register_scene(name, self.scene_factories.pop(name)())
+            self.mark_startup("escena")
+        
         if name in self.scenes:
+            previous = self.current_scene
             self.current_scene_name = name
             self.current_scene = self.scenes[name]
+            if previous is not None and previous is not self.current_scene:
+                self.current_scene.post_effects.fade_in(SCENE_FADE_MS)
+            if self.dirty_renderer:
+                self.dirty_renderer.invalidate()
+            if self.screen:
+                self.prepare_scene(self.current_scene)
             print(f"[ENGINE] Escena activa: {name}")
         else:
             print(f"[ENGINE] ERROR: Escena '{name}' no encontrada")
@@ -55,41 +241,404 @@ class GameEngine:
     def handle_events(self):
         """Maneja los eventos"""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            self.input.observe_event(event)
+            if event.type == pygame.QUIT or event.type == pygame.WINDOWCLOSE:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                self.start_trace()
+            elif self.dirty_renderer and event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE,
+                                                        pygame.WINDOWFOCUSGAINED):
+                # El contenido de la ventana puede haberse perdido
+                self.dirty_renderer.invalidate()
             
             if self.current_scene:
                 self.current_scene.handle_input(event)
+        self.input.end_events()
+    
+    def start_trace(self, frames: int = TRACE_FRAMES, path: str = TRACE_FILE):
+        """
+        Captura una traza de los próximos frames (Perfetto / chrome://tracing)
+        
+        Args:
+            frames: Frames a capturar (0 = hasta tracer.stop())
+            path: Archivo JSON de salida
+        """
+        if not tracer.capturing:
+            tracer.start(frames, path)
+    
+    def start_recording(self):
+        """
+        Graba los comandos de dibujo de los próximos frames en lugar de dibujarlos
+        
+        Mientras se graba no se presenta nada: cada draw() anota el frame en
+        una RenderRecording que se puede reproducir después sobre cualquier
+        superficie, guardar o comparar con la de otra versión.
+        """
+        if self.recorder is None:
+            self.recorder = RecordingCanvas((self.width, self.height))
+            print("[RENDER] Grabando comandos de dibujo")
+    
+    def stop_recording(self) -> Optional[RenderRecording]:
+        """
+        Termina la grabación
+        
+        Returns:
+            Frames grabados (None si no se estaba grabando)
+        """
+        recorder = self.recorder
+        if recorder is None:
+            return None
+        self.recorder = None
+        # La pantalla no se ha tocado mientras se grababa
+        if self.dirty_renderer:
+            self.dirty_renderer.invalidate()
+        recording = recorder.recording
+        print(f"[RENDER] Grabación terminada: {len(recording.frames)} frames, "
+              f"{len(recording.surfaces)} superficies")
+        return recording
+    
+    def record_frame(self, scene: Optional[Scene], alpha: float):
+        """Anota un frame completo en la grabación (sin rectángulos sucios ni overlay)"""
+        canvas = self.recorder
+        with self.profiler.section("record"):
+            canvas.begin_frame()
+            canvas.fill(BLACK)
+            if scene is None:
+                return
+            if self.fixed_timestep:
+                scene.begin_interpolation(alpha)
+            try:
+                scene.draw(canvas)
+            finally:
+                if self.fixed_timestep:
+                    scene.end_interpolation()
+            scene.post_effects.apply(canvas, "screen")
+    
+    def run_deferred(self, frame_start: float):
+        """
+        Ejecuta trabajo diferido con el tiempo que queda del frame
+        
+        Args:
+            frame_start: perf_counter() al inicio del frame
+        """
+        elapsed_ms = (time.perf_counter() - frame_start) * 1000.0
+        budget_ms = self.frame_budget_ms - elapsed_ms - SCHEDULER_MARGIN_MS
+        with self.profiler.section("scheduler"):
+            self.scheduler.run(budget_ms)
     
     def update(self):
         """Actualiza la lógica del juego"""
-        if self.current_scene and self.current_scene.active:
-            self.current_scene.update(self.dt)
+        scene = self.current_scene
+        if scene is None:
+            return
+        if scene.active:
+            scene.update(self.dt)
+        # Los efectos avanzan aquí para todas las escenas (p. ej. el fundido de set_scene)
+        scene.post_effects.update(self.dt)
     
-    def draw(self):
-        """Dibuja la pantalla"""
-        self.screen.fill(BLACK)
+    def update_fixed(self, frame_time: float, track_input: bool = False):
+        """
+        Avanza la simulación en pasos fijos consumiendo el tiempo acumulado
         
+        Args:
+            frame_time: Tiempo real transcurrido desde el frame anterior en milisegundos
+            track_input: Si se vuelve a leer la entrada justo antes de cada paso
+        """
+        # Limitar el tiempo de un frame muy largo (carga, ventana arrastrada...)
+        self.accumulator += min(frame_time, MAX_FRAME_TIME)
+        
+        while self.accumulator >= self.step_ms:
+            if track_input:
+                self.input.sample()
+            self.simulate_step()
+            if track_input:
+                self.input.consume()
+            self.accumulator -= self.step_ms
+        
+        self.alpha = self.accumulator / self.step_ms
+    
+    def simulate_step(self):
+        """Ejecuta un único paso fijo de simulación"""
         if self.current_scene:
-            self.current_scene.draw(self.screen)
+            self.current_scene.store_previous_positions()
+        self.dt = self.step_ms
+        self.update()
+    
+    def advance(self, frame_time: float, track_input: bool = False):
+        """
+        Avanza la simulación el tiempo real de un frame
+        
+        Args:
+            frame_time: Milisegundos transcurridos desde el frame anterior
+            track_input: Si se lee la entrada justo antes de simular (solo en
+                el hilo principal: SDL no admite bombear eventos desde otro)
+        """
+        if self.fixed_timestep:
+            self.update_fixed(frame_time, track_input)
+        else:
+            if track_input:
+                self.input.sample()
+            self.dt = frame_time
+            self.update()
+            if track_input:
+                self.input.consume()
+    
+    def draw(self, scene: Optional[Scene] = None, alpha: Optional[float] = None):
+        """
+        Dibuja la pantalla
+        
+        Args:
+            scene: Escena a dibujar (por defecto la actual)
+            alpha: Fracción de interpolación (por defecto la del último paso)
+        """
+        if scene is None:
+            scene = self.current_scene
+        if alpha is None:
+            alpha = self.alpha
+        
+        if self.recorder is not None:
+            self.record_frame(scene, alpha)
+            return
+        
+        profiler = self.profiler
+        renderer = self.dirty_renderer
+        with profiler.section("draw"):
+            if scene is None:
+                self.screen.fill(BLACK)
+                if renderer:
+                    renderer.full_frame()
+            else:
+                if renderer is None:
+                    self.screen.fill(BLACK)
+                if self.fixed_timestep:
+                    scene.begin_interpolation(alpha)
+                try:
+                    if renderer:
+                        scene.draw_dirty(self.screen, renderer)
+                    else:
+                        scene.draw(self.screen)
+                finally:
+                    if self.fixed_timestep:
+                        scene.end_interpolation()
+        
+        if scene is not None:
+            with profiler.section("postfx"):
+                scene.post_effects.apply(self.screen, "screen")
+        
+        with profiler.section("overlay"):
+            overlay_rect = profiler.draw_overlay(self.screen)
+        
+        with profiler.section("scale"):
+            self.backend.scale()
         
-        pygame.display.flip()
+        present_start = time.perf_counter()
+        with profiler.section("flip"):
+            if renderer:
+                renderer.mark(overlay_rect)
+                # Escalado, las regiones no coinciden con las de la ventana
+                renderer.present(update_rects=not self.scaler.active)
+            else:
+                self.backend.present()
+        self.present_ms = (time.perf_counter() - present_start) * 1000.0
+        
+        latency = self.input.presented()
+        if latency is not None and profiler.enabled:
+            profiler.add("input_latency", latency)
     
     def run(self):
         """Bucle principal del juego"""
         self.initialize()
         
+        profiler = self.profiler
         while self.running:
-            self.dt = self.clock.tick(self.fps)
+            frame_time = self.clock.tick(self.fps_cap)
+            frame_start = time.perf_counter()
+            self.frame_count += 1
+            self.present_ms = 0.0
+            profiler.begin_frame()
+            tracer.begin_frame()
             
-            self.handle_events()
-            self.update()
-            self.draw()
+            with profiler.section("events"):
+                self.handle_events()
+            if self.pipelined:
+                self.input.sample()
+                self.pipelined_frame(lambda: self.advance(frame_time))
+                self.input.consume()
+            else:
+                with profiler.section("update"):
+                    self.advance(frame_time, track_input=True)
+                self.draw()
+            if self.frame_count == 1:
+                self.mark_startup("primer frame")
+            # El trabajo diferido rellena el presupuesto a propósito: no cuenta
+            self.quality.record_frame(self.frame_work_ms(frame_start))
+            self.run_deferred(frame_start)
+            
+            profiler.end_frame()
+            tracer.end_frame()
+        
+        if self.headless:
+            self.shutdown()
+        else:
+            self.quit()
+    
+    def frame_work_ms(self, frame_start: float) -> float:
+        """
+        Tiempo de trabajo del frame para el gobernador de calidad
+        
+        Con vsync, flip() espera al refresco de la pantalla: esa espera no es
+        trabajo y no se cuenta (si no, el frame siempre llenaría el presupuesto).
+        
+        Args:
+            frame_start: perf_counter() al inicio del frame
+        """
+        elapsed_ms = (time.perf_counter() - frame_start) * 1000.0
+        if self.present_mode == "vsync":
+            elapsed_ms -= self.present_ms
+        return elapsed_ms
+    
+    def step(self, n_frames: int = 1, inputs: Optional[Sequence[Iterable[int]]] = None,
+             render: bool = False) -> int:
+        """
+        Avanza la simulación n frames sin límite de FPS (modo headless/tests)
         
-        self.quit()
+        Cada frame es un paso fijo de step_ms. La entrada se inyecta en la
+        escena en lugar de leer el teclado real.
+        
+        Args:
+            n_frames: Número de frames a simular
+            inputs: Teclas (pygame.K_*) pulsadas en cada frame; los frames
+                sin entrada se simulan sin teclas pulsadas
+            render: Si también se dibuja cada frame
+        
+        Returns:
+            Número total de frames simulados por el engine
+        """
+        if self.screen is None:
+            self.initialize()
+        
+        scene = self.current_scene
+        profiler = self.profiler
+        for i in range(n_frames):
+            if not self.running:
+                break
+            frame_start = time.perf_counter()
+            profiler.begin_frame()
+            tracer.begin_frame()
+            
+            if scene:
+                if inputs is not None and i < len(inputs):
+                    scene.key_state = KeyState(inputs[i])
+                else:
+                    scene.key_state = NO_KEYS
+            
+            with profiler.section("events"):
+                self.handle_events()
+            if render and self.pipelined:
+                self.pipelined_frame(self.simulate_step)
+            else:
+                with profiler.section("update"):
+                    self.simulate_step()
+                self.alpha = 1.0
+                if render:
+                    self.draw()
+            self.run_deferred(frame_start)
+            self.frame_count += 1
+            if render and self.frame_count == 1:
+                self.mark_startup("primer frame")
+            profiler.end_frame()
+            tracer.end_frame()
+        
+        if scene:
+            scene.key_state = None
+        return self.frame_count
+    
+    def take_snapshot(self):
+        """Copia el estado dibujable de la escena actual para el siguiente frame"""
+        scene = self.current_scene
+        self._render_snapshot = scene.snapshot() if scene else None
+        self._snapshot_alpha = self.alpha
+    
+    def pipelined_frame(self, simulate: Callable[[], None]):
+        """
+        Simula el siguiente frame en un hilo mientras se dibuja el actual
+        
+        Los eventos ya se han procesado en el hilo principal y el trabajo
+        diferido se ejecuta después, así que ambos hilos nunca tocan la escena
+        a la vez: el hilo de simulación trabaja sobre la escena y el principal
+        solo sobre la instantánea.
+        
+        Args:
+            simulate: Función que avanza la simulación un frame
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simulation")
+        snapshot = self._render_snapshot
+        if snapshot is None or snapshot.source is not self.current_scene:
+            self.take_snapshot()
+        
+        profiler = self.profiler
+        
+        def simulate_in_worker():
+            with profiler.section("update"):
+                simulate()
+        
+        future = self._executor.submit(simulate_in_worker)
+        try:
+            self.draw(self._render_snapshot, self._snapshot_alpha)
+        finally:
+            future.result()
+        
+        with profiler.section("snapshot"):
+            self.take_snapshot()
+    
+    def shutdown(self):
+        """Libera Pygame sin terminar el proceso"""
+        self.running = False
+        latency = self.input.report()
+        if latency["count"]:
+            print(f"[INPUT] Latencia entrada-pantalla: p50 {latency['p50']:.1f} ms, "
+                  f"p95 {latency['p95']:.1f} ms, máx {latency['max']:.1f} ms")
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._render_snapshot = None
+        tracer.stop()
+        self.gc_manager.print_report()
+        self.gc_manager.uninstall()
+        transforms = transform_cache.stats()
+        if transforms["misses"]:
+            print(f"[RENDER] Caché de transformaciones: {transforms['hits']} aciertos, "
+                  f"{transforms['misses']} fallos, {transforms['evictions']} descartes")
+        transform_cache.clear()
+        # Las fuentes dejan de ser válidas con pygame.quit() y las imágenes
+        # compartidas están convertidas para esta pantalla
+        text_cache.clear()
+        Enemy.clear_images()
+        Collectible.clear_image()
+        self.backend.close()
+        pygame.quit()
+        for name, previous in self._saved_env.items():
+            if previous is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = previous
+        self._saved_env.clear()
+        self.screen = None
+        self.window = None
+        print("[ENGINE] Juego finalizado")
     
     def quit(self):
         """Sale del juego"""
-        pygame.quit()
+        self.shutdown()
         sys.exit()
-        print("[ENGINE] Juego finalizado")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if self.screen is not None:
+            self.shutdown()
+        return False
@@ -2,12 +2,21 @@
 
 import pygame
 from src.entities.entity import Entity
+from src.config import SIMULATION_HZ
 from typing import Optional
 
+# Las velocidades de los enemigos van en píxeles por paso de simulación: el
+# movimiento se escala con dt para que no dependa de cada cuántos pasos se
+# actualicen (p. ej. los de fuera de pantalla con menos calidad)
+STEP_MS = 1000.0 / SIMULATION_HZ
+
 
 class Enemy(Entity):
     """Clase base para enemigos"""
 
+    # Imágenes ya dibujadas, por clase y aspecto (tamaño, dirección...)
+    _images = {}
+
     def __init__(self, x: float, y: float, width: int, height: int, health: int = 1):
         super().__init__(x, y, width, height)
         self.health = health
@@ -27,8 +36,9 @@ class Enemy(Entity):
         if not self.active:
             return
         # Movimiento por defecto (override en subclases)
-        self.x += self.velocity_x
-        self.y += self.velocity_y
+        steps = dt / STEP_MS
+        self.x += self.velocity_x * steps
+        self.y += self.velocity_y * steps
         self.update_rect()
 
     def draw(self, surface: pygame.Surface):
@@ -37,6 +47,37 @@ class Enemy(Entity):
             return
         pygame.draw.rect(surface, (180, 30, 30), self.rect)
 
+    def image_key(self) -> tuple:
+        """Clave de la imagen del enemigo: lo que cambia su aspecto"""
+        return (type(self), self.width, self.height)
+
+    def render_image(self) -> pygame.Surface:
+        """Dibuja la imagen del enemigo (igual que draw(), en coordenadas locales)"""
+        image = pygame.Surface((self.width, self.height))
+        image.fill((180, 30, 30))
+        return image
+
+    def get_image(self) -> pygame.Surface:
+        """Obtiene la imagen del enemigo, dibujándola solo la primera vez"""
+        key = self.image_key()
+        image = Enemy._images.get(key)
+        if image is None:
+            image = self.render_image()
+            if pygame.display.get_surface() is not None:
+                image = image.convert()
+            Enemy._images[key] = image
+        return image
+
+    @staticmethod
+    def clear_images():
+        """Descarta las imágenes dibujadas (convertidas para la pantalla actual)"""
+        Enemy._images.clear()
+
+    def submit(self, queue):
+        """Encola la imagen cacheada en lugar de dibujar primitivas"""
+        if self.active:
+            queue.submit(self.get_image(), (self.x, self.y), self.layer_index)
+
 
 class SimpleEnemy(Enemy):
     """Enemigo simple que patrulla horizontalmente"""
@@ -53,10 +94,11 @@ class SimpleEnemy(Enemy):
         if not self.active:
             return
         # Patrullar
-        self.x += self.speed * self.direction
+        distance = self.speed * dt / STEP_MS
+        self.x += distance * self.direction
         if abs(self.x - self.start_x) > self.patrol_range:
             self.direction *= -1
-            self.x += self.speed * self.direction
+            self.x += distance * self.direction
         self.update_rect()
 
     def draw(self, surface: pygame.Surface):
@@ -67,3 +109,15 @@ class SimpleEnemy(Enemy):
         # Ojo
         eye_x = int(self.x + (self.width * 0.7) if self.direction > 0 else self.x + (self.width * 0.3))
         pygame.draw.circle(surface, (255, 255, 255), (eye_x, int(self.y + self.height * 0.3)), 3)
+
+    def image_key(self) -> tuple:
+        """El ojo cambia de lado según la dirección"""
+        return (type(self), self.width, self.height, self.direction > 0)
+
+    def render_image(self) -> pygame.Surface:
+        """Cuerpo y ojo, como en draw()"""
+        image = pygame.Surface((self.width, self.height))
+        image.fill((200, 40, 40))
+        eye_x = int(self.width * 0.7) if self.direction > 0 else int(self.width * 0.3)
+        pygame.draw.circle(image, (255, 255, 255), (eye_x, int(self.height * 0.3)), 3)
+        return image
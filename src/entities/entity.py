@@ -1,12 +1,26 @@
 """Entidad base del engine"""
 
+import itertools
 import pygame
 from abc import ABC, abstractmethod
+from typing import Tuple
+from src.render.layers import LAYER_INDEX
+
+
+# Identificadores estables (las instantáneas conservan el de su original)
+_entity_ids = itertools.count()
 
 
 class Entity(ABC):
     """Clase base para todas las entidades del juego"""
     
+    # Las entidades estáticas no cambian tras crearse (plataformas, paredes...)
+    static = False
+    # Capa de dibujo (ver RENDER_LAYERS) y profundidad dentro de ella (las
+    # menores se dibujan antes)
+    render_layer = "actors"
+    depth = 0
+    
     def __init__(self, x: float, y: float, width: int, height: int):
         """
         Inicializa una entidad
@@ -22,9 +36,13 @@ class Entity(ABC):
         self.width = width
         self.height = height
         self.rect = pygame.Rect(x, y, width, height)
+        # Posición al inicio del último paso de simulación (para interpolar)
+        self.prev_x = x
+        self.prev_y = y
         self.velocity_x = 0
         self.velocity_y = 0
         self.active = True
+        self.entity_id = next(_entity_ids)
     
     @abstractmethod
     def update(self, dt: float):
@@ -36,6 +54,23 @@ class Entity(ABC):
         """Dibuja la entidad"""
         pass
     
+    def submit(self, queue):
+        """
+        Envía el dibujo de la entidad a la cola de dibujo
+        
+        Por defecto encola draw() como dibujo directo; las entidades que tienen
+        imagen la encolan para que se vuelque con un solo blits() por capa.
+        
+        Args:
+            queue: RenderQueue de la escena
+        """
+        queue.submit_draw(self.draw, self.layer_index)
+    
+    @property
+    def layer_index(self) -> int:
+        """Posición de la capa de dibujo en la cola (ver RENDER_LAYERS)"""
+        return LAYER_INDEX[self.render_layer]
+    
     def update_rect(self):
         """Actualiza la posición del rectángulo"""
         self.rect.x = self.x
@@ -45,12 +80,48 @@ class Entity(ABC):
         """Obtiene el rectángulo de colisión"""
         return self.rect
     
+    def get_draw_rect(self) -> pygame.Rect:
+        """Obtiene la región de pantalla que ocupa el dibujo de la entidad"""
+        return self.rect.copy()
+    
     def set_position(self, x: float, y: float):
         """Establece la posición de la entidad"""
         self.x = x
         self.y = y
+        # Un teletransporte no se interpola
+        self.prev_x = x
+        self.prev_y = y
         self.update_rect()
     
+    def snapshot(self) -> "Entity":
+        """
+        Copia el estado de la entidad para dibujarla mientras se simula otro frame
+        
+        Es una copia superficial: los sprites se comparten, pero la posición y
+        el rectángulo son propios. Las entidades estáticas no se copian.
+        """
+        if self.static:
+            return self
+        snap = object.__new__(type(self))
+        snap.__dict__.update(self.__dict__)
+        snap.rect = self.rect.copy()
+        return snap
+    
+    def store_previous_position(self):
+        """Guarda la posición actual antes de un paso de simulación"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
+    def get_interpolated_position(self, alpha: float) -> Tuple[float, float]:
+        """
+        Obtiene la posición interpolada entre el paso anterior y el actual
+        
+        Args:
+            alpha: Fracción del paso transcurrida (0 = anterior, 1 = actual)
+        """
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+    
     def move(self, dx: float, dy: float):
         """Mueve la entidad"""
         self.x += dx
@@ -2,31 +2,28 @@
 
 import pygame
 import os
-import sys
 from src.entities.entity import Entity
 from src.config import (
     PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_SPEED, PLAYER_JUMP_POWER,
     PLAYER_MAX_FALL_SPEED, GRAVITY, WHITE, YELLOW, SCREEN_WIDTH, SCREEN_HEIGHT
 )
 from src.utils.collision import CollisionManager
-
-
-def get_base_path():
-    """Obtiene la ruta base de la aplicacion (compatible con PyInstaller)"""
-    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-        # Ejecutable PyInstaller - usa MEIPASS
-        return sys._MEIPASS
-    elif getattr(sys, 'frozen', False):
-        # Ejecutable PyInstaller sin MEIPASS
-        return os.path.dirname(sys.executable)
-    else:
-        # Ejecucion desde script
-        return os.getcwd()
+from src.utils.scheduler import run_now
+from src.utils.tracing import traced
+from src.utils.assets import assets, get_base_path
+from src.render.postfx import tint_surface
+from src.render.transform_cache import transform_cache
 
 
 class Player(Entity):
     """Clase del jugador Rayman"""
     
+    SPRITE_PATH = os.path.join("assets", "sprites", "Rayman", "rayman_a1.png")
+    # Por delante de enemigos y coleccionables
+    depth = 10
+    # Cuánto se aclara el sprite en el parpadeo de invencibilidad (0 a 1)
+    BLINK_TINT = 0.6
+    
     def __init__(self, x: float, y: float):
         """Inicializa al jugador"""
         super().__init__(x, y, PLAYER_WIDTH, PLAYER_HEIGHT)
@@ -41,6 +38,8 @@ class Player(Entity):
         self.health = self.max_health
         self.spawn_x = x
         self.spawn_y = y
+        # Altura a partir de la cual se considera que ha caído del nivel
+        self.fall_limit = 800
 
         # Invencibilidad temporal tras recibir daño (ms)
         self.invincible = False
@@ -57,46 +56,63 @@ class Player(Entity):
         self.sprites = None
         self.has_sprites = False
         self.sprites_loaded = False
+        # El engine puede cargar los sprites como trabajo diferido
+        self.defer_sprite_loading = False
     
+    @traced("Player.load_sprites", "assets")
     def load_sprites(self):
         """Carga la imagen completa de Rayman desde rayman_a1.png"""
+        run_now(self.load_sprites_steps())
+    
+    def load_sprites_steps(self):
+        """
+        Carga los sprites por porciones (generador para el FrameScheduler)
+        
+        Cede mientras se decodifica la imagen, tras convertirla y tras
+        prepararla con transparencia; el sprite aclarado es la última porción.
+        """
         if self.sprites_loaded:
             return
         
-        base_path = get_base_path()
-        sprite_path = os.path.join(base_path, "assets/sprites/Rayman")
-        
         self.sprites = {
             "idle": None,
             "run": [],
             "jump": None,
             "fall": None,
-            "dead": None
+            "dead": None,
+            "hurt": None
         }
         
         self.has_sprites = False
         
         try:
             # Cargar rayman_a1.png como imagen completa
-            sprite_full_path = os.path.join(sprite_path, "rayman_a1.png")
+            sprite_full_path = os.path.join(get_base_path(), self.SPRITE_PATH)
             if os.path.exists(sprite_full_path):
                 try:
-                    # Cargar imagen
-                    img = pygame.image.load(sprite_full_path).convert()
+                    # Decodificar en segundo plano (ya decodificada si se precargó)
+                    yield from assets.wait(sprite_full_path)
+                    img = assets.load(sprite_full_path).convert()
+                    yield
                     
                     # Obtener color del fondo (esquina superior izquierda)
                     background_color = img.get_at((0, 0))
                     img.set_colorkey(background_color)
                     img = img.convert_alpha()
+                    yield
                     
                     # NO escalar, usar tamaño original
                     print(f"Imagen cargada: {img.get_width()}x{img.get_height()} píxeles")
                     
+                    # Versión aclarada para el parpadeo de invencibilidad
+                    hurt = tint_surface(img, WHITE, self.BLINK_TINT)
+                    
                     # Usar la misma imagen para todos los estados
                     self.sprites["idle"] = img
                     self.sprites["jump"] = img
                     self.sprites["fall"] = img
                     self.sprites["run"] = [img]
+                    self.sprites["hurt"] = hurt
                     self.has_sprites = True
                     
                     # Actualizar el tamaño del jugador al tamaño de la imagen
@@ -119,6 +135,8 @@ class Player(Entity):
             import traceback
             traceback.print_exc()
             self.has_sprites = False
+        
+        self.sprites_loaded = True
     
     def get_current_sprite(self):
         """Retorna el sprite actual según el estado"""
@@ -128,8 +146,8 @@ class Player(Entity):
         try:
             # Determinar animación
             if self.invincible and int(self.invincible_timer / 100) % 2 == 0:
-                # Parpadeo de invencibilidad
-                return None
+                # Parpadeo de invencibilidad: el sprite aclarado, sin dejar de dibujarlo
+                return self.sprites["hurt"]
             
             # Usar la imagen de Rayman siempre (sin cambios de pose)
             return self.sprites["idle"]
@@ -158,9 +176,8 @@ class Player(Entity):
     def update(self, dt: float, platforms: list = None):
         """Actualiza el estado del jugador"""
         # Cargar sprites en la primera actualización (después de inicializar display)
-        if not self.sprites_loaded:
+        if not self.sprites_loaded and not self.defer_sprite_loading:
             self.load_sprites()
-            self.sprites_loaded = True
         
         # Actualizar temporizador de invencibilidad
         if self.invincible:
@@ -192,7 +209,7 @@ class Player(Entity):
                 self.velocity_y = 0
         
         # Detección de caída
-        if self.y > 800:  # Fuera de pantalla
+        if self.y > self.fall_limit:  # Fuera del nivel
             self.on_fall()
 
     def take_damage(self, amount: int = 1):
@@ -218,6 +235,7 @@ class Player(Entity):
         self.invincible = True
         self.invincible_timer = 1500
     
+    @traced("Player.handle_platform_collisions", "entity")
     def handle_platform_collisions(self, platforms):
         """Maneja colisiones con plataformas"""
         self.is_on_ground = False
@@ -252,6 +270,23 @@ class Player(Entity):
         """Se llama cuando el jugador cae fuera de pantalla"""
         self.set_position(100, 100)  # Reiniciar posición
     
+    def get_draw_rect(self) -> pygame.Rect:
+        """Región que ocupa el sprite actual (puede ser mayor que el rectángulo de colisión)"""
+        sprite = self.get_current_sprite()
+        if sprite:
+            return pygame.Rect(int(self.x), int(self.y), sprite.get_width(), sprite.get_height())
+        return self.rect.copy()
+    
+    def submit(self, queue):
+        """Encola el sprite; sin sprite (o parpadeando) se dibuja con draw()"""
+        sprite = self.get_current_sprite()
+        if sprite is None:
+            queue.submit_draw(self.draw, self.layer_index)
+            return
+        if self.direction == -1:
+            sprite = transform_cache.get(sprite, flip_x=True)
+        queue.submit(sprite, (self.x, self.y), self.layer_index)
+    
     def draw(self, surface: pygame.Surface):
         """Dibuja al jugador"""
         try:
@@ -260,7 +295,7 @@ class Player(Entity):
             if sprite:
                 # Voltear sprite según dirección
                 if self.direction == -1:
-                    sprite = pygame.transform.flip(sprite, True, False)
+                    sprite = transform_cache.get(sprite, flip_x=True)
                 
                 # Dibujar sprite
                 surface.blit(sprite, (self.x, self.y))
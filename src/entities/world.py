@@ -1,5 +1,6 @@
 """Plataformas y objetos del mundo"""
 
+import math
 import pygame
 from src.entities.entity import Entity
 from src.config import WHITE, GRAY
@@ -8,6 +9,9 @@ from src.config import WHITE, GRAY
 class Platform(Entity):
     """Plataforma estática"""
     
+    static = True
+    render_layer = "static"
+    
     def __init__(self, x: float, y: float, width: int, height: int, color=GRAY):
         """Inicializa una plataforma"""
         super().__init__(x, y, width, height)
@@ -25,6 +29,9 @@ class Platform(Entity):
 class Wall(Entity):
     """Pared / obstáculo"""
     
+    static = True
+    render_layer = "static"
+    
     def __init__(self, x: float, y: float, width: int, height: int):
         """Inicializa una pared"""
         super().__init__(x, y, width, height)
@@ -42,6 +49,9 @@ class Wall(Entity):
 class Spike(Entity):
     """Púa letal"""
     
+    static = True
+    render_layer = "static"
+    
     def __init__(self, x: float, y: float, size: int = 16):
         """Inicializa una púa"""
         super().__init__(x, y, size, size)
@@ -64,15 +74,22 @@ class Spike(Entity):
 class Collectible(Entity):
     """Objeto coleccionable (frutas, monedas, etc.)"""
     
+    # Imagen compartida por todos los coleccionables (se crea al dibujar el primero)
+    _image = None
+    
     def __init__(self, x: float, y: float, value: int = 10):
         """Inicializa un objeto coleccionable"""
         super().__init__(x, y, 16, 16)
         self.value = value
         self.collected = False
+        self.base_y = y
+        self.float_time = 0.0
     
     def update(self, dt: float):
         """Anima el objeto coleccionable"""
-        self.y += 0.5 * (1 if int(dt) % 2 == 0 else -1)  # Efecto de flotación
+        # Efecto de flotación basado en el tiempo (independiente del framerate)
+        self.float_time += dt
+        self.y = self.base_y + math.sin(self.float_time * 0.005) * 3
         self.update_rect()
     
     def draw(self, surface: pygame.Surface):
@@ -80,3 +97,25 @@ class Collectible(Entity):
         if not self.collected:
             pygame.draw.circle(surface, (255, 215, 0), (self.x + 8, self.y + 8), 6)
             pygame.draw.circle(surface, (200, 170, 0), (self.x + 8, self.y + 8), 6, 2)
+    
+    @classmethod
+    def get_image(cls) -> pygame.Surface:
+        """Obtiene la imagen del coleccionable (los mismos círculos que draw())"""
+        if cls._image is None:
+            image = pygame.Surface((16, 16), pygame.SRCALPHA)
+            pygame.draw.circle(image, (255, 215, 0), (8, 8), 6)
+            pygame.draw.circle(image, (200, 170, 0), (8, 8), 6, 2)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            cls._image = image
+        return cls._image
+    
+    @classmethod
+    def clear_image(cls):
+        """Descarta la imagen compartida (convertida para la pantalla actual)"""
+        cls._image = None
+    
+    def submit(self, queue):
+        """Encola la imagen compartida en lugar de dibujar los círculos"""
+        if not self.collected:
+            queue.submit(self.get_image(), (self.x, self.y), self.layer_index)
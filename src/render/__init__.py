@@ -0,0 +1 @@
+"""Archivo init para render"""
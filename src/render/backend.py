@@ -0,0 +1,338 @@
+"""Backends de dibujo: pygame.Surface o Renderer/Texture de SDL2"""
+
+import os
+import weakref
+import pygame
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.render.scaler import RenderScaler
+
+
+class SurfaceBackend:
+    """
+    Dibujo con blits de pygame.Surface (el backend por defecto)
+
+    Las escenas dibujan en la ventana o, si se escala, en la superficie
+    interna del RenderScaler.
+    """
+
+    name = "surface"
+    # Puede presentar solo las regiones sucias
+    partial_updates = True
+
+    def __init__(self, scaler: RenderScaler):
+        """
+        Inicializa el backend
+
+        Args:
+            scaler: Resolución interna y tamaño de la ventana
+        """
+        self.scaler = scaler
+        self.window: Optional[pygame.Surface] = None
+        self.canvas: Optional[pygame.Surface] = None
+
+    def open(self, title: str, vsync: bool = False) -> pygame.Surface:
+        """
+        Crea la ventana
+
+        Args:
+            title: Título de la ventana
+            vsync: Si se sincroniza la presentación con el monitor
+
+        Returns:
+            Superficie donde dibujan las escenas
+        """
+        size = self.scaler.window_size
+        window = None
+        if vsync:
+            try:
+                # SDL solo aplica vsync con el renderer de SCALED (u OpenGL)
+                window = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+            except pygame.error as e:
+                print(f"[ENGINE] Advertencia: vsync no disponible ({e})")
+        if window is None:
+            window = pygame.display.set_mode(size)
+        pygame.display.set_caption(title)
+        self.window = window
+        self.canvas = self.scaler.target(window)
+        return self.canvas
+
+    def scale(self):
+        """Escala el frame a la ventana si la resolución interna es otra"""
+        self.scaler.present()
+
+    def present(self):
+        """Muestra el frame entero"""
+        pygame.display.flip()
+
+    def close(self):
+        """Olvida la ventana (pygame.quit() la cierra)"""
+        self.window = None
+        self.canvas = None
+
+
+class TextureCanvas:
+    """
+    Destino de dibujo con la parte de la interfaz de pygame.Surface que usan
+    las escenas (blit, blits, fill, get_size...) sobre un Renderer de SDL2
+
+    Cada superficie se sube a una textura la primera vez que se dibuja y la
+    textura se reutiliza mientras la superficie exista: las superficies que
+    se dibujan no deben modificarse después (la capa estática y el HUD crean
+    una nueva al recomponerse). blits() no devuelve rectángulos.
+    """
+
+    def __init__(self, renderer, size: Sequence[int]):
+        """
+        Inicializa el destino
+
+        Args:
+            renderer: pygame._sdl2.video.Renderer donde se dibuja
+            size: Tamaño del destino (la resolución interna)
+        """
+        from pygame._sdl2.video import Texture
+        self._texture_class = Texture
+        self.renderer = renderer
+        self.size = (size[0], size[1])
+        # Superficie -> [textura, modo de mezcla por defecto, modo actual]
+        self._textures: "weakref.WeakKeyDictionary[pygame.Surface, List]" = weakref.WeakKeyDictionary()
+        self._blend_modes: Dict[int, int] = {}
+        self._scratch: Optional[pygame.Surface] = None
+        self._scratch_texture = None
+        self._scratch_rect: Optional[pygame.Rect] = None
+        self.uploads = 0
+
+    def get_size(self) -> Tuple[int, int]:
+        """Tamaño del destino"""
+        return self.size
+
+    def get_width(self) -> int:
+        """Ancho del destino"""
+        return self.size[0]
+
+    def get_height(self) -> int:
+        """Alto del destino"""
+        return self.size[1]
+
+    def get_rect(self, **kwargs) -> pygame.Rect:
+        """Rectángulo del destino (admite los mismos argumentos que Surface.get_rect)"""
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def texture(self, surface: pygame.Surface) -> List:
+        """
+        Obtiene la textura de una superficie (la sube la primera vez)
+
+        Returns:
+            [textura, modo de mezcla por defecto, modo actual]
+        """
+        entry = self._textures.get(surface)
+        if entry is None:
+            texture = self._texture_class.from_surface(self.renderer, surface)
+            entry = self._textures[surface] = [texture, texture.blend_mode, texture.blend_mode]
+            self.uploads += 1
+        return entry
+
+    def blend_mode(self, special_flags: int, default: int) -> int:
+        """Traduce los special_flags de blit() al modo de mezcla de SDL"""
+        mode = self._blend_modes.get(special_flags)
+        if mode is None:
+            if special_flags in (pygame.BLEND_ADD, pygame.BLEND_RGBA_ADD):
+                mode = 2   # SDL_BLENDMODE_ADD
+            elif special_flags in (pygame.BLEND_MULT, pygame.BLEND_RGBA_MULT):
+                mode = 4   # SDL_BLENDMODE_MOD
+            elif special_flags == pygame.BLEND_PREMULTIPLIED:
+                # ONE, ONE_MINUS_SRC_ALPHA; el renderer por software no lo
+                # admite y se queda en mezcla normal (bordes algo más oscuros)
+                mode = self.renderer.compose_custom_blend_mode((2, 6, 1), (2, 6, 1))
+            else:
+                return default
+            self._blend_modes[special_flags] = mode
+        return mode
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0):
+        """Dibuja una superficie como Surface.blit() (no devuelve el rectángulo)"""
+        entry = self.texture(source)
+        texture = entry[0]
+        x, y = dest[0], dest[1]
+        if area is None:
+            src = None
+            width, height = texture.width, texture.height
+        else:
+            # SDL estira la zona si se sale de la textura: se recorta antes
+            src = pygame.Rect(area).clip(0, 0, texture.width, texture.height)
+            x += src.x - area[0]
+            y += src.y - area[1]
+            width, height = src.size
+        mode = self.blend_mode(special_flags, entry[1]) if special_flags else entry[1]
+        if entry[2] != mode:
+            try:
+                texture.blend_mode = mode
+                entry[2] = mode
+            except RuntimeError:
+                # pygame._sdl2 lanza su propio error (no pygame.error)
+                self._blend_modes[special_flags] = entry[1]
+        texture.draw(src, (x, y, width, height))
+
+    def blits(self, sequence, doreturn: bool = True):
+        """Dibuja una secuencia de (superficie, destino[, zona[, flags]])"""
+        blit = self.blit
+        for item in sequence:
+            blit(*item)
+
+    def fill(self, color, rect=None, special_flags: int = 0):
+        """Rellena el destino (o una región) con un color"""
+        renderer = self.renderer
+        renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            renderer.clear()
+        else:
+            renderer.fill_rect(pygame.Rect(rect))
+
+    def draw_direct(self, draw: Callable[[pygame.Surface], None]):
+        """
+        Ejecuta un dibujo directo (pygame.draw, etc.) que necesita una Surface
+
+        Se dibuja en una superficie transparente del tamaño del destino y solo
+        la zona tocada se sube a una textura y se copia.
+        """
+        if self._scratch is None:
+            self._scratch = pygame.Surface(self.size, pygame.SRCALPHA)
+            self._scratch_texture = self._texture_class(self.renderer, self.size, streaming=True)
+            self._scratch_texture.blend_mode = 1   # SDL_BLENDMODE_BLEND
+        scratch = self._scratch
+        if self._scratch_rect:
+            scratch.fill((0, 0, 0, 0), self._scratch_rect)
+        draw(scratch)
+        rect = self._scratch_rect = scratch.get_bounding_rect()
+        if rect.width and rect.height:
+            self._scratch_texture.update(scratch.subsurface(rect), rect)
+            self._scratch_texture.draw(rect, rect)
+
+    def clear(self):
+        """Libera las texturas"""
+        self._textures.clear()
+        self._scratch = None
+        self._scratch_texture = None
+        self._scratch_rect = None
+
+
+class TextureBackend:
+    """
+    Dibujo con pygame._sdl2.video (Renderer y Texture de SDL2)
+
+    SDL agrupa las copias de texturas y usa la GPU si hay un driver
+    acelerado (si no, su renderer por software). Las escenas reciben un
+    TextureCanvas con la interfaz de Surface que usan, así que no saben qué
+    backend está activo. Se crea además una ventana de display oculta de
+    1x1 para que convert() y convert_alpha() sigan funcionando.
+    """
+
+    name = "texture"
+    partial_updates = False
+
+    def __init__(self, scaler: RenderScaler):
+        """
+        Inicializa el backend
+
+        Args:
+            scaler: Resolución interna y tamaño de la ventana
+        """
+        self.scaler = scaler
+        self.window = None
+        self.renderer = None
+        self.canvas: Optional[TextureCanvas] = None
+        self._target = None
+
+    def open(self, title: str, vsync: bool = False) -> TextureCanvas:
+        """
+        Crea la ventana y el renderer
+
+        Args:
+            title: Título de la ventana
+            vsync: Si se sincroniza la presentación con el monitor
+
+        Returns:
+            Destino de dibujo de las escenas
+        """
+        from pygame._sdl2.video import Renderer, Texture, Window
+
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.window = Window(title, size=self.scaler.window_size)
+        try:
+            self.renderer = Renderer(self.window, vsync=vsync, target_texture=True)
+        except RuntimeError as e:
+            print(f"[ENGINE] Advertencia: renderer con vsync no disponible ({e})")
+            self.renderer = Renderer(self.window, target_texture=True)
+        self.canvas = TextureCanvas(self.renderer, self.scaler.size)
+        if self.scaler.active:
+            # Se dibuja en una textura a resolución interna y se escala al
+            # presentar. SDL lee el filtro al crear la textura: la variable
+            # solo se cambia mientras tanto para no afectar al resto del proceso
+            previous = os.environ.get("SDL_RENDER_SCALE_QUALITY")
+            os.environ["SDL_RENDER_SCALE_QUALITY"] = "nearest" if self.scaler.mode == "integer" else "linear"
+            try:
+                self._target = Texture(self.renderer, self.scaler.size, target=True)
+            finally:
+                if previous is None:
+                    del os.environ["SDL_RENDER_SCALE_QUALITY"]
+                else:
+                    os.environ["SDL_RENDER_SCALE_QUALITY"] = previous
+            self.renderer.target = self._target
+        return self.canvas
+
+    def scale(self):
+        """Copia la textura interna escalada a la ventana"""
+        if self._target is None:
+            return
+        renderer = self.renderer
+        renderer.target = None
+        renderer.draw_color = pygame.Color(0, 0, 0)
+        renderer.clear()
+        self._target.draw(None, self.scaler.dest_rect)
+
+    def present(self):
+        """Muestra el frame"""
+        self.renderer.present()
+        if self._target is not None:
+            self.renderer.target = self._target
+
+    def close(self):
+        """Libera texturas, renderer y ventana"""
+        if self.canvas is not None:
+            self.canvas.clear()
+        self.canvas = None
+        self._target = None
+        self.renderer = None
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
+
+
+BACKENDS = {
+    "surface": SurfaceBackend,
+    "texture": TextureBackend,
+}
+
+
+def create_backend(name: str, scaler: RenderScaler):
+    """
+    Crea un backend de dibujo por nombre
+
+    Si pygame no trae pygame._sdl2.video se usa el backend de superficies.
+
+    Args:
+        name: "surface" o "texture"
+        scaler: Resolución interna y tamaño de la ventana
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Backend de dibujo desconocido: {name}")
+    if name == "texture":
+        try:
+            import pygame._sdl2.video  # noqa: F401
+        except ImportError as e:
+            print(f"[ENGINE] Advertencia: backend de texturas no disponible ({e})")
+            name = "surface"
+    return BACKENDS[name](scaler)
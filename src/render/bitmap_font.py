@@ -0,0 +1,228 @@
+"""Fuentes de mapa de bits a partir de las hojas de glifos de Rayman Legends"""
+
+import os
+import pygame
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.utils.assets import assets, find_asset
+
+FONT_DIR = os.path.join("assets", "sprites", "PC _ Computer - Rayman Legends - Miscellaneous - Font")
+
+# Distribución de cada hoja, fila a fila y de izquierda a derecha. Las hojas de
+# números no tienen rejilla: los glifos se localizan como regiones conexas. En
+# la de créditos cada glifo ocupa una celda de 128 px (" " = celda sin glifo).
+# font02_0.png no tiene tabla de caracteres: su orden es irregular y no se usa.
+BITMAP_FONTS = {
+    "lums": {"file": "rlnumbers_lums.png", "rows": ("/721", "580", "3496"), "tracking": -6,
+             # La barra inclinada deja hueco arriba a la izquierda y abajo a la derecha
+             "kerning": {**{(digit, "/"): -14 for digit in "0123456789"},
+                         **{("/", digit): -10 for digit in "0123456789"}}},
+    "numbers": {"file": "rlnumbers_0.png", "rows": ("758", "2931", "046"), "tracking": -10},
+    "credits": {"file": "credits_alphabet.png", "rows": ("ABCDEFGH", "IJKLMNOP", "QRSTUVWX", "YZ   ?-&"),
+                "cell": 128, "tracking": -12},
+}
+
+
+class BitmapFont:
+    """
+    Fuente de mapa de bits: un atlas de subsuperficies de una sola hoja
+
+    La hoja se recorta (y escala, si se pide) una única vez. Cada glifo tiene
+    su avance y su desplazamiento vertical (los glifos se alinean por abajo);
+    el espaciado entre pares se ajusta con la tabla de kerning. Un texto se
+    dibuja con una sola llamada a Surface.blits().
+    """
+
+    def __init__(self, sheet: pygame.Surface, rects: Dict[str, pygame.Rect], tracking: int = 0,
+                 kerning: Optional[Dict[Tuple[str, str], int]] = None, space_width: Optional[int] = None):
+        """
+        Inicializa la fuente
+
+        Args:
+            sheet: Hoja de glifos (ya escalada)
+            rects: Rectángulo de cada carácter dentro de la hoja
+            tracking: Píxeles que se añaden entre todos los glifos (negativo = más juntos)
+            kerning: Ajuste adicional para pares de caracteres concretos
+            space_width: Avance de los caracteres sin glifo (por defecto, media altura)
+        """
+        self.sheet = sheet
+        self.glyphs: Dict[str, pygame.Surface] = {char: sheet.subsurface(rect) for char, rect in rects.items()}
+        self.height = max(rect.height for rect in rects.values())
+        # Métricas: avance horizontal y desplazamiento vertical de cada glifo
+        self.advances: Dict[str, int] = {char: rect.width + tracking for char, rect in rects.items()}
+        self.offsets: Dict[str, int] = {char: self.height - rect.height for char, rect in rects.items()}
+        self.kerning = kerning or {}
+        self.space_width = space_width if space_width is not None else self.height // 2
+
+    @classmethod
+    def from_sheet(cls, sheet: pygame.Surface, rows: Sequence[str], height: Optional[int] = None,
+                   cell: Optional[int] = None, tracking: int = 0, min_alpha: int = 64,
+                   **kwargs) -> "BitmapFont":
+        """
+        Recorta una hoja de glifos
+
+        Args:
+            sheet: Hoja completa (con transparencia)
+            rows: Caracteres de cada fila de la hoja, de izquierda a derecha
+            height: Altura en píxeles de los glifos más altos (None = tamaño original)
+            cell: Tamaño de celda si la hoja es una rejilla (None = buscar regiones conexas)
+            tracking: Espaciado entre glifos, en píxeles de la hoja original
+            min_alpha: Alfa mínima para considerar que un píxel pertenece a un glifo
+        """
+        if cell:
+            rects = cls._grid_rects(sheet, rows, cell, min_alpha)
+        else:
+            rects = cls._component_rects(sheet, rows, min_alpha)
+
+        if height is not None:
+            scale = height / max(rect.height for rect in rects.values())
+            sheet = pygame.transform.smoothscale(
+                sheet, (max(1, round(sheet.get_width() * scale)), max(1, round(sheet.get_height() * scale))))
+            bounds = sheet.get_rect()
+            rects = {char: pygame.Rect(round(rect.x * scale), round(rect.y * scale),
+                                       max(1, round(rect.w * scale)), max(1, round(rect.h * scale))).clip(bounds)
+                     for char, rect in rects.items()}
+            tracking = round(tracking * scale)
+            if kwargs.get("kerning"):
+                kwargs["kerning"] = {pair: round(value * scale) for pair, value in kwargs["kerning"].items()}
+        return cls(sheet, rects, tracking=tracking, **kwargs)
+
+    @staticmethod
+    def _component_rects(sheet: pygame.Surface, rows: Sequence[str], min_alpha: int) -> Dict[str, pygame.Rect]:
+        """Localiza los glifos como regiones conexas y los asigna fila a fila"""
+        mask = pygame.mask.from_surface(sheet, min_alpha)
+        total = sum(len(row) for row in rows)
+        # Las regiones más grandes son los glifos; el resto son restos sueltos
+        components = sorted(mask.connected_components(), key=lambda m: m.count(), reverse=True)[:total]
+        found = [component.get_bounding_rects()[0] for component in components]
+        if len(found) != total:
+            raise ValueError(f"Se esperaban {total} glifos y se encontraron {len(found)}")
+
+        found.sort(key=lambda rect: rect.centery)
+        rects = {}
+        for row in rows:
+            row_rects, found = sorted(found[:len(row)], key=lambda rect: rect.x), found[len(row):]
+            for char, rect in zip(row, row_rects):
+                # Margen para no perder el borde suavizado
+                rects[char] = rect.inflate(4, 4).clip(sheet.get_rect())
+        return rects
+
+    @staticmethod
+    def _grid_rects(sheet: pygame.Surface, rows: Sequence[str], cell: int, min_alpha: int) -> Dict[str, pygame.Rect]:
+        """Recorta cada celda de la rejilla a su contenido visible"""
+        rects = {}
+        for row_index, row in enumerate(rows):
+            for col_index, char in enumerate(row):
+                if char == " ":
+                    continue
+                cell_rect = pygame.Rect(col_index * cell, row_index * cell, cell, cell)
+                bounds = sheet.subsurface(cell_rect).get_bounding_rect(min_alpha)
+                rects[char] = bounds.move(cell_rect.topleft)
+        return rects
+
+    def glyph(self, char: str) -> Optional[pygame.Surface]:
+        """Obtiene el glifo de un carácter (prueba también en mayúsculas)"""
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.glyphs.get(char.upper())
+        return glyph
+
+    def layout(self, text: str, position: Sequence[int] = (0, 0)) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Calcula la posición de cada glifo de un texto
+
+        Returns:
+            Lista (glifo, posición) lista para Surface.blits()
+        """
+        return self._layout(text, position)[0]
+
+    def _layout(self, text: str, position: Sequence[int]) -> Tuple[list, int]:
+        """Posiciones de los glifos y ancho total del texto"""
+        x, y = position
+        start = x
+        right = x
+        items = []
+        glyphs = self.glyphs
+        kerning = self.kerning
+        previous = None
+        for char in text:
+            if char not in glyphs:
+                char = char.upper()
+                if char not in glyphs:
+                    x += self.space_width
+                    right = max(right, x)
+                    previous = None
+                    continue
+            if previous is not None and kerning:
+                x += kerning.get((previous, char), 0)
+            glyph = glyphs[char]
+            items.append((glyph, (x, y + self.offsets[char])))
+            right = max(right, x + glyph.get_width())
+            x += self.advances[char]
+            previous = char
+        return items, right - start
+
+    def size(self, text: str) -> Tuple[int, int]:
+        """Tamaño (ancho, alto) que ocupa un texto"""
+        return (self._layout(text, (0, 0))[1], self.height)
+
+    def draw(self, surface: pygame.Surface, text: str, position: Sequence[int], special_flags: int = 0) -> pygame.Rect:
+        """
+        Dibuja un texto con una sola llamada a blits()
+
+        Args:
+            surface: Superficie destino
+            text: Texto a dibujar
+            position: Esquina superior izquierda
+            special_flags: Modo de mezcla de pygame (p. ej. BLEND_PREMULTIPLIED)
+
+        Returns:
+            Región ocupada por el texto
+        """
+        items, width = self._layout(text, position)
+        if special_flags:
+            items = [(glyph, pos, None, special_flags) for glyph, pos in items]
+        surface.blits(items, doreturn=False)
+        return pygame.Rect(position[0], position[1], width, self.height)
+
+    def premultiplied(self) -> "BitmapFont":
+        """Copia de la fuente con alfa premultiplicado (para componer en superficies con alfa)"""
+        font = object.__new__(type(self))
+        font.__dict__.update(self.__dict__)
+        font.sheet = self.sheet.premul_alpha()
+        font.glyphs = {char: font.sheet.subsurface(glyph.get_offset(), glyph.get_size())
+                       for char, glyph in self.glyphs.items()}
+        return font
+
+
+def bitmap_font_path(name: str) -> Optional[str]:
+    """Ruta de la hoja de una de las fuentes de BITMAP_FONTS (None si no está)"""
+    return find_asset(os.path.join(FONT_DIR, BITMAP_FONTS[name]["file"]))
+
+
+def load_bitmap_font(name: str, height: Optional[int] = None) -> Optional[BitmapFont]:
+    """
+    Carga una de las fuentes de BITMAP_FONTS
+
+    Args:
+        name: Nombre de la fuente ("lums", "numbers" o "credits")
+        height: Altura en píxeles de los glifos (None = tamaño de la hoja)
+
+    Returns:
+        La fuente, o None si la hoja no está
+    """
+    spec = BITMAP_FONTS[name]
+    path = bitmap_font_path(name)
+    if path is None:
+        print(f"Advertencia: hoja de fuente no encontrada: {spec['file']}")
+        return None
+    sheet = assets.load(path)
+    if pygame.display.get_surface() is not None:
+        sheet = sheet.convert_alpha()
+    return BitmapFont.from_sheet(sheet, spec["rows"], height=height, cell=spec.get("cell"),
+                                 tracking=spec.get("tracking", 0), kerning=spec.get("kerning"))
+
+
+def bitmap_font_files() -> List[str]:
+    """Rutas de las hojas de fuentes (para decodificarlas por adelantado)"""
+    files = [find_asset(os.path.join(FONT_DIR, spec["file"])) for spec in BITMAP_FONTS.values()]
+    return [path for path in files if path]
@@ -0,0 +1,135 @@
+"""Cámara: transformación mundo-pantalla y recorte por vista"""
+
+import pygame
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+class Camera:
+    """
+    Vista rectangular sobre un mundo que puede ser mayor que la pantalla
+
+    Sigue a un objetivo con una zona muerta centrada: mientras el objetivo
+    está dentro de ella la cámara no se mueve, y al salirse la cámara se
+    desplaza lo justo para devolverlo al borde. La posición se limita a los
+    límites del mundo. Como las entidades, guarda su posición del paso
+    anterior para dibujarse interpolada.
+    """
+
+    def __init__(self, size: Sequence[int], world_rect: Optional[pygame.Rect] = None,
+                 deadzone: Tuple[float, float] = (0.25, 0.3)):
+        """
+        Inicializa la cámara
+
+        Args:
+            size: Tamaño de la vista (el de la pantalla)
+            world_rect: Límites del mundo (por defecto, del tamaño de la vista)
+            deadzone: Ancho y alto de la zona muerta como fracción de la vista
+        """
+        self.width = size[0]
+        self.height = size[1]
+        self.world_rect = pygame.Rect(world_rect) if world_rect else pygame.Rect(0, 0, self.width, self.height)
+        self.deadzone = deadzone
+        self.x = float(self.world_rect.x)
+        self.y = float(self.world_rect.y)
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """Esquina superior izquierda de la vista en píxeles enteros"""
+        return (int(self.x), int(self.y))
+
+    @property
+    def viewport(self) -> pygame.Rect:
+        """Región del mundo que se ve"""
+        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+
+    def set_world(self, world_rect: pygame.Rect):
+        """Cambia los límites del mundo"""
+        self.world_rect = pygame.Rect(world_rect)
+        self.clamp()
+
+    def deadzone_rect(self) -> pygame.Rect:
+        """Zona muerta en coordenadas del mundo"""
+        width = int(self.width * self.deadzone[0])
+        height = int(self.height * self.deadzone[1])
+        return pygame.Rect(int(self.x) + (self.width - width) // 2, int(self.y) + (self.height - height) // 2,
+                           width, height)
+
+    def follow(self, target: pygame.Rect):
+        """
+        Mueve la cámara para que el objetivo quede dentro de la zona muerta
+
+        Args:
+            target: Rectángulo del objetivo en coordenadas del mundo
+        """
+        zone = self.deadzone_rect()
+        if target.width > zone.width:
+            self.x += target.centerx - zone.centerx
+        elif target.left < zone.left:
+            self.x -= zone.left - target.left
+        elif target.right > zone.right:
+            self.x += target.right - zone.right
+
+        if target.height > zone.height:
+            self.y += target.centery - zone.centery
+        elif target.top < zone.top:
+            self.y -= zone.top - target.top
+        elif target.bottom > zone.bottom:
+            self.y += target.bottom - zone.bottom
+        self.clamp()
+
+    def center_on(self, target: pygame.Rect):
+        """Centra la vista en el objetivo (sin interpolar el salto)"""
+        self.x = target.centerx - self.width / 2
+        self.y = target.centery - self.height / 2
+        self.clamp()
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def clamp(self):
+        """Mantiene la vista dentro del mundo"""
+        world = self.world_rect
+        self.x = float(max(world.left, min(self.x, world.right - self.width)))
+        self.y = float(max(world.top, min(self.y, world.bottom - self.height)))
+
+    def store_previous_position(self):
+        """Guarda la posición antes de un paso de simulación"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def get_interpolated_position(self, alpha: float) -> Tuple[float, float]:
+        """Posición entre el paso anterior y el actual"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
+    def world_to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        """Convierte un punto del mundo a la pantalla"""
+        ox, oy = self.offset
+        return (x - ox, y - oy)
+
+    def screen_to_world(self, x: float, y: float) -> Tuple[float, float]:
+        """Convierte un punto de la pantalla al mundo"""
+        ox, oy = self.offset
+        return (x + ox, y + oy)
+
+    def apply(self, rect: pygame.Rect) -> pygame.Rect:
+        """Rectángulo del mundo en coordenadas de pantalla"""
+        ox, oy = self.offset
+        return rect.move(-ox, -oy)
+
+    def cull(self, entities: Iterable) -> List:
+        """
+        Filtra las entidades que se ven
+
+        Args:
+            entities: Entidades en coordenadas del mundo
+
+        Returns:
+            Las que tocan la vista, en el mismo orden
+        """
+        entities = list(entities)
+        if not entities:
+            return entities
+        bounds = [entity.get_draw_rect() for entity in entities]
+        return [entities[i] for i in self.viewport.collidelistall(bounds)]
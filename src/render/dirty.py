@@ -0,0 +1,131 @@
+"""Renderizado por rectángulos sucios"""
+
+import pygame
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+class DirtyRectRenderer:
+    """
+    Redibuja y presenta solo las regiones de pantalla que han cambiado
+
+    Guarda los límites con los que se dibujó cada entidad móvil en el frame
+    anterior. En cada frame la región sucia de una entidad es la unión de sus
+    límites viejos y nuevos; la escena restaura el fondo en esas regiones,
+    vuelve a dibujar encima y el engine las presenta con
+    pygame.display.update(rects). Si el área sucia supera el umbral (o algo
+    invalida la pantalla entera) se redibuja todo y se hace un flip normal.
+    """
+
+    def __init__(self, size: Sequence[int], threshold: float = 0.5, padding: int = 2):
+        """
+        Inicializa el renderizador
+
+        Args:
+            size: Tamaño de la pantalla (ancho, alto)
+            threshold: Fracción del área de pantalla a partir de la cual se redibuja todo
+            padding: Píxeles que se añaden a cada región (posiciones con decimales)
+        """
+        self.screen_rect = pygame.Rect(0, 0, size[0], size[1])
+        self.threshold = threshold
+        self.padding = padding
+        self.rects: List[pygame.Rect] = []   # Regiones que se presentan este frame
+        self.full = True                     # Este frame se presenta entero
+        self.full_frames = 0
+        self.partial_frames = 0
+        self._needs_full = True
+        self._bounds: Dict[int, pygame.Rect] = {}
+        self._carry: List[pygame.Rect] = []  # Dibujado encima el frame anterior
+        self._state = None
+
+    def invalidate(self):
+        """Fuerza un redibujado completo en el próximo frame"""
+        self._needs_full = True
+
+    def collect(self, entities: Iterable, state=None,
+                extra: Iterable[pygame.Rect] = ()) -> Optional[List[pygame.Rect]]:
+        """
+        Calcula las regiones sucias del frame
+
+        Args:
+            entities: Entidades móviles que se van a dibujar
+            state: Valor cuyo cambio invalida toda la pantalla (fondo, calidad...)
+            extra: Regiones que se redibujan siempre (HUD)
+
+        Returns:
+            Regiones a restaurar y redibujar, o None si hay que dibujar todo
+        """
+        screen_rect = self.screen_rect
+        padding = self.padding * 2
+        previous = self._bounds
+        bounds: Dict[int, pygame.Rect] = {}
+        rects = self._carry
+        self._carry = []
+
+        for entity in entities:
+            new = entity.get_draw_rect().inflate(padding, padding)
+            key = entity.entity_id
+            bounds[key] = new
+            old = previous.pop(key, None)
+            if old is not None and old.colliderect(new):
+                rects.append(old.union(new))
+            else:
+                rects.append(new)
+                if old is not None:
+                    rects.append(old)
+        # Entidades que ya no están: hay que borrar su último dibujo
+        rects.extend(previous.values())
+        rects.extend(extra)
+        self._bounds = bounds
+
+        if state != self._state:
+            self._state = state
+            self._needs_full = True
+
+        if not self._needs_full:
+            rects = [rect.clip(screen_rect) for rect in rects]
+            rects = [rect for rect in rects if rect.w > 0 and rect.h > 0]
+            area = sum(rect.w * rect.h for rect in rects)
+            if area <= screen_rect.w * screen_rect.h * self.threshold:
+                self.rects = rects
+                self.full = False
+                return rects
+
+        self.full_frame()
+        return None
+
+    def full_frame(self):
+        """Indica que este frame se ha dibujado entero"""
+        self.rects = []
+        self.full = True
+        self._needs_full = False
+
+    def mark(self, rect: Optional[pygame.Rect]):
+        """
+        Añade una región dibujada encima de la escena (p. ej. el overlay)
+
+        Se presenta en este frame y se restaura en el siguiente.
+        """
+        if rect is None:
+            return
+        self._carry.append(rect)
+        if not self.full:
+            self.rects.append(rect)
+
+    def present(self, update_rects: bool = True):
+        """
+        Muestra el frame: solo las regiones sucias o la pantalla entera
+
+        Args:
+            update_rects: Si se pueden presentar solo las regiones (False si el
+                frame se escala a la ventana: se redibuja solo lo sucio, pero
+                se presenta entero)
+        """
+        if self.full:
+            self.full_frames += 1
+            pygame.display.flip()
+        else:
+            self.partial_frames += 1
+            if update_rects:
+                pygame.display.update(self.rects)
+            else:
+                pygame.display.flip()
@@ -0,0 +1,122 @@
+"""Capas de dibujo con nombre y orden por profundidad"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Mapping, Sequence, Tuple
+
+# Capas de atrás hacia delante
+RENDER_LAYERS = ("background", "static", "actors", "effects", "hud")
+# Posición de cada capa (la cola de dibujo las vuelca de menor a mayor)
+LAYER_INDEX: Dict[str, int] = {name: i for i, name in enumerate(RENDER_LAYERS)}
+
+
+class RenderLayers:
+    """
+    Entidades de una escena agrupadas por capa y ordenadas por profundidad
+
+    Cada capa guarda sus entidades ordenadas por (depth, entity_id): las de
+    menor profundidad se dibujan antes y, a igual profundidad, en el orden en
+    que se crearon. La posición se busca con bisect al añadir y al quitar, así
+    que el orden de dibujo es siempre el mismo sin ordenar en cada frame.
+    """
+
+    def __init__(self, names: Sequence[str] = RENDER_LAYERS):
+        """
+        Inicializa las capas vacías
+
+        Args:
+            names: Nombres de las capas, de atrás hacia delante
+        """
+        self.names = tuple(names)
+        self._keys: Dict[str, List[Tuple[float, int]]] = {name: [] for name in self.names}
+        self._items: Dict[str, List] = {name: [] for name in self.names}
+        # Entidad -> (capa, clave) con las que se insertó
+        self._where: Dict[object, Tuple[str, Tuple[float, int]]] = {}
+
+    def add(self, entity):
+        """
+        Inserta una entidad en su capa (entity.render_layer) según entity.depth
+
+        Args:
+            entity: Entidad a añadir
+        """
+        layer = entity.render_layer
+        keys = self._keys.get(layer)
+        if keys is None:
+            raise ValueError(f"Capa de dibujo desconocida: {layer}")
+        if entity in self._where:
+            return
+        key = (entity.depth, entity.entity_id)
+        i = bisect_right(keys, key)
+        keys.insert(i, key)
+        self._items[layer].insert(i, entity)
+        self._where[entity] = (layer, key)
+
+    def remove(self, entity) -> bool:
+        """
+        Quita una entidad de su capa
+
+        Args:
+            entity: Entidad a quitar
+
+        Returns:
+            Si la entidad estaba en alguna capa
+        """
+        where = self._where.pop(entity, None)
+        if where is None:
+            return False
+        layer, key = where
+        i = bisect_left(self._keys[layer], key)
+        del self._keys[layer][i]
+        del self._items[layer][i]
+        return True
+
+    def set_depth(self, entity, depth: float):
+        """
+        Cambia la profundidad de una entidad y la recoloca en su capa
+
+        Args:
+            entity: Entidad (debe estar en las capas)
+            depth: Nueva profundidad
+        """
+        self.remove(entity)
+        entity.depth = depth
+        self.add(entity)
+
+    def layer(self, name: str) -> List:
+        """
+        Entidades de una capa en orden de dibujo (no modificar la lista)
+
+        Args:
+            name: Nombre de la capa
+        """
+        return self._items[name]
+
+    def __iter__(self) -> Iterator:
+        """Recorre todas las entidades en orden de dibujo"""
+        for name in self.names:
+            yield from self._items[name]
+
+    def __len__(self) -> int:
+        """Número de entidades en todas las capas"""
+        return len(self._where)
+
+    def __contains__(self, entity) -> bool:
+        """Indica si la entidad está en alguna capa"""
+        return entity in self._where
+
+    def copy(self, mapping: Mapping) -> "RenderLayers":
+        """
+        Copia las capas sustituyendo cada entidad por su equivalente (instantáneas)
+
+        Args:
+            mapping: Entidad original -> entidad que la sustituye
+
+        Returns:
+            Capas nuevas con el mismo orden
+        """
+        layers = RenderLayers(self.names)
+        for name in self.names:
+            layers._keys[name] = list(self._keys[name])
+            layers._items[name] = [mapping[entity] for entity in self._items[name]]
+        layers._where = {mapping[entity]: where for entity, where in self._where.items()}
+        return layers
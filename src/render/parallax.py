@@ -0,0 +1,104 @@
+"""Fondo de varias capas con desplazamiento parallax"""
+
+import pygame
+from typing import List, Optional, Sequence, Tuple
+
+
+class ParallaxLayer:
+    """
+    Capa de fondo escalada una sola vez y repetida en horizontal
+
+    El factor indica cuánto se mueve la capa respecto a la cámara: 0 se queda
+    fija (cielo), 1 se mueve con el mundo. La imagen se escala y convierte al
+    crear la capa; al dibujar solo se recolocan sus copias.
+    """
+
+    def __init__(self, image: pygame.Surface, factor: float, y: int = 0, height: Optional[int] = None,
+                 factor_y: Optional[float] = None, repeat_x: bool = True):
+        """
+        Inicializa la capa
+
+        Args:
+            image: Imagen de la capa
+            factor: Desplazamiento horizontal relativo a la cámara
+            y: Posición vertical en pantalla con la cámara arriba del todo
+            height: Alto al que se escala la imagen (None = tamaño original)
+            factor_y: Desplazamiento vertical relativo a la cámara (por defecto, factor)
+            repeat_x: Si la imagen se repite a lo ancho
+        """
+        if height and height != image.get_height():
+            width = max(1, round(image.get_width() * height / image.get_height()))
+            image = pygame.transform.smoothscale(image, (width, height))
+        if pygame.display.get_surface() is not None:
+            # Las capas opacas (el cielo) se copian sin mezcla alfa
+            opaque = (not image.get_flags() & pygame.SRCALPHA
+                      or pygame.mask.from_surface(image, 254).count() == image.get_width() * image.get_height())
+            image = image.convert() if opaque else image.convert_alpha()
+        self.image = image
+        self.width, self.height = image.get_size()
+        self.factor = factor
+        self.factor_y = factor if factor_y is None else factor_y
+        self.y = y
+        self.repeat_x = repeat_x
+
+
+class ParallaxBackground:
+    """
+    Capas de fondo dibujadas de la más lejana a la más cercana
+
+    Las copias de todas las capas van en una única lista para blits() que se
+    crea al añadir capas; cada frame solo se actualizan sus posiciones, así
+    que dibujar el fondo no escala ni reserva superficies ni listas.
+    """
+
+    def __init__(self, size: Sequence[int]):
+        """
+        Inicializa el fondo
+
+        Args:
+            size: Tamaño de la zona que cubre el fondo (el de la pantalla)
+        """
+        self.size = (size[0], size[1])
+        self.layers: List[ParallaxLayer] = []
+        self._slots: List[Tuple[ParallaxLayer, List[List[int]]]] = []
+        self._batch: List[Tuple[pygame.Surface, List[int]]] = []
+
+    def add_layer(self, layer: ParallaxLayer) -> ParallaxLayer:
+        """
+        Añade una capa por delante de las existentes
+
+        Args:
+            layer: Capa a añadir
+
+        Returns:
+            La misma capa
+        """
+        # Copias necesarias para cubrir el ancho con cualquier desplazamiento
+        copies = self.size[0] // layer.width + 2 if layer.repeat_x else 1
+        dests = [[0, 0] for _ in range(copies)]
+        self.layers.append(layer)
+        self._slots.append((layer, dests))
+        self._batch.extend((layer.image, dest) for dest in dests)
+        return layer
+
+    def draw(self, surface: pygame.Surface, offset: Sequence[int] = (0, 0)):
+        """
+        Dibuja todas las capas con un único blits()
+
+        Args:
+            surface: Superficie donde dibujar
+            offset: Desplazamiento de la cámara en el mundo
+        """
+        ox, oy = offset
+        for layer, dests in self._slots:
+            y = layer.y - int(oy * layer.factor_y)
+            if layer.repeat_x:
+                x = -(int(ox * layer.factor) % layer.width)
+                for dest in dests:
+                    dest[0] = x
+                    dest[1] = y
+                    x += layer.width
+            else:
+                dests[0][0] = -int(ox * layer.factor)
+                dests[0][1] = y
+        surface.blits(self._batch, doreturn=False)
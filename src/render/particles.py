@@ -0,0 +1,233 @@
+"""Partículas con los datos en arrays de NumPy"""
+
+import numpy as np
+import pygame
+from typing import List, Optional, Sequence, Tuple
+
+from src.entities.entity import Entity
+
+
+def particle_frames(color: Sequence[int], radius: int, steps: int = 6,
+                    additive: bool = False) -> List[pygame.Surface]:
+    """
+    Crea las imágenes de una partícula que se apaga a lo largo de su vida
+
+    Args:
+        color: Color RGB de la partícula
+        radius: Radio al nacer (se encoge hasta la mitad)
+        steps: Número de imágenes
+        additive: Imágenes para mezcla aditiva (el color se apaga hacia negro
+            en lugar de bajar el alfa)
+
+    Returns:
+        Imágenes de la más nueva a la más vieja, todas del mismo tamaño
+    """
+    size = radius * 2
+    frames = []
+    for i in range(steps):
+        fade = 1.0 - i / steps
+        r = max(1, round(radius * (0.5 + 0.5 * fade)))
+        if additive:
+            image = pygame.Surface((size, size))
+            image.fill((0, 0, 0))
+            pygame.draw.circle(image, [int(c * fade) for c in color[:3]], (radius, radius), r)
+            if pygame.display.get_surface() is not None:
+                image = image.convert()
+        else:
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(image, (*color[:3], int(255 * fade)), (radius, radius), r)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+        frames.append(image)
+    return frames
+
+
+class ParticleEmitter(Entity):
+    """
+    Conjunto de partículas que se simula y se dibuja como una sola entidad
+
+    Posición, velocidad, edad, vida y variante de color de cada partícula
+    viven en arrays de NumPy; las vivas ocupan siempre las primeras count
+    posiciones. update() avanza todas con operaciones vectorizadas y compacta
+    los arrays cuando muere alguna, y el emisor encola todas sus partículas
+    de una vez, así que se dibujan en el mismo blits() que el resto de su
+    capa. La imagen de cada partícula sale de su variante y de la fracción de
+    vida consumida. Las velocidades van en píxeles por segundo y dt en
+    milisegundos.
+    """
+
+    render_layer = "effects"
+
+    def __init__(self, variants: Sequence[Sequence[pygame.Surface]], capacity: int = 4096,
+                 gravity: float = 0.0, drag: float = 0.0, additive: bool = False,
+                 seed: Optional[int] = None):
+        """
+        Inicializa el emisor vacío
+
+        Args:
+            variants: Imágenes de cada variante de color (ver particle_frames),
+                todas con el mismo número de imágenes y tamaño
+            capacity: Máximo de partículas vivas (las que no caben se descartan)
+            gravity: Aceleración vertical en píxeles/s²
+            drag: Fracción de la velocidad que se pierde por segundo
+            additive: Dibujar con mezcla aditiva (brillos)
+            seed: Semilla del generador aleatorio (tests y benchmarks)
+        """
+        super().__init__(0, 0, 0, 0)
+        self.steps = len(variants[0])
+        self.frames = [image for frames in variants for image in frames]
+        self.variants = len(variants)
+        width, height = self.frames[0].get_size()
+        # Las partículas se dibujan centradas en su posición
+        self._half = np.array((width // 2, height // 2), dtype=np.float32)
+        self._size = (width, height)
+        self.capacity = capacity
+        self.gravity = gravity
+        self.drag = drag
+        self.flags = pygame.BLEND_ADD if additive else 0
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.life = np.ones(capacity, dtype=np.float32)
+        self.variant = np.zeros(capacity, dtype=np.int32)
+        # Límites de las partículas vivas en coordenadas del mundo
+        self.bounds = pygame.Rect(0, 0, 0, 0)
+        self._rng = np.random.default_rng(seed)
+
+    def emit(self, x: float, y: float, count: int, speed: Tuple[float, float] = (50.0, 150.0),
+             angle: Tuple[float, float] = (0.0, 360.0), life: Tuple[float, float] = (400.0, 800.0),
+             spread: float = 0.0, variant: Optional[int] = None) -> int:
+        """
+        Crea partículas en un punto
+
+        Args:
+            x: Posición x en el mundo
+            y: Posición y en el mundo
+            count: Número de partículas
+            speed: Velocidad mínima y máxima en píxeles/s
+            angle: Dirección mínima y máxima en grados (0 = derecha, 90 = abajo)
+            life: Vida mínima y máxima en milisegundos
+            spread: Radio de dispersión de la posición inicial en píxeles
+            variant: Variante de color (None = al azar)
+
+        Returns:
+            Partículas creadas (menos que count si el emisor está lleno)
+        """
+        start = self.count
+        count = min(count, self.capacity - start)
+        if count <= 0:
+            return 0
+        end = start + count
+        rng = self._rng
+        theta = np.radians(rng.uniform(angle[0], angle[1], count))
+        v = rng.uniform(speed[0], speed[1], count)
+        pos = self.pos[start:end]
+        pos[:, 0] = x
+        pos[:, 1] = y
+        if spread:
+            pos += rng.uniform(-spread, spread, (count, 2))
+        self.vel[start:end, 0] = np.cos(theta) * v
+        self.vel[start:end, 1] = np.sin(theta) * v
+        self.age[start:end] = 0.0
+        self.life[start:end] = rng.uniform(life[0], life[1], count)
+        if variant is None:
+            self.variant[start:end] = rng.integers(0, self.variants, count)
+        else:
+            self.variant[start:end] = variant
+        self.count = end
+        self._update_bounds()
+        return count
+
+    def update(self, dt: float):
+        """Avanza todas las partículas dt milisegundos y retira las que han muerto"""
+        n = self.count
+        if not n:
+            return
+        seconds = dt / 1000.0
+        vel = self.vel[:n]
+        if self.gravity:
+            vel[:, 1] += self.gravity * seconds
+        if self.drag:
+            vel *= max(0.0, 1.0 - self.drag * seconds)
+        self.pos[:n] += vel * seconds
+        age = self.age[:n]
+        age += dt
+        alive = age < self.life[:n]
+        if not alive.all():
+            # Compactar: las vivas pasan al principio conservando su orden
+            keep = int(np.count_nonzero(alive))
+            for array in (self.pos, self.vel, self.age, self.life, self.variant):
+                array[:keep] = array[:n][alive]
+            self.count = keep
+        self._update_bounds()
+
+    def _update_bounds(self):
+        """Recalcula los límites de las partículas vivas y el rectángulo"""
+        n = self.count
+        if n:
+            pos = self.pos[:n]
+            left, top = (pos.min(axis=0) - self._half).astype(int)
+            right, bottom = (pos.max(axis=0) - self._half).astype(int)
+            self.bounds = pygame.Rect(left, top, right - left + self._size[0] + 1,
+                                      bottom - top + self._size[1] + 1)
+        else:
+            self.bounds = pygame.Rect(0, 0, 0, 0)
+        self.update_rect()
+
+    def update_rect(self):
+        """El rectángulo son los límites de las partículas (desplazados con x, y por la cámara)"""
+        self.rect = self.bounds.move(self.x, self.y)
+
+    def get_draw_rect(self) -> pygame.Rect:
+        """Región que ocupan las partículas"""
+        return self.rect.copy()
+
+    def frame_indices(self) -> np.ndarray:
+        """Imagen de cada partícula viva según su variante y la vida consumida"""
+        n = self.count
+        step = (self.age[:n] * self.steps / self.life[:n]).astype(np.int32)
+        np.minimum(step, self.steps - 1, out=step)
+        return self.variant[:n] * self.steps + step
+
+    def blit_sequence(self) -> list:
+        """
+        Elementos de blits() de todas las partículas vivas
+
+        La posición del emisor (x, y) se suma a todas: la cámara la usa para
+        pasar las partículas a coordenadas de pantalla.
+        """
+        n = self.count
+        if not n:
+            return []
+        offset = np.array((self.x, self.y), dtype=np.float32) - self._half
+        positions = (self.pos[:n] + offset).astype(np.int32).tolist()
+        images = list(map(self.frames.__getitem__, self.frame_indices().tolist()))
+        if self.flags:
+            flags = self.flags
+            return [(image, position, None, flags) for image, position in zip(images, positions)]
+        return list(zip(images, positions))
+
+    def draw(self, surface: pygame.Surface):
+        """Dibuja todas las partículas con un solo blits()"""
+        if self.count:
+            surface.blits(self.blit_sequence(), doreturn=False)
+
+    def submit(self, queue):
+        """Encola todas las partículas en la capa del emisor"""
+        if self.count:
+            queue.submit_many(self.blit_sequence(), self.layer_index)
+
+    def snapshot(self) -> "ParticleEmitter":
+        """Copia solo las partículas vivas: la simulación reescribe los arrays"""
+        snap = super().snapshot()
+        n = self.count
+        for name in ("pos", "vel", "age", "life", "variant"):
+            setattr(snap, name, getattr(self, name)[:n].copy())
+        snap.bounds = self.bounds.copy()
+        return snap
+
+    def clear(self):
+        """Elimina todas las partículas"""
+        self.count = 0
+        self._update_bounds()
@@ -0,0 +1,318 @@
+"""Efectos de postproceso a pantalla completa con NumPy sobre surfarray"""
+
+import copy
+import numpy as np
+import pygame
+from typing import Dict, Optional, Sequence, Tuple
+
+# Etapas: "world" se aplica antes del HUD y "screen" al frame terminado
+POST_STAGES = ("world", "screen")
+# Peso de cada canal en la luminancia (suman 256)
+LUMA_WEIGHTS = (77, 150, 29)
+
+# Los píxeles de 32 bits se procesan empaquetados: los bytes 0 y 2 en una
+# pasada y el byte 1 en otra, cada uno con 16 bits de margen para el producto
+_EVEN = 0x00FF00FF
+_ODD = 0x0000FF00
+
+
+def supports(surface) -> bool:
+    """
+    Indica si se pueden aplicar efectos a una superficie
+
+    Hace falta una pygame.Surface de 32 bits con los canales de color en los
+    tres bytes bajos (XRGB/ARGB o XBGR/ABGR, el formato normal de la pantalla).
+    """
+    if not isinstance(surface, pygame.Surface) or surface.get_bitsize() != 32:
+        return False
+    return sorted(surface.get_shifts()[:3]) == [0, 8, 16]
+
+
+def mix_color(pixels: np.ndarray, packed: int, weight: int, a: np.ndarray, b: np.ndarray, keep: int = 0):
+    """
+    Mezcla los píxeles con un color: p = (p * (256 - weight) + color * weight) / 256
+
+    Args:
+        pixels: Vista uint32 (alto, ancho) de la superficie
+        packed: Color en el formato de la superficie (Surface.map_rgb)
+        weight: Peso del color de 0 a 256
+        a, b: Búferes uint32 de la misma forma
+        keep: Máscara de los bits que se conservan (el alfa)
+    """
+    inv = 256 - weight
+    np.bitwise_and(pixels, _EVEN, out=a)
+    np.multiply(a, inv, out=a)
+    if packed & _EVEN:
+        np.add(a, (packed & _EVEN) * weight, out=a)
+    np.right_shift(a, 8, out=a)
+    np.bitwise_and(a, _EVEN, out=a)
+    np.bitwise_and(pixels, _ODD, out=b)
+    np.multiply(b, inv, out=b)
+    if packed & _ODD:
+        np.add(b, (packed & _ODD) * weight, out=b)
+    np.right_shift(b, 8, out=b)
+    np.bitwise_and(b, _ODD, out=b)
+    np.bitwise_or(a, b, out=a)
+    if keep:
+        np.bitwise_and(pixels, keep, out=b)
+        np.bitwise_or(a, b, out=a)
+    np.copyto(pixels, a)
+
+
+def desaturate(pixels: np.ndarray, weight: int, byte_weights: Sequence[int], a: np.ndarray, b: np.ndarray,
+               luma: np.ndarray, keep: int = 0):
+    """
+    Mezcla los píxeles con su luminancia (weight = 256: escala de grises)
+
+    Args:
+        pixels: Vista uint32 (alto, ancho) de la superficie
+        weight: Peso del gris de 0 a 256
+        byte_weights: Peso en la luminancia de los bytes 0, 1 y 2 del píxel
+        a, b, luma: Búferes uint32 de la misma forma
+        keep: Máscara de los bits que se conservan (el alfa)
+    """
+    w0, w1, w2 = byte_weights
+    # Bytes 0 y 2 con una sola multiplicación: los dos productos útiles se
+    # suman en los bits 16-31 y el cruzado se sale de los 32 bits
+    np.bitwise_and(pixels, _EVEN, out=luma)
+    np.multiply(luma, w2 + (w0 << 16), out=luma)
+    np.right_shift(luma, 16, out=luma)
+    np.right_shift(pixels, 8, out=b)
+    np.bitwise_and(b, 0xFF, out=b)
+    np.multiply(b, w1, out=b)
+    np.add(luma, b, out=luma)
+    np.right_shift(luma, 8, out=luma)
+    if weight >= 256:
+        np.multiply(luma, 0x010101, out=a)
+    else:
+        inv = 256 - weight
+        np.bitwise_and(pixels, _EVEN, out=a)
+        np.multiply(a, inv, out=a)
+        np.multiply(luma, weight * 0x00010001, out=b)
+        np.add(a, b, out=a)
+        np.right_shift(a, 8, out=a)
+        np.bitwise_and(a, _EVEN, out=a)
+        np.bitwise_and(pixels, _ODD, out=b)
+        np.multiply(b, inv, out=b)
+        np.multiply(luma, weight << 8, out=luma)
+        np.add(b, luma, out=b)
+        np.right_shift(b, 8, out=b)
+        np.bitwise_and(b, _ODD, out=b)
+        np.bitwise_or(a, b, out=a)
+    if keep:
+        np.bitwise_and(pixels, keep, out=b)
+        np.bitwise_or(a, b, out=a)
+    np.copyto(pixels, a)
+
+
+def tint_surface(surface: pygame.Surface, color: Sequence[int], amount: float) -> pygame.Surface:
+    """
+    Crea una copia de una superficie mezclada con un color (conserva el alfa)
+
+    Para imágenes que se preparan una vez (p. ej. el parpadeo del jugador).
+
+    Args:
+        surface: Imagen original
+        color: Color RGB
+        amount: Intensidad de 0 a 1
+
+    Returns:
+        Copia teñida (la propia copia sin teñir si el formato no lo admite)
+    """
+    tinted = surface.copy()
+    if not supports(tinted):
+        return tinted
+    pixels = pygame.surfarray.pixels2d(tinted).T
+    a = np.empty(pixels.shape, dtype=np.uint32)
+    b = np.empty(pixels.shape, dtype=np.uint32)
+    mix_color(pixels, tinted.map_rgb(color), round(amount * 256), a, b, tinted.get_masks()[3])
+    del pixels
+    return tinted
+
+
+class PostEffect:
+    """Efecto con una intensidad de 0 a 1 que se anima con el tiempo"""
+
+    def __init__(self, stage: str, color: Sequence[int] = (0, 0, 0)):
+        """
+        Inicializa el efecto apagado
+
+        Args:
+            stage: Etapa en la que se aplica (ver POST_STAGES)
+            color: Color del efecto (tinte, destello o fundido)
+        """
+        self.stage = stage
+        self.color = tuple(color)
+        self.start = 0.0
+        self.end = 0.0
+        self.duration = 0.0
+        self.elapsed = 0.0
+
+    @property
+    def amount(self) -> float:
+        """Intensidad actual"""
+        if self.elapsed >= self.duration:
+            return self.end
+        return self.start + (self.end - self.start) * self.elapsed / self.duration
+
+    @property
+    def weight(self) -> int:
+        """Intensidad actual de 0 a 256 (la que usan las mezclas)"""
+        return round(self.amount * 256)
+
+    def animate(self, end: float, duration: float = 0.0, start: Optional[float] = None,
+                color: Optional[Sequence[int]] = None):
+        """
+        Lleva la intensidad a un valor
+
+        Args:
+            end: Intensidad final
+            duration: Milisegundos que tarda (0 = inmediato)
+            start: Intensidad de partida (por defecto, la actual)
+            color: Nuevo color del efecto
+        """
+        self.start = self.amount if start is None else start
+        self.end = end
+        self.duration = duration
+        self.elapsed = 0.0
+        if color is not None:
+            self.color = tuple(color)
+
+    def update(self, dt: float):
+        """Avanza la animación dt milisegundos"""
+        if self.elapsed < self.duration:
+            self.elapsed = min(self.elapsed + dt, self.duration)
+
+
+class PostEffects:
+    """
+    Efectos a pantalla completa de una escena (tinte, desaturado, destello, fundido)
+
+    Se aplican con NumPy sobre una vista pixels2d del frame, sin copiarlo y
+    sin recorrer píxeles en Python: cada píxel de 32 bits se trata como dos
+    grupos de canales empaquetados, así que una mezcla son unas pocas
+    operaciones sobre arrays uint32. Los búferes intermedios se reservan la
+    primera vez para cada tamaño de destino y se reutilizan. Los efectos de
+    la etapa "world" afectan al mundo y no al HUD; los de "screen" (el
+    fundido) a todo el frame. Los destinos que no son Surface (backend de
+    texturas) se quedan sin efectos, salvo los que graban (RecordingCanvas),
+    que anotan cada efecto con su peso para aplicarlo al reproducir.
+    """
+
+    # Orden de aplicación
+    ORDER = ("desaturate", "tint", "flash", "fade")
+
+    def __init__(self):
+        """Inicializa los efectos apagados"""
+        self.effects: Dict[str, PostEffect] = {
+            "desaturate": PostEffect("world"),
+            "tint": PostEffect("world"),
+            "flash": PostEffect("world", (255, 255, 255)),
+            "fade": PostEffect("screen"),
+        }
+        # Tamaño -> búferes uint32 (alto, ancho); se comparten con las instantáneas
+        self._buffers: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._warned = False
+        self.applied = 0
+
+    def flash(self, color: Sequence[int] = (255, 255, 255), amount: float = 0.6, duration: float = 150.0):
+        """Destello: el mundo se tiñe de golpe y se recupera en duration ms"""
+        self.effects["flash"].animate(0.0, duration, start=amount, color=color)
+
+    def fade_in(self, duration: float, color: Sequence[int] = (0, 0, 0)):
+        """Fundido de entrada desde un color"""
+        self.effects["fade"].animate(0.0, duration, start=1.0, color=color)
+
+    def fade_out(self, duration: float, color: Sequence[int] = (0, 0, 0)):
+        """Fundido de salida hacia un color"""
+        self.effects["fade"].animate(1.0, duration, color=color)
+
+    def tint(self, color: Sequence[int], amount: float, duration: float = 0.0):
+        """Tinte del mundo (amount = 0 lo quita)"""
+        self.effects["tint"].animate(amount, duration, color=color)
+
+    def desaturate(self, amount: float, duration: float = 0.0):
+        """Desaturado del mundo (1 = escala de grises)"""
+        self.effects["desaturate"].animate(amount, duration)
+
+    def update(self, dt: float):
+        """Avanza las animaciones dt milisegundos"""
+        for effect in self.effects.values():
+            effect.update(dt)
+
+    @property
+    def active(self) -> bool:
+        """Si algún efecto cambia el frame"""
+        return any(effect.weight for effect in self.effects.values())
+
+    def buffers(self, size: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Búferes intermedios para un destino de ese tamaño (se crean una vez)"""
+        key = (size[0], size[1])
+        buffers = self._buffers.get(key)
+        if buffers is None:
+            buffers = self._buffers[key] = tuple(np.empty((key[1], key[0]), dtype=np.uint32) for _ in range(3))
+        return buffers
+
+    def apply(self, surface: pygame.Surface, stage: str = "screen", rect: Optional[pygame.Rect] = None):
+        """
+        Aplica los efectos activos de una etapa
+
+        Args:
+            surface: Frame donde se aplican
+            stage: "world" o "screen"
+            rect: Región a la que se limitan (por defecto, toda la superficie)
+        """
+        effects = [(name, self.effects[name]) for name in self.ORDER
+                   if self.effects[name].stage == stage and self.effects[name].weight]
+        if not effects:
+            return
+        record = getattr(surface, "record_effect", None)
+        if record is not None:
+            # Destino que graba (RecordingCanvas): el efecto se aplica al reproducir
+            for name, effect in effects:
+                record(name, effect.color, effect.weight, rect)
+            return
+        for name, effect in effects:
+            self.apply_effect(surface, name, effect.color, effect.weight, rect)
+
+    def apply_effect(self, surface: pygame.Surface, name: str, color: Sequence[int], weight: int,
+                     rect: Optional[pygame.Rect] = None):
+        """
+        Aplica un efecto con un peso fijo (también al reproducir una grabación)
+
+        Args:
+            surface: Frame donde se aplica
+            name: Efecto (ver ORDER)
+            color: Color de la mezcla (no lo usa el desaturado)
+            weight: Peso de 0 a 256
+            rect: Región a la que se limita (por defecto, toda la superficie)
+        """
+        if not supports(surface):
+            if not self._warned:
+                print("[RENDER] Advertencia: los efectos de postproceso necesitan una Surface de 32 bits")
+                self._warned = True
+            return
+        pixels = pygame.surfarray.pixels2d(surface).T
+        if rect is not None:
+            rect = pygame.Rect(rect).clip(surface.get_rect())
+            if not rect.width or not rect.height:
+                return
+            pixels = pixels[rect.top:rect.bottom, rect.left:rect.right]
+        height, width = pixels.shape
+        a, b, luma = (buffer[:height, :width] for buffer in self.buffers(surface.get_size()))
+        keep = surface.get_masks()[3]
+        if name == "desaturate":
+            byte_weights = [0, 0, 0]
+            for shift, w in zip(surface.get_shifts()[:3], LUMA_WEIGHTS):
+                byte_weights[shift // 8] = w
+            desaturate(pixels, weight, byte_weights, a, b, luma, keep)
+        else:
+            mix_color(pixels, surface.map_rgb(color), weight, a, b, keep)
+        del pixels
+        self.applied += 1
+
+    def snapshot(self) -> "PostEffects":
+        """Copia el estado de los efectos para dibujar mientras se simula otro frame"""
+        snap = copy.copy(self)
+        snap.effects = {name: copy.copy(effect) for name, effect in self.effects.items()}
+        return snap
@@ -0,0 +1,114 @@
+"""Cola de dibujo por capas con blits agrupados"""
+
+import pygame
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+# Elemento de la cola: (imagen, posición) o (imagen, posición, área), o una
+# función que dibuja directamente (entidades sin imagen propia)
+QueueItem = Union[tuple, Callable[[pygame.Surface], None]]
+
+
+class RenderQueue:
+    """
+    Acumula lo que hay que dibujar en el frame y lo vuelca por capas
+
+    Las entidades envían (imagen, posición, capa) con submit() en lugar de
+    dibujar; flush() recorre las capas de menor a mayor y dibuja cada una con
+    una sola llamada a Surface.blits(). Las entidades que aún dibujan con
+    primitivas se encolan con submit_draw() y se llaman en su turno, así que
+    se respeta el orden en que se enviaron.
+    """
+
+    def __init__(self):
+        """Inicializa la cola vacía"""
+        self.layers: Dict[int, List[QueueItem]] = {}
+        self.blit_calls = 0
+        self.items = 0
+
+    def submit(self, image: pygame.Surface, position: Sequence[float], layer: int = 0,
+               area: Optional[pygame.Rect] = None):
+        """
+        Encola una imagen
+
+        Args:
+            image: Superficie a dibujar
+            position: Esquina superior izquierda en pantalla
+            layer: Capa (las menores se dibujan antes)
+            area: Parte de la imagen a dibujar (por defecto, entera)
+        """
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+        if area is None:
+            items.append((image, position))
+        else:
+            items.append((image, position, area))
+
+    def submit_many(self, items: Sequence[tuple], layer: int = 0):
+        """
+        Encola varios elementos de blits() ya formados (p. ej. partículas)
+
+        Args:
+            items: Tuplas (imagen, posición[, área[, flags]])
+            layer: Capa (las menores se dibujan antes)
+        """
+        queued = self.layers.get(layer)
+        if queued is None:
+            self.layers[layer] = list(items)
+        else:
+            queued.extend(items)
+
+    def submit_draw(self, draw: Callable[[pygame.Surface], None], layer: int = 0):
+        """
+        Encola un dibujo directo (respaldo para entidades sin imagen)
+
+        Args:
+            draw: Función que recibe la superficie y dibuja
+            layer: Capa (las menores se dibujan antes)
+        """
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+        items.append(draw)
+
+    def clear(self):
+        """Vacía la cola sin dibujar"""
+        self.layers.clear()
+
+    def flush(self, surface: pygame.Surface):
+        """
+        Dibuja todo lo encolado y vacía la cola
+
+        Args:
+            surface: Superficie destino
+        """
+        blit_calls = 0
+        count = 0
+        # Los destinos que no son Surface (backend de texturas) ejecutan los
+        # dibujos directos a su manera
+        direct = None if isinstance(surface, pygame.Surface) else surface.draw_direct
+        for layer in sorted(self.layers):
+            items = self.layers[layer]
+            count += len(items)
+            start = 0
+            for i, item in enumerate(items):
+                if isinstance(item, tuple):
+                    continue
+                # Un dibujo directo corta el lote para conservar el orden
+                if i > start:
+                    surface.blits(items[start:i], doreturn=False)
+                    blit_calls += 1
+                start = i + 1
+                try:
+                    if direct is None:
+                        item(surface)
+                    else:
+                        direct(item)
+                except Exception as e:
+                    print(f"Error dibujando entidad: {e}")
+            if start < len(items):
+                surface.blits(items[start:] if start else items, doreturn=False)
+                blit_calls += 1
+        self.layers.clear()
+        self.blit_calls = blit_calls
+        self.items = count
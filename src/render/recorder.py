@@ -0,0 +1,273 @@
+"""Grabación de los comandos de dibujo y reproducción fuera de pantalla"""
+
+import difflib
+import hashlib
+import json
+import weakref
+import numpy as np
+import pygame
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Versión del formato de los archivos de grabación
+RECORDING_FORMAT = 2
+
+
+def _rect(rect) -> Optional[Tuple[int, int, int, int]]:
+    """Rectángulo como tupla de enteros (None se queda en None)"""
+    if rect is None:
+        return None
+    return tuple(pygame.Rect(rect))
+
+
+class RenderRecording:
+    """
+    Comandos de dibujo de uno o varios frames y las superficies que usan
+
+    Cada frame es una lista de tuplas de datos simples:
+    ("blit", id, x, y, área, flags), ("fill", color, rect, flags),
+    ("clip", rect) y ("effect", nombre, color, peso, rect). Las superficies
+    se identifican por un hash de su contenido, así que el mismo dibujo da
+    los mismos comandos en otra ejecución o en otra versión del engine y las
+    grabaciones se pueden comparar con diff().
+    """
+
+    def __init__(self, size: Sequence[int]):
+        """
+        Inicializa una grabación vacía
+
+        Args:
+            size: Tamaño del destino grabado
+        """
+        self.size = (size[0], size[1])
+        self.frames: List[List[tuple]] = []
+        self.surfaces: Dict[str, pygame.Surface] = {}
+        self._effects = None
+
+    def replay(self, surface: pygame.Surface, frame: int = -1):
+        """
+        Dibuja un frame grabado en una superficie
+
+        Los blits seguidos se vuelcan con un solo blits().
+
+        Args:
+            surface: Destino (del tamaño grabado)
+            frame: Índice del frame (por defecto, el último)
+        """
+        surfaces = self.surfaces
+        batch = []
+        for command in self.frames[frame]:
+            op = command[0]
+            if op == "blit":
+                _, sid, x, y, area, flags = command
+                batch.append((surfaces[sid], (x, y), area, flags))
+                continue
+            if batch:
+                surface.blits(batch, doreturn=False)
+                batch = []
+            if op == "fill":
+                surface.fill(command[1], command[2], command[3])
+            elif op == "clip":
+                surface.set_clip(command[1])
+            elif op == "effect":
+                if self._effects is None:
+                    from src.render.postfx import PostEffects
+                    self._effects = PostEffects()
+                _, name, color, weight, rect = command
+                self._effects.apply_effect(surface, name, color, weight, rect)
+        if batch:
+            surface.blits(batch, doreturn=False)
+        surface.set_clip(None)
+
+    def lines(self, frame: int = -1) -> List[str]:
+        """Comandos de un frame como líneas de texto (una por comando)"""
+        return [" ".join("-" if value is None else str(value) for value in command)
+                for command in self.frames[frame]]
+
+    def diff(self, other: "RenderRecording", frame: int = -1) -> List[str]:
+        """
+        Compara un frame con el de otra grabación
+
+        Returns:
+            Líneas de un diff unificado (vacío si los comandos son iguales)
+        """
+        return list(difflib.unified_diff(other.lines(frame), self.lines(frame), "antes", "después", lineterm=""))
+
+    def save(self, path: str):
+        """
+        Guarda la grabación comprimida (.npz sin objetos de Python)
+
+        Los comandos y los datos de las superficies van en JSON y los píxeles
+        como bytes, así que cargar una grabación de otro proceso o de otra
+        versión no ejecuta código.
+
+        Args:
+            path: Archivo de destino
+        """
+        surfaces = {}
+        arrays = {}
+        for sid, surface in self.surfaces.items():
+            # Las opacas se guardan en RGB: tobytes("RGBA") pone alfa 0 en el colorkey
+            alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+            colorkey = surface.get_colorkey()
+            surfaces[sid] = {"size": list(surface.get_size()), "per_pixel_alpha": alpha,
+                             "colorkey": list(colorkey[:3]) if colorkey else None,
+                             "alpha": surface.get_alpha()}
+            pixels = pygame.image.tobytes(surface, "RGBA" if alpha else "RGB")
+            arrays[f"surface_{sid}"] = np.frombuffer(pixels, dtype=np.uint8)
+        meta = {"format": RECORDING_FORMAT, "size": list(self.size), "frames": self.frames, "surfaces": surfaces}
+        arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+        # Con un archivo abierto savez no añade la extensión .npz a la ruta
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "RenderRecording":
+        """
+        Carga una grabación guardada con save()
+
+        Args:
+            path: Archivo de la grabación
+
+        Returns:
+            Grabación lista para reproducir
+        """
+        has_display = pygame.display.get_surface() is not None
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+            if meta.get("format") != RECORDING_FORMAT:
+                raise ValueError(f"Formato de grabación desconocido: {meta.get('format')}")
+            recording = cls(meta["size"])
+            # JSON devuelve listas: los comandos y sus rectángulos y colores son tuplas
+            recording.frames = [[tuple(tuple(value) if isinstance(value, list) else value for value in command)
+                                 for command in frame] for frame in meta["frames"]]
+            for sid, info in meta["surfaces"].items():
+                pixels = data[f"surface_{sid}"].tobytes()
+                per_pixel_alpha = info["per_pixel_alpha"]
+                surface = pygame.image.frombuffer(pixels, tuple(info["size"]), "RGBA" if per_pixel_alpha else "RGB")
+                # frombuffer comparte la memoria de pixels: convert() y copy() la copian
+                if has_display:
+                    surface = surface.convert_alpha() if per_pixel_alpha else surface.convert()
+                else:
+                    surface = surface.copy()
+                if info["colorkey"] is not None:
+                    surface.set_colorkey(info["colorkey"], pygame.RLEACCEL)
+                alpha = info["alpha"]
+                if alpha is not None and alpha != 255:
+                    surface.set_alpha(alpha)
+                recording.surfaces[sid] = surface
+        return recording
+
+
+class RecordingCanvas:
+    """
+    Destino de dibujo con la interfaz de pygame.Surface que usan las escenas
+    (como TextureCanvas) que anota comandos en una RenderRecording en lugar
+    de dibujar
+
+    Cada superficie se identifica la primera vez que se dibuja por un hash
+    de sus píxeles, tamaño, colorkey y alfa; como en el backend de texturas,
+    las superficies que se dibujan no deben modificarse después. Los
+    dibujos directos (pygame.draw) se hacen en una superficie transparente y
+    se graban como un blit de la zona tocada.
+    """
+
+    def __init__(self, size: Sequence[int]):
+        """
+        Inicializa el destino
+
+        Args:
+            size: Tamaño del destino (el de la pantalla)
+        """
+        self.size = (size[0], size[1])
+        self.recording = RenderRecording(self.size)
+        self.commands: List[tuple] = []
+        self._ids: "weakref.WeakKeyDictionary[pygame.Surface, str]" = weakref.WeakKeyDictionary()
+        self._clip: Optional[pygame.Rect] = None
+        self._scratch: Optional[pygame.Surface] = None
+        self._scratch_rect: Optional[pygame.Rect] = None
+        self.hashed = 0
+
+    def begin_frame(self):
+        """Empieza la lista de comandos de un frame nuevo"""
+        self.commands = []
+        self.recording.frames.append(self.commands)
+        self._clip = None
+
+    def get_size(self) -> Tuple[int, int]:
+        """Tamaño del destino"""
+        return self.size
+
+    def get_width(self) -> int:
+        """Ancho del destino"""
+        return self.size[0]
+
+    def get_height(self) -> int:
+        """Alto del destino"""
+        return self.size[1]
+
+    def get_rect(self, **kwargs) -> pygame.Rect:
+        """Rectángulo del destino (admite los mismos argumentos que Surface.get_rect)"""
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def surface_id(self, surface: pygame.Surface) -> str:
+        """
+        Identificador de una superficie (hash de su contenido, se calcula una vez)
+
+        Returns:
+            Identificador en hexadecimal
+        """
+        sid = self._ids.get(surface)
+        if sid is None:
+            digest = hashlib.blake2b(digest_size=8)
+            digest.update(repr((surface.get_size(), surface.get_flags() & pygame.SRCALPHA,
+                                surface.get_colorkey(), surface.get_alpha())).encode())
+            digest.update(pygame.image.tobytes(surface, "RGBA"))
+            sid = self._ids[surface] = digest.hexdigest()
+            self.recording.surfaces.setdefault(sid, surface)
+            self.hashed += 1
+        return sid
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0):
+        """Graba un blit como Surface.blit() (no devuelve el rectángulo)"""
+        # Surface.blit trunca las posiciones con decimales
+        self.commands.append(("blit", self.surface_id(source), int(dest[0]), int(dest[1]),
+                              _rect(area), special_flags))
+
+    def blits(self, sequence, doreturn: bool = True):
+        """Graba una secuencia de (superficie, destino[, zona[, flags]])"""
+        blit = self.blit
+        for item in sequence:
+            blit(*item)
+
+    def fill(self, color, rect=None, special_flags: int = 0):
+        """Graba un relleno con un color"""
+        self.commands.append(("fill", tuple(pygame.Color(color)), _rect(rect), special_flags))
+
+    def set_clip(self, rect=None):
+        """Graba el cambio de la región de recorte"""
+        self._clip = None if rect is None else pygame.Rect(rect)
+        self.commands.append(("clip", _rect(rect)))
+
+    def get_clip(self) -> pygame.Rect:
+        """Región de recorte actual"""
+        return self._clip.copy() if self._clip is not None else self.get_rect()
+
+    def draw_direct(self, draw: Callable[[pygame.Surface], None]):
+        """Ejecuta un dibujo directo y graba la zona que toca como un blit"""
+        if self._scratch is None:
+            self._scratch = pygame.Surface(self.size, pygame.SRCALPHA)
+        scratch = self._scratch
+        if self._scratch_rect:
+            scratch.fill((0, 0, 0, 0), self._scratch_rect)
+        draw(scratch)
+        rect = self._scratch_rect = scratch.get_bounding_rect()
+        if rect.width and rect.height:
+            # La copia se identifica por contenido: los dibujos repetidos comparten imagen
+            self.blit(scratch.subsurface(rect).copy(), rect.topleft)
+
+    def record_effect(self, name: str, color: Sequence[int], weight: int, rect=None):
+        """Graba un efecto de postproceso (ver PostEffects)"""
+        self.commands.append(("effect", name, tuple(color), weight, _rect(rect)))
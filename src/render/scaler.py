@@ -0,0 +1,105 @@
+"""Dibujo a resolución interna y escalado a la ventana"""
+
+import pygame
+from typing import Optional, Sequence, Tuple
+
+
+class RenderScaler:
+    """
+    Superficie de dibujo a resolución interna que se escala a la ventana
+
+    Las escenas dibujan sobre la superficie que reciben, así que basta darles
+    una superficie fuera de pantalla del tamaño interno y escalarla a la
+    ventana al presentar. En modo "integer" se escala por el mayor
+    factor entero que cabe (vecino más cercano, píxeles nítidos) y se centra
+    con bandas negras; con "smooth" se usa smoothscale manteniendo la
+    proporción. Las superficies de destino se crean una vez: presentar no
+    reserva memoria.
+    """
+
+    MODES = ("integer", "smooth")
+
+    def __init__(self, size: Sequence[int], window_size: Sequence[int], mode: str = "integer"):
+        """
+        Inicializa el escalador
+
+        Args:
+            size: Resolución interna a la que dibujan las escenas
+            window_size: Tamaño de la ventana
+            mode: "integer" (factor entero, vecino más cercano) o "smooth"
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de escalado desconocido: {mode}")
+        self.size = (int(size[0]), int(size[1]))
+        self.window_size = (int(window_size[0]), int(window_size[1]))
+        self.mode = mode
+        self.dest_rect = self.fit()
+        self.surface: Optional[pygame.Surface] = None
+        self._window: Optional[pygame.Surface] = None
+        self._dest: Optional[pygame.Surface] = None
+        self.presents = 0
+
+    @property
+    def active(self) -> bool:
+        """Si hace falta escalar (la resolución interna no es la de la ventana)"""
+        return self.size != self.window_size
+
+    def fit(self) -> pygame.Rect:
+        """
+        Calcula dónde queda la imagen escalada dentro de la ventana
+
+        Returns:
+            Rectángulo de la ventana que ocupa la imagen
+        """
+        width, height = self.size
+        window_width, window_height = self.window_size
+        scale = min(window_width / width, window_height / height)
+        if self.mode == "integer" and scale >= 1:
+            scale = int(scale)
+        rect = pygame.Rect(0, 0, max(1, round(width * scale)), max(1, round(height * scale)))
+        rect.center = (window_width // 2, window_height // 2)
+        return rect
+
+    def target(self, window: pygame.Surface) -> pygame.Surface:
+        """
+        Obtiene la superficie donde dibujar el frame
+
+        Args:
+            window: Superficie de la ventana
+
+        Returns:
+            La propia ventana si no se escala, o la superficie interna
+        """
+        if not self.active:
+            return window
+        if window is not self._window:
+            # Ventana nueva (p. ej. tras set_mode): se rehacen las superficies
+            self._window = window
+            self.surface = pygame.Surface(self.size).convert(window)
+            window.fill((0, 0, 0))
+            self._dest = window.subsurface(self.dest_rect)
+        return self.surface
+
+    def present(self):
+        """Escala la superficie interna a la ventana (no hace nada si no se escala)"""
+        if not self.active or self.surface is None:
+            return
+        if self.mode == "smooth":
+            pygame.transform.smoothscale(self.surface, self.dest_rect.size, self._dest)
+        else:
+            pygame.transform.scale(self.surface, self.dest_rect.size, self._dest)
+        self.presents += 1
+
+    def to_internal(self, pos: Sequence[float]) -> Tuple[int, int]:
+        """
+        Convierte una posición de la ventana (p. ej. del ratón) a la resolución interna
+
+        Args:
+            pos: Posición en la ventana
+
+        Returns:
+            Posición en la superficie interna
+        """
+        rect = self.dest_rect
+        return (int((pos[0] - rect.x) * self.size[0] / rect.width),
+                int((pos[1] - rect.y) * self.size[1] / rect.height))
@@ -0,0 +1,151 @@
+"""Capa pre-dibujada con la geometría estática, por bloques"""
+
+import pygame
+from collections import OrderedDict
+from typing import Iterable, Optional, Sequence, Tuple
+
+from src.config import STATIC_CHUNK_SIZE, STATIC_CHUNK_CACHE
+
+
+class StaticLayer:
+    """
+    Entidades estáticas compuestas de antemano en bloques de la capa
+
+    Plataformas, paredes y púas no cambian tras crearse, así que se dibujan
+    una vez en bloques de chunk_size x chunk_size píxeles del mundo y cada
+    frame basta copiar los bloques que tocan la vista. Los bloques se
+    dibujan la primera vez que se ven y se guardan en una caché que descarta
+    los menos usados, así que la memoria y el coste no dependen del tamaño
+    del mundo. Añadir o quitar una entidad estática descarta solo los
+    bloques que toca. Con un color transparente la capa se dibuja encima de
+    un fondo que se mueve por separado (p. ej. parallax).
+    """
+
+    def __init__(self, size: Sequence[int], colorkey: Optional[Tuple[int, int, int]] = None,
+                 chunk_size: int = STATIC_CHUNK_SIZE, max_chunks: int = STATIC_CHUNK_CACHE):
+        """
+        Inicializa la capa
+
+        Args:
+            size: Tamaño de la capa (el de la pantalla o el del mundo)
+            colorkey: Color transparente de la capa (None = capa opaca)
+            chunk_size: Lado de los bloques en píxeles
+            max_chunks: Bloques dibujados que se conservan como máximo
+        """
+        self.size = (size[0], size[1])
+        self.colorkey = colorkey
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        # (columna, fila) del bloque -> superficie (None si está vacío)
+        self._chunks: "OrderedDict[Tuple[int, int], Optional[pygame.Surface]]" = OrderedDict()
+        # Cambia con cada invalidación (la escena lo usa para saber si redibujar todo)
+        self.version = 0
+        self.builds = 0
+        self.evictions = 0
+
+    def resize(self, size: Sequence[int]):
+        """
+        Cambia el tamaño de la capa
+
+        No reserva nada ni descarta bloques: su contenido no depende del
+        tamaño y los nuevos se dibujan al verse.
+        """
+        self.size = (size[0], size[1])
+
+    def invalidate(self, rect: Optional[pygame.Rect] = None):
+        """
+        Descarta bloques; se volverán a dibujar al verse
+
+        Args:
+            rect: Región del mundo que ha cambiado (None = toda la capa)
+        """
+        if rect is None:
+            self._chunks.clear()
+        else:
+            for key in list(self.chunks_in(rect)):
+                self._chunks.pop(key, None)
+        self.version += 1
+
+    def chunks_in(self, area: pygame.Rect) -> Iterable[Tuple[int, int]]:
+        """Bloques de la capa que tocan una región del mundo"""
+        size = self.chunk_size
+        x0 = max(0, area.left // size)
+        x1 = min((self.size[0] - 1) // size, (area.right - 1) // size)
+        y0 = max(0, area.top // size)
+        y1 = min((self.size[1] - 1) // size, (area.bottom - 1) // size)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                yield cx, cy
+
+    def chunk(self, cx: int, cy: int, entities: Iterable) -> Optional[pygame.Surface]:
+        """
+        Obtiene la superficie de un bloque (la dibuja si no está en caché)
+
+        Returns:
+            Superficie del bloque, o None si no tiene entidades estáticas
+        """
+        key = (cx, cy)
+        if key in self._chunks:
+            self._chunks.move_to_end(key)
+            return self._chunks[key]
+        surface = self.render_chunk(cx, cy, entities)
+        self._chunks[key] = surface
+        if len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def render_chunk(self, cx: int, cy: int, entities: Iterable) -> Optional[pygame.Surface]:
+        """Dibuja las entidades estáticas que tocan un bloque en una superficie nueva"""
+        size = self.chunk_size
+        area = pygame.Rect(cx * size, cy * size, size, size)
+        inside = [entity for entity in entities if entity.static and area.colliderect(entity.get_draw_rect())]
+        if not inside:
+            return None
+        surface = pygame.Surface((size, size))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(self.colorkey if self.colorkey is not None else (0, 0, 0))
+        for entity in inside:
+            # Copia desplazada al origen del bloque: la original la sigue
+            # usando la simulación (colisiones) mientras se dibuja
+            proxy = object.__new__(type(entity))
+            proxy.__dict__.update(entity.__dict__)
+            proxy.x = entity.x - area.x
+            proxy.y = entity.y - area.y
+            proxy.rect = entity.rect.move(-area.x, -area.y)
+            try:
+                proxy.draw(surface)
+            except Exception as e:
+                print(f"Error dibujando entidad estática: {e}")
+        if self.colorkey is not None:
+            # RLE: las zonas transparentes se saltan sin leer píxeles
+            surface.set_colorkey(self.colorkey, pygame.RLEACCEL)
+        self.builds += 1
+        return surface
+
+    def draw(self, surface: pygame.Surface, viewport: pygame.Rect, entities: Iterable,
+             area: Optional[pygame.Rect] = None):
+        """
+        Dibuja los bloques visibles con un solo blits()
+
+        Args:
+            surface: Pantalla
+            viewport: Región del mundo que se ve (la de la cámara)
+            entities: Entidades de la escena (solo se dibujan las estáticas)
+            area: Región del mundo a la que se limita (por defecto, la vista)
+        """
+        size = self.chunk_size
+        ox, oy = viewport.topleft
+        batch = []
+        for cx, cy in self.chunks_in(viewport if area is None else area):
+            chunk = self.chunk(cx, cy, entities)
+            if chunk is not None:
+                batch.append((chunk, (cx * size - ox, cy * size - oy)))
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+    @property
+    def cached_chunks(self) -> int:
+        """Número de bloques en caché"""
+        return len(self._chunks)
@@ -0,0 +1,86 @@
+"""Caché de fuentes y de textos renderizados"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class TextCache:
+    """
+    Reutiliza fuentes y superficies de texto entre frames
+
+    Crear un pygame.font.Font abre y analiza el archivo de la fuente, y
+    render() rasteriza el texto: ninguna de las dos cosas debería hacerse
+    cada frame. Las fuentes se guardan por (fuente, tamaño) y los textos por
+    (texto, color, fuente); los textos se descartan por antigüedad de uso
+    cuando se supera max_texts.
+    """
+
+    def __init__(self, max_texts: int = 256):
+        """
+        Inicializa la caché
+
+        Args:
+            max_texts: Máximo de superficies de texto que se conservan
+        """
+        self.max_texts = max_texts
+        self.fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.texts: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, face: Optional[str], size: int) -> pygame.font.Font:
+        """
+        Obtiene una fuente
+
+        Args:
+            face: Ruta del archivo de fuente (None = fuente por defecto de pygame)
+            size: Tamaño en puntos
+        """
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self.fonts[key] = pygame.font.Font(face, size)
+        return font
+
+    def render(self, text: str, color: Tuple[int, ...], face: Optional[str] = None,
+               size: int = 24, antialias: bool = True) -> pygame.Surface:
+        """
+        Obtiene la superficie de un texto, renderizándolo solo la primera vez
+
+        Args:
+            text: Texto a dibujar
+            color: Color RGB
+            face: Ruta del archivo de fuente (None = fuente por defecto)
+            size: Tamaño en puntos
+            antialias: Si se suavizan los bordes
+
+        Returns:
+            Superficie compartida (no modificarla)
+        """
+        key = (text, tuple(color), face, size, antialias)
+        surface = self.texts.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.texts.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.font(face, size).render(text, antialias, color)
+        if pygame.display.get_surface() is not None:
+            # Mismo formato que la pantalla: blits más rápidos
+            surface = surface.convert_alpha()
+        self.texts[key] = surface
+        if len(self.texts) > self.max_texts:
+            self.texts.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Descarta fuentes y textos (p. ej. tras pygame.quit())"""
+        self.fonts.clear()
+        self.texts.clear()
+
+
+# Caché global compartida por escenas y overlays
+text_cache = TextCache()
@@ -0,0 +1,301 @@
+"""Mapa de tiles dibujado por bloques pre-renderizados"""
+
+import numpy as np
+import pygame
+from collections import OrderedDict
+from typing import Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from src.config import TILE_SIZE, TILE_CHUNK_TILES, TILE_CHUNK_CACHE
+
+# Color transparente de los bloques cuando los tiles no tienen alfa
+CHUNK_COLORKEY = (255, 0, 255)
+
+
+def make_tiles(colors: Sequence[Sequence[int]], size: int = TILE_SIZE) -> List[Optional[pygame.Surface]]:
+    """
+    Crea tiles lisos con borde a partir de colores (niveles sin hoja de tiles)
+
+    Args:
+        colors: Color RGB de cada tile, desde el índice 1
+        size: Lado del tile en píxeles
+
+    Returns:
+        Imágenes por índice; la 0 es None (tile vacío)
+    """
+    tiles: List[Optional[pygame.Surface]] = [None]
+    for color in colors:
+        image = pygame.Surface((size, size))
+        image.fill(color)
+        border = tuple(max(0, c - 40) for c in color[:3])
+        pygame.draw.rect(image, border, image.get_rect(), 2)
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+        tiles.append(image)
+    return tiles
+
+
+class TileCollider:
+    """Bloque de tiles sólidos con la interfaz de colisión de una plataforma (rect)"""
+
+    def __init__(self, rect: pygame.Rect):
+        """
+        Inicializa el bloque
+
+        Args:
+            rect: Rectángulo en coordenadas del mundo
+        """
+        self.rect = rect
+
+
+class TileMap:
+    """
+    Capa de tiles guardada como un array compacto de índices
+
+    El mapa se divide en bloques de chunk_tiles x chunk_tiles tiles. Cada
+    bloque se dibuja en su propia superficie la primera vez que se ve y se
+    guarda en una caché que descarta los menos usados; al dibujar solo se
+    copian los bloques que tocan la vista, así que el coste no depende del
+    tamaño del nivel. Cambiar un tile descarta solo el bloque que lo contiene.
+    """
+
+    def __init__(self, columns: int, rows: int, tiles: Sequence[Optional[pygame.Surface]],
+                 tile_size: int = TILE_SIZE, chunk_tiles: int = TILE_CHUNK_TILES,
+                 max_chunks: int = TILE_CHUNK_CACHE, solid: Optional[Iterable[int]] = None):
+        """
+        Inicializa un mapa vacío
+
+        Args:
+            columns: Ancho del mapa en tiles
+            rows: Alto del mapa en tiles
+            tiles: Imagen de cada índice (la 0 es el tile vacío y no se dibuja)
+            tile_size: Lado del tile en píxeles
+            chunk_tiles: Lado del bloque en tiles
+            max_chunks: Bloques dibujados que se conservan como máximo
+            solid: Índices que colisionan (por defecto, todos menos el 0)
+        """
+        self.columns = columns
+        self.rows = rows
+        self.tiles = list(tiles)
+        self.tile_size = tile_size
+        self.chunk_tiles = chunk_tiles
+        self.chunk_size = tile_size * chunk_tiles
+        self.max_chunks = max_chunks
+        self.data = np.zeros((rows, columns), dtype=np.uint8 if len(self.tiles) <= 256 else np.uint16)
+        solid = range(1, len(self.tiles)) if solid is None else solid
+        self._solid = np.zeros(len(self.tiles), dtype=bool)
+        self._solid[list(solid)] = True
+        # Con tiles con alfa los bloques son SRCALPHA; si no, color transparente
+        self.alpha = any(image is not None and image.get_flags() & pygame.SRCALPHA for image in self.tiles)
+        # (columna, fila) del bloque -> superficie (None si está vacío)
+        self._chunks: "OrderedDict[Tuple[int, int], Optional[pygame.Surface]]" = OrderedDict()
+        # Cambia con cada edición (la escena lo usa para saber si redibujar todo)
+        self.version = 0
+        self.builds = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[str], legend: Mapping[str, int],
+                  tiles: Sequence[Optional[pygame.Surface]], **kwargs) -> "TileMap":
+        """
+        Crea un mapa a partir de filas de texto
+
+        Args:
+            rows: Una cadena por fila; cada carácter es un tile
+            legend: Carácter -> índice (los que no aparecen son tiles vacíos)
+            tiles: Imagen de cada índice
+            **kwargs: Resto de parámetros de TileMap
+
+        Returns:
+            Mapa con los tiles de las filas
+        """
+        tilemap = cls(max((len(row) for row in rows), default=0), len(rows), tiles, **kwargs)
+        for y, row in enumerate(rows):
+            for x, char in enumerate(row):
+                index = legend.get(char, 0)
+                if index:
+                    tilemap.data[y, x] = index
+        return tilemap
+
+    @property
+    def width(self) -> int:
+        """Ancho del mapa en píxeles"""
+        return self.columns * self.tile_size
+
+    @property
+    def height(self) -> int:
+        """Alto del mapa en píxeles"""
+        return self.rows * self.tile_size
+
+    def get_tile(self, column: int, row: int) -> int:
+        """Índice del tile en una posición (0 fuera del mapa)"""
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return int(self.data[row, column])
+        return 0
+
+    def set_tile(self, column: int, row: int, index: int):
+        """
+        Cambia un tile y descarta solo el bloque que lo contiene
+
+        Las posiciones fuera del mapa se ignoran (como en get_tile).
+
+        Args:
+            column: Columna del tile
+            row: Fila del tile
+            index: Nuevo índice
+        """
+        if not (0 <= column < self.columns and 0 <= row < self.rows):
+            return
+        if self.data[row, column] == index:
+            return
+        self.data[row, column] = index
+        self._chunks.pop((column // self.chunk_tiles, row // self.chunk_tiles), None)
+        self.version += 1
+
+    def fill(self, column: int, row: int, columns: int, rows: int, index: int):
+        """
+        Rellena un rectángulo de tiles y descarta los bloques que toca
+
+        El rectángulo se recorta al mapa: lo que queda fuera se ignora.
+
+        Args:
+            column: Columna de la esquina superior izquierda
+            row: Fila de la esquina superior izquierda
+            columns: Ancho en tiles
+            rows: Alto en tiles
+            index: Índice con el que se rellena
+        """
+        # Sin recortar, los índices negativos de NumPy escribirían el borde opuesto
+        right = min(column + columns, self.columns)
+        bottom = min(row + rows, self.rows)
+        column = max(column, 0)
+        row = max(row, 0)
+        columns = right - column
+        rows = bottom - row
+        if columns <= 0 or rows <= 0:
+            return
+        self.data[row:bottom, column:right] = index
+        n = self.chunk_tiles
+        for cy in range(row // n, (row + rows - 1) // n + 1):
+            for cx in range(column // n, (column + columns - 1) // n + 1):
+                self._chunks.pop((cx, cy), None)
+        self.version += 1
+
+    def chunk(self, cx: int, cy: int) -> Optional[pygame.Surface]:
+        """
+        Obtiene la superficie de un bloque (la dibuja si no está en caché)
+
+        Returns:
+            Superficie del bloque, o None si no tiene tiles
+        """
+        key = (cx, cy)
+        if key in self._chunks:
+            self._chunks.move_to_end(key)
+            return self._chunks[key]
+        surface = self.render_chunk(cx, cy)
+        self._chunks[key] = surface
+        self.builds += 1
+        if len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def render_chunk(self, cx: int, cy: int) -> Optional[pygame.Surface]:
+        """Dibuja los tiles de un bloque en una superficie nueva"""
+        n = self.chunk_tiles
+        block = self.data[cy * n:(cy + 1) * n, cx * n:(cx + 1) * n]
+        if not block.any():
+            return None
+        size = self.tile_size
+        has_display = pygame.display.get_surface() is not None
+        if self.alpha:
+            surface = pygame.Surface((self.chunk_size, self.chunk_size), pygame.SRCALPHA)
+            if has_display:
+                surface = surface.convert_alpha()
+            surface.fill((0, 0, 0, 0))
+        else:
+            surface = pygame.Surface((self.chunk_size, self.chunk_size))
+            if has_display:
+                surface = surface.convert()
+            surface.fill(CHUNK_COLORKEY)
+        tiles = self.tiles
+        rows, columns = np.nonzero(block)
+        indices = block[rows, columns].tolist()
+        surface.blits([(tiles[index], (x * size, y * size))
+                       for index, y, x in zip(indices, rows.tolist(), columns.tolist()) if tiles[index] is not None],
+                      doreturn=False)
+        if not self.alpha:
+            # RLE: las zonas vacías del bloque se saltan sin leer píxeles
+            surface.set_colorkey(CHUNK_COLORKEY, pygame.RLEACCEL)
+        return surface
+
+    def visible_chunks(self, viewport: pygame.Rect) -> Iterable[Tuple[int, int]]:
+        """Bloques que tocan una región del mundo"""
+        size = self.chunk_size
+        last_x = (self.columns - 1) // self.chunk_tiles
+        last_y = (self.rows - 1) // self.chunk_tiles
+        x0 = max(0, viewport.left // size)
+        x1 = min(last_x, (viewport.right - 1) // size)
+        y0 = max(0, viewport.top // size)
+        y1 = min(last_y, (viewport.bottom - 1) // size)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                yield cx, cy
+
+    def draw(self, surface: pygame.Surface, viewport: pygame.Rect):
+        """
+        Dibuja los bloques visibles con un solo blits()
+
+        Args:
+            surface: Pantalla
+            viewport: Región del mundo que se ve (la de la cámara)
+        """
+        size = self.chunk_size
+        ox, oy = viewport.topleft
+        batch = []
+        for cx, cy in self.visible_chunks(viewport):
+            chunk = self.chunk(cx, cy)
+            if chunk is not None:
+                batch.append((chunk, (cx * size - ox, cy * size - oy)))
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+    def colliders(self, area: pygame.Rect) -> List[TileCollider]:
+        """
+        Bloques sólidos que tocan una región (para las colisiones del jugador)
+
+        Los tiles sólidos seguidos de cada fila se juntan en un solo rectángulo.
+
+        Args:
+            area: Región del mundo
+
+        Returns:
+            Un TileCollider por tramo de tiles sólidos
+        """
+        size = self.tile_size
+        x0 = max(0, area.left // size)
+        x1 = min(self.columns, (area.right - 1) // size + 1)
+        y0 = max(0, area.top // size)
+        y1 = min(self.rows, (area.bottom - 1) // size + 1)
+        if x0 >= x1 or y0 >= y1:
+            return []
+        solid = self._solid[self.data[y0:y1, x0:x1]]
+        result = []
+        for dy, row in enumerate(solid.tolist()):
+            start = None
+            for dx, value in enumerate(row + [False]):
+                if value and start is None:
+                    start = dx
+                elif not value and start is not None:
+                    result.append(TileCollider(pygame.Rect((x0 + start) * size, (y0 + dy) * size,
+                                                           (dx - start) * size, size)))
+                    start = None
+        return result
+
+    def clear_cache(self):
+        """Descarta todos los bloques dibujados"""
+        self._chunks.clear()
+
+    @property
+    def cached_chunks(self) -> int:
+        """Número de bloques en caché"""
+        return len(self._chunks)
@@ -0,0 +1,105 @@
+"""Caché de sprites volteados, escalados y rotados"""
+
+import pygame
+from collections import OrderedDict
+from typing import Tuple, Union
+from src.config import TRANSFORM_CACHE_BYTES
+
+
+class TransformCache:
+    """
+    Guarda las variantes transformadas de las superficies
+
+    pygame.transform crea una superficie nueva en cada llamada; voltear un
+    sprite grande cada frame es una reserva de memoria y una copia completa
+    por frame. Las variantes se guardan por (superficie, volteo x/y, tamaño,
+    paso de rotación) y se descartan por antigüedad de uso cuando se supera
+    el presupuesto de bytes.
+    """
+
+    def __init__(self, budget_bytes: int = 64 * 1024 * 1024, rotation_steps: int = 72):
+        """
+        Inicializa la caché
+
+        Args:
+            budget_bytes: Memoria máxima de las variantes guardadas
+            rotation_steps: Ángulos distintos por vuelta (los ángulos se redondean al paso)
+        """
+        self.budget_bytes = budget_bytes
+        self.rotation_steps = rotation_steps
+        self.entries: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, surface: pygame.Surface, flip_x: bool = False, flip_y: bool = False,
+            scale: Union[float, Tuple[int, int]] = 1.0, angle: float = 0.0,
+            smooth: bool = False) -> pygame.Surface:
+        """
+        Obtiene una variante transformada de una superficie
+
+        Args:
+            surface: Superficie original (no debe modificarse mientras esté en caché)
+            flip_x: Voltear en horizontal
+            flip_y: Voltear en vertical
+            scale: Factor de escala o tamaño final (ancho, alto)
+            angle: Rotación en grados (sentido antihorario)
+            smooth: Escalar con smoothscale en lugar de scale
+
+        Returns:
+            Superficie compartida (no modificarla)
+        """
+        if isinstance(scale, (int, float)):
+            size = (surface.get_width(), surface.get_height()) if scale == 1.0 else \
+                (max(1, round(surface.get_width() * scale)), max(1, round(surface.get_height() * scale)))
+        else:
+            size = (scale[0], scale[1])
+        step = round(angle * self.rotation_steps / 360.0) % self.rotation_steps
+        if not flip_x and not flip_y and step == 0 and size == surface.get_size():
+            return surface
+
+        key = (surface, flip_x, flip_y, size, step, smooth)
+        variant = self.entries.get(key)
+        if variant is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return variant
+
+        self.misses += 1
+        variant = surface
+        if flip_x or flip_y:
+            variant = pygame.transform.flip(variant, flip_x, flip_y)
+        if size != variant.get_size():
+            variant = (pygame.transform.smoothscale if smooth else pygame.transform.scale)(variant, size)
+        if step:
+            variant = pygame.transform.rotate(variant, step * 360.0 / self.rotation_steps)
+
+        cost = self.size_of(variant)
+        if cost <= self.budget_bytes:
+            self.entries[key] = variant
+            self.bytes += cost
+            while self.bytes > self.budget_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.bytes -= self.size_of(evicted)
+                self.evictions += 1
+        return variant
+
+    @staticmethod
+    def size_of(surface: pygame.Surface) -> int:
+        """Bytes que ocupan los píxeles de una superficie"""
+        return surface.get_pitch() * surface.get_height()
+
+    def stats(self) -> dict:
+        """Estadísticas de uso: aciertos, fallos, descartes, entradas y bytes"""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self.entries), "bytes": self.bytes}
+
+    def clear(self):
+        """Descarta todas las variantes"""
+        self.entries.clear()
+        self.bytes = 0
+
+
+# Caché global compartida por entidades y efectos
+transform_cache = TransformCache(TRANSFORM_CACHE_BYTES)
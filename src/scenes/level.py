@@ -1,33 +1,68 @@
 """Escena de nivel del juego"""
 
+import copy
 import pygame
 import os
-import glob
-import sys
+from typing import List, Optional
 from src.scenes.scene import Scene
 from src.entities.player import Player
 from src.entities.world import Platform, Wall, Spike, Collectible
 from src.entities.enemy import SimpleEnemy
 from src.utils.collision import CollisionManager
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_JUMP_POWER
-
-
-def get_base_path():
-    """Obtiene la ruta base de la aplicacion (compatible con PyInstaller)"""
-    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-        # Ejecutable PyInstaller - usa MEIPASS
-        return sys._MEIPASS
-    elif getattr(sys, 'frozen', False):
-        # Ejecutable PyInstaller sin MEIPASS
-        return os.path.dirname(sys.executable)
-    else:
-        # Ejecucion desde script
-        return os.getcwd()
+from src.render.camera import Camera
+from src.render.parallax import ParallaxBackground, ParallaxLayer
+from src.render.particles import ParticleEmitter, particle_frames
+from src.render.static_layer import StaticLayer
+from src.render.tilemap import TileMap
+from src.render.text import text_cache
+from src.render.bitmap_font import BITMAP_FONTS, FONT_DIR, bitmap_font_path, load_bitmap_font
+from src.utils.scheduler import run_now
+from src.utils.tracing import tracer, traced
+from src.utils.assets import assets, find_asset, get_base_path
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_JUMP_POWER, TILE_SIZE
 
 
 class LevelScene(Scene):
     """Escena de un nivel del juego"""
     
+    # Recursos del nivel (relativos a la ruta base, admiten comodines)
+    BACKGROUND_PATTERNS = (
+        os.path.join("assets", "sprites", "PC*Castle*Background.png"),
+        os.path.join("assets", "sprites", "PC _ Computer - Rayman Legends - Levels - Outside Castle Background.png")
+    )
+    # Capas del fondo parallax, de la más lejana a la más cercana:
+    # (zona de la hoja de fondo, factor de desplazamiento, y en pantalla, alto)
+    BACKGROUND_LAYERS = (
+        (pygame.Rect(5, 302, 1024, 512), 0.0, 0, 720),      # Cielo
+        (pygame.Rect(5, 23, 1024, 256), 0.1, 20, 230),      # Nubes
+        (pygame.Rect(5, 4290, 1024, 1024), 0.2, 150, 520),  # Dos torres
+        (pygame.Rect(5, 3604, 1024, 512), 0.35, 330, 380),  # Muralla
+        (pygame.Rect(5, 5337, 1024, 512), 0.55, 430, 300),  # Aldea
+    )
+    # Color transparente de la capa de entidades estáticas
+    STATIC_COLORKEY = (255, 0, 255)
+    UI_BAR_PATH = os.path.join("assets", "sprites", "Rayman", "ui_bar_rayman_a1.png")
+    # Región de pantalla que ocupa el HUD
+    HUD_RECT = pygame.Rect(0, 0, 300, 130)
+    # Fuente de mapa de bits de los contadores del HUD y su altura en píxeles
+    HUD_FONT = "lums"
+    HUD_FONT_HEIGHT = 26
+    # Colores de las partículas: brillo de lums, humo de enemigos y polvo
+    LUM_COLORS = ((255, 215, 0), (255, 240, 120), (255, 170, 40))
+    PUFF_COLORS = ((210, 210, 215), (170, 170, 180))
+    DUST_COLORS = ((170, 140, 100), (140, 115, 85))
+    # Cada cuántos pasos suelta polvo el jugador al correr
+    DUST_INTERVAL = 4
+    # Destello del mundo al recibir daño: color, intensidad y duración (ms)
+    DAMAGE_FLASH = ((255, 40, 40), 0.45, 250.0)
+    
+    @classmethod
+    def asset_files(cls) -> List[str]:
+        """Rutas de las imágenes que usa el nivel (para decodificarlas por adelantado)"""
+        files = [find_asset(*cls.BACKGROUND_PATTERNS), find_asset(cls.UI_BAR_PATH), find_asset(Player.SPRITE_PATH),
+                 find_asset(os.path.join(FONT_DIR, BITMAP_FONTS[cls.HUD_FONT]["file"]))]
+        return [path for path in files if path]
+    
     def __init__(self, width: int, height: int):
         """Inicializa la escena de nivel"""
         super().__init__(width, height)
@@ -40,31 +75,61 @@ class LevelScene(Scene):
         self.background_loaded = False
         self.ui_bar = None
         self.ui_bar_loaded = False
+        # Contadores del HUD (con alfa premultiplicado); None = texto TrueType
+        self.hud_font = None
+        self.hud_font_loaded = False
+        # Si el engine carga los recursos en diferido, update() no los carga
+        self.assets_scheduled = False
+        self.update_count = 0
+        # HUD compuesto (alfa premultiplicado) y lo que muestra; se comparte
+        # con las instantáneas para no recomponerlo
+        self._hud = {"surface": None, "key": None, "frames": 0}
+        # Mundo del tamaño de la pantalla salvo que setup() lo amplíe
+        self.world_rect = pygame.Rect(0, 0, width, height)
+        self.camera = Camera((width, height), self.world_rect)
+        # Posiciones guardadas mientras se dibuja en coordenadas de pantalla
+        self._camera_saved = []
+        self._camera_position = (self.camera.x, self.camera.y)
+        self.static_layer = StaticLayer(self.world_rect.size, self.STATIC_COLORKEY)
+        # Capa de tiles del nivel (opcional, ver set_tilemap)
+        self.tilemap = None
         self.setup()
+        self.setup_particles()
+        self._player_on_ground = self.player.is_on_ground
+        self._player_health = self.player.health
+        self.camera.center_on(self.player.rect)
     
+    @traced("LevelScene.load_background", "assets")
     def load_background(self):
-        """Carga el fondo del nivel"""
+        """Carga el fondo del nivel: recorta y escala una vez las capas parallax de la hoja"""
+        run_now(self.load_background_steps())
+    
+    def load_background_steps(self):
+        """
+        Carga el fondo por porciones (generador para el FrameScheduler)
+        
+        Cede mientras se decodifica la hoja, tras convertirla y tras escalar
+        cada capa; el fondo se usa cuando están todas.
+        """
         if self.background_loaded:
             return
         
-        base_path = get_base_path()
         # Buscar el archivo de fondo con wildcard
-        bg_patterns = [
-            os.path.join(base_path, "assets", "sprites", "PC*Castle*Background.png"),
-            os.path.join(base_path, "assets", "sprites", "PC _ Computer - Rayman Legends - Levels - Outside Castle Background.png")
-        ]
-        
-        bg_path = None
-        for pattern in bg_patterns:
-            matches = glob.glob(pattern)
-            if matches:
-                bg_path = matches[0]
-                break
+        bg_path = find_asset(*self.BACKGROUND_PATTERNS)
         
         if bg_path and os.path.exists(bg_path):
             try:
-                self.background = pygame.image.load(bg_path).convert_alpha()
-                self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                yield from assets.wait(bg_path)
+                sheet = assets.load(bg_path).convert_alpha()
+                yield
+                background = ParallaxBackground((self.width, self.height))
+                # Las capas están definidas para la altura de pantalla por defecto
+                scale = self.height / SCREEN_HEIGHT
+                for area, factor, y, height in self.BACKGROUND_LAYERS:
+                    background.add_layer(ParallaxLayer(sheet.subsurface(area), factor,
+                                                       round(y * scale), round(height * scale)))
+                    yield
+                self.background = background
                 print(f"Fondo cargado: {bg_path}")
             except Exception as e:
                 print(f"Advertencia: No se pudo cargar fondo ({e})")
@@ -75,18 +140,24 @@ class LevelScene(Scene):
         
         self.background_loaded = True
     
+    @traced("LevelScene.load_ui_bar", "assets")
     def load_ui_bar(self):
         """Carga la barra UI de Rayman"""
+        run_now(self.load_ui_bar_steps())
+    
+    def load_ui_bar_steps(self):
+        """Carga la barra UI por porciones: decodificación, conversión y escalado"""
         if self.ui_bar_loaded:
             return
         
-        base_path = get_base_path()
-        ui_path = os.path.join(base_path, "assets", "sprites", "Rayman", "ui_bar_rayman_a1.png")
+        ui_path = os.path.join(get_base_path(), self.UI_BAR_PATH)
         if os.path.exists(ui_path):
             try:
-                self.ui_bar = pygame.image.load(ui_path).convert_alpha()
+                yield from assets.wait(ui_path)
+                ui_bar = assets.load(ui_path).convert_alpha()
+                yield
                 # Escalar la barra UI
-                self.ui_bar = pygame.transform.scale(self.ui_bar, (280, 110))
+                self.ui_bar = pygame.transform.scale(ui_bar, (280, 110))
                 print("Barra UI cargada exitosamente")
             except Exception as e:
                 print(f"Advertencia: No se pudo cargar barra UI ({e})")
@@ -97,6 +168,83 @@ class LevelScene(Scene):
         
         self.ui_bar_loaded = True
     
+    @traced("LevelScene.load_hud_font", "assets")
+    def load_hud_font(self):
+        """Recorta la hoja de números de lums para los contadores del HUD"""
+        run_now(self.load_hud_font_steps())
+    
+    def load_hud_font_steps(self):
+        """Carga la fuente del HUD por porciones: decodificación, recorte y premultiplicado"""
+        if self.hud_font_loaded:
+            return
+        try:
+            path = bitmap_font_path(self.HUD_FONT)
+            if path:
+                yield from assets.wait(path)
+            font = load_bitmap_font(self.HUD_FONT, self.HUD_FONT_HEIGHT)
+            yield
+            self.hud_font = font.premultiplied() if font else None
+        except Exception as e:
+            print(f"Advertencia: No se pudo cargar la fuente del HUD ({e})")
+            self.hud_font = None
+        self.hud_font_loaded = True
+    
+    def load_assets(self):
+        """Carga fondo, barra UI, fuente del HUD y sprites del jugador de una vez"""
+        self.load_background()
+        self.load_ui_bar()
+        self.load_hud_font()
+        self.player.load_sprites()
+    
+    def schedule_assets(self, scheduler):
+        """Planifica las cargas por separado para repartirlas entre frames"""
+        self.assets_scheduled = True
+        self.player.defer_sprite_loading = True
+        # El jugador primero: es lo que más se nota mientras falta
+        # Cada carga es un generador: la decodificación va en segundo plano y
+        # la conversión y el escalado en porciones cortas
+        return [
+            scheduler.schedule(self.player.load_sprites_steps, name="Player.load_sprites", priority=0),
+            scheduler.schedule(self.load_background_steps, name="LevelScene.load_background", priority=1),
+            scheduler.schedule(self.load_ui_bar_steps, name="LevelScene.load_ui_bar", priority=2),
+            scheduler.schedule(self.load_hud_font_steps, name="LevelScene.load_hud_font", priority=3),
+        ]
+    
+    def set_world_size(self, width: int, height: int):
+        """
+        Cambia el tamaño del mundo (niveles de varias pantallas)
+        
+        Args:
+            width: Ancho del mundo en píxeles
+            height: Alto del mundo en píxeles
+        """
+        self.world_rect = pygame.Rect(0, 0, max(width, self.width), max(height, self.height))
+        self.camera.set_world(self.world_rect)
+        # La capa estática va por bloques: crecer no reserva memoria
+        self.static_layer.resize(self.world_rect.size)
+        if self.player:
+            self.player.fall_limit = self.world_rect.bottom + 80
+    
+    def set_tilemap(self, tilemap: TileMap):
+        """
+        Usa un mapa de tiles como geometría del nivel
+        
+        El mundo pasa a medir al menos lo que el mapa; sus tiles sólidos
+        colisionan con el jugador como las plataformas.
+        
+        Args:
+            tilemap: Mapa de tiles en coordenadas del mundo
+        """
+        self.tilemap = tilemap
+        self.set_world_size(max(tilemap.width, self.world_rect.width), max(tilemap.height, self.world_rect.height))
+    
+    def get_platforms(self) -> List:
+        """Plataformas con las que choca el jugador (más los tiles sólidos que tiene cerca)"""
+        if self.tilemap is None:
+            return self.platforms
+        area = self.player.rect.inflate(TILE_SIZE * 2, TILE_SIZE * 2)
+        return self.platforms + self.tilemap.colliders(area)
+    
     def setup(self):
         """Configura el nivel"""
         # Crear jugador
@@ -145,113 +293,338 @@ class LevelScene(Scene):
         self.add_entity(enemy1)
         self.add_entity(enemy2)
     
+    def setup_particles(self):
+        """Crea los emisores de partículas (cada uno es una sola entidad de la capa de efectos)"""
+        self.lum_particles = ParticleEmitter([particle_frames(color, 4, additive=True) for color in self.LUM_COLORS],
+                                             capacity=2048, gravity=300.0, drag=1.0, additive=True)
+        self.puff_particles = ParticleEmitter([particle_frames(color, 6) for color in self.PUFF_COLORS],
+                                              capacity=1024, gravity=-40.0, drag=2.0)
+        self.dust_particles = ParticleEmitter([particle_frames(color, 3) for color in self.DUST_COLORS],
+                                              capacity=1024, gravity=150.0, drag=3.0)
+        for emitter in (self.lum_particles, self.puff_particles, self.dust_particles):
+            self.add_entity(emitter)
+    
+    def emit_particles(self, emitter: ParticleEmitter, x: float, y: float, count: int, **kwargs) -> int:
+        """
+        Crea partículas según la densidad de efectos de la calidad actual
+        
+        Args:
+            emitter: Emisor de la escena
+            x: Posición x en el mundo
+            y: Posición y en el mundo
+            count: Partículas con la calidad máxima
+            **kwargs: Parámetros de ParticleEmitter.emit()
+        
+        Returns:
+            Partículas creadas
+        """
+        count = round(count * self.quality_setting("effects_density", 1.0))
+        if count <= 0:
+            return 0
+        return emitter.emit(x, y, count, **kwargs)
+    
+    def emit_dust(self):
+        """Suelta polvo bajo los pies del jugador al aterrizar y al correr"""
+        player = self.player
+        on_ground = player.is_on_ground
+        if on_ground:
+            x, y = player.rect.midbottom
+            if not self._player_on_ground:
+                self.emit_particles(self.dust_particles, x, y, 12, speed=(40.0, 120.0),
+                                    angle=(190.0, 350.0), life=(200.0, 400.0), spread=6.0)
+            elif player.velocity_x and self.update_count % self.DUST_INTERVAL == 0:
+                # Hacia atrás y arriba
+                angle = (200.0, 250.0) if player.velocity_x > 0 else (290.0, 340.0)
+                self.emit_particles(self.dust_particles, x, y, 2, speed=(30.0, 80.0),
+                                    angle=angle, life=(200.0, 350.0), spread=3.0)
+        self._player_on_ground = on_ground
+    
+    def snapshot(self) -> "LevelScene":
+        """Instantánea para dibujar: el HUD lee la salud de la copia del jugador"""
+        snap = super().snapshot()
+        snap.player = snap.entities[self.entities.index(self.player)]
+        # La cámara se mueve al simular: la instantánea necesita la suya
+        snap.camera = copy.copy(self.camera)
+        return snap
+    
+    def store_previous_positions(self):
+        """Guarda también la posición de la cámara"""
+        super().store_previous_positions()
+        self.camera.store_previous_position()
+    
+    def begin_interpolation(self, alpha: float):
+        """Interpola también la cámara para que siga al jugador sin saltos"""
+        super().begin_interpolation(alpha)
+        camera = self.camera
+        self._camera_position = (camera.x, camera.y)
+        camera.x, camera.y = camera.get_interpolated_position(alpha)
+    
+    def end_interpolation(self):
+        """Restaura la posición real de entidades y cámara"""
+        super().end_interpolation()
+        self.camera.x, self.camera.y = self._camera_position
+    
     def handle_input(self, event: pygame.event.Event):
         """Maneja la entrada"""
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self.active = False
     
+    @traced("LevelScene.update", "scene")
     def update(self, dt: float):
         """Actualiza la escena"""
-        # Cargar fondo y UI en la primera actualización
-        if not self.background_loaded:
-            self.load_background()
-        if not self.ui_bar_loaded:
-            self.load_ui_bar()
+        # Cargar fondo y UI en la primera actualización (si no se cargan en diferido)
+        if not self.assets_scheduled:
+            if not self.background_loaded:
+                self.load_background()
+            if not self.ui_bar_loaded:
+                self.load_ui_bar()
         
-        keys = pygame.key.get_pressed()
+        keys = self.get_pressed_keys()
         self.player.handle_input(keys)
         
-        # Actualizar entidades
-        for entity in self.entities:
-            if isinstance(entity, Player):
-                entity.update(dt, self.platforms)
-            else:
-                entity.update(dt)
+        # Actualizar entidades (las de fuera de pantalla, con menos frecuencia
+        # si el gobernador de calidad lo pide)
+        offscreen_interval = self.quality_setting("offscreen_update_interval", 1)
+        viewport = self.camera.viewport
+        self.update_count += 1
+        with self.section("physics"):
+            for i, entity in enumerate(self.entities):
+                if entity.static:
+                    continue
+                if isinstance(entity, Player):
+                    entity.update(dt, self.get_platforms())
+                elif offscreen_interval > 1 and not entity.rect.colliderect(viewport):
+                    if (i + self.update_count) % offscreen_interval == 0:
+                        entity.update(dt * offscreen_interval)
+                else:
+                    entity.update(dt)
+        
+        with self.section("collision"):
+            self.check_collisions()
         
+        self.emit_dust()
+        if self.player.health < self._player_health:
+            self.post_effects.flash(*self.DAMAGE_FLASH)
+        self._player_health = self.player.health
+        self.camera.follow(self.player.rect)
+    
+    def check_collisions(self):
+        """Revisa colisiones del jugador con coleccionables, púas y enemigos"""
         # Revisar colisiones con coleccionables
-        for collectible in self.collectibles:
-            if not collectible.collected and self.player.rect.colliderect(collectible.rect):
-                collectible.collected = True
-                self.score += collectible.value
+        with tracer.span("check_collectibles", "scene"):
+            for collectible in self.collectibles:
+                if not collectible.collected and self.player.rect.colliderect(collectible.rect):
+                    collectible.collected = True
+                    self.score += collectible.value
+                    x, y = collectible.rect.center
+                    self.emit_particles(self.lum_particles, x, y, 24, speed=(80.0, 220.0),
+                                        angle=(200.0, 340.0), life=(400.0, 800.0))
         
         # Revisar colisiones con púas
-        spikes = self.get_entities_by_type(Spike)
-        for spike in spikes:
-            if self.player.rect.colliderect(spike.rect):
-                self.player.on_fall()
+        with tracer.span("check_spikes", "scene"):
+            spikes = self.get_entities_by_type(Spike)
+            for spike in spikes:
+                if self.player.rect.colliderect(spike.rect):
+                    self.player.on_fall()
 
         # Revisar colisiones con enemigos
-        enemies = self.get_entities_by_type(SimpleEnemy)
-        for enemy in enemies:
-            if not enemy.active:
-                continue
-            if self.player.rect.colliderect(enemy.rect):
-                direction = CollisionManager.get_collision_direction(self.player.rect, enemy.rect)
-                # Si el jugador cae sobre el enemigo, lo mata
-                if direction == "top" and self.player.velocity_y > 0:
-                    enemy.take_damage(1)
-                    # Rebote del jugador
-                    self.player.velocity_y = -PLAYER_JUMP_POWER / 2
-                else:
-                    # El jugador recibe daño
-                    self.player.take_damage(1)
+        with tracer.span("check_enemies", "scene"):
+            enemies = self.get_entities_by_type(SimpleEnemy)
+            for enemy in enemies:
+                if not enemy.active:
+                    continue
+                if self.player.rect.colliderect(enemy.rect):
+                    direction = CollisionManager.get_collision_direction(self.player.rect, enemy.rect)
+                    # Si el jugador cae sobre el enemigo, lo mata
+                    if direction == "top" and self.player.velocity_y > 0:
+                        enemy.take_damage(1)
+                        if not enemy.active:
+                            x, y = enemy.rect.center
+                            self.emit_particles(self.puff_particles, x, y, 20, speed=(20.0, 90.0),
+                                                life=(300.0, 700.0), spread=enemy.width / 3)
+                        # Rebote del jugador
+                        self.player.velocity_y = -PLAYER_JUMP_POWER / 2
+                    else:
+                        # El jugador recibe daño
+                        self.player.take_damage(1)
     
     def draw(self, surface: pygame.Surface):
         """Dibuja la escena"""
+        camera = self.camera
+        with self.section("background"):
+            self.draw_background(surface)
+        self.draw_tilemap(surface)
+        # Entidades estáticas pre-dibujadas: un blits() de los bloques visibles
+        self.draw_static(surface)
+        
+        # Dibujar solo las entidades móviles que se ven
+        visible = camera.cull(entity for entity in self.render_layers if not entity.static)
+        self.begin_camera(visible)
+        try:
+            self.draw_entities(surface, visible)
+        finally:
+            self.end_camera()
+        
+        self.post_effects.apply(surface, "world")
+        with self.section("hud"):
+            self.draw_hud(surface)
+    
+    def begin_camera(self, entities: List):
+        """Pasa las entidades a coordenadas de pantalla para dibujarlas"""
+        ox, oy = self.camera.offset
+        saved = self._camera_saved = []
+        if not ox and not oy:
+            return
+        for entity in entities:
+            saved.append((entity, entity.x, entity.y))
+            entity.x -= ox
+            entity.y -= oy
+            entity.update_rect()
+    
+    def end_camera(self):
+        """Devuelve las entidades a coordenadas del mundo"""
+        for entity, x, y in self._camera_saved:
+            entity.x = x
+            entity.y = y
+            entity.update_rect()
+        self._camera_saved = []
+    
+    def draw_tilemap(self, surface: pygame.Surface):
+        """Dibuja los bloques visibles del mapa de tiles (si hay)"""
+        if self.tilemap is not None:
+            with self.section("tilemap"):
+                self.tilemap.draw(surface, self.camera.viewport)
+    
+    def draw_static(self, surface: pygame.Surface, area: Optional[pygame.Rect] = None):
+        """
+        Dibuja los bloques visibles de la capa de entidades estáticas
+        
+        Args:
+            surface: Pantalla
+            area: Región del mundo a la que se limita (por defecto, la vista)
+        """
+        self.static_layer.draw(surface, self.camera.viewport, self.render_layers, area)
+    
+    def draw_background(self, surface: pygame.Surface):
+        """Dibuja el fondo del nivel en pantalla (capas parallax, color liso o cielo)"""
+        width, height = surface.get_size()
         try:
             # Dibujar fondo si existe
-            if self.background:
-                surface.blit(self.background, (0, 0))
+            if self.quality_setting("background", "full") == "flat":
+                surface.fill(self.background_color)
+            elif self.background:
+                self.background.draw(surface, self.camera.offset)
             else:
                 surface.fill(self.background_color)
                 # Dibujar cielo (gradiente simulado)
-                pygame.draw.rect(surface, (135, 206, 235), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT // 2))
+                surface.fill((135, 206, 235), (0, 0, width, height // 2))
         except Exception as e:
             print(f"Error dibujando fondo: {e}")
             surface.fill(self.background_color)
+    
+    def draw_dirty(self, surface: pygame.Surface, renderer):
+        """Restaura fondo y capa estática solo donde se han movido entidades y redibuja encima"""
+        camera = self.camera
+        dynamic = camera.cull(entity for entity in self.render_layers if not entity.static)
+        # Si la cámara se ha movido cambia toda la pantalla; los efectos de
+        # postproceso también, mientras duran y en el frame en que terminan
+        effects = self.post_effects.active
+        if effects:
+            renderer.invalidate()
+        state = (self.static_layer, self.static_layer.version, self.background,
+                 self.quality_setting("background", "full"), self.ui_bar, camera.offset, effects,
+                 self.tilemap, self.tilemap.version if self.tilemap else None)
+        self.begin_camera(dynamic)
+        try:
+            rects = renderer.collect(dynamic, state, extra=(self.HUD_RECT,))
+            if rects is None:
+                self.draw_background(surface)
+                self.draw_tilemap(surface)
+                self.draw_static(surface)
+                self.draw_entities(surface, dynamic)
+                self.post_effects.apply(surface, "world")
+            else:
+                # Cada región se redibuja entera (fondo, capa y entidades móviles que
+                # la tocan, en orden) con el clip puesto: queda igual que con
+                # un redibujado completo
+                ox, oy = camera.offset
+                bounds = [entity.get_draw_rect() for entity in dynamic]
+                with self.section("restore"):
+                    for rect in rects:
+                        surface.set_clip(rect)
+                        self.draw_background(surface)
+                        self.draw_tilemap(surface)
+                        self.draw_static(surface, rect.move(ox, oy))
+                        self.draw_entities(surface, [dynamic[i] for i in rect.collidelistall(bounds)])
+                    surface.set_clip(None)
+        finally:
+            self.end_camera()
         
-        # Dibujar todas las entidades
-        for entity in self.entities:
-            try:
-                entity.draw(surface)
-            except Exception as e:
-                print(f"Error dibujando entidad: {e}")
+        with self.section("hud"):
+            self.draw_hud(surface)
+    
+    def draw_hud(self, surface: pygame.Surface):
+        """
+        Dibuja el HUD compuesto
         
+        Solo se recompone cuando cambian la puntuación o la salud, y como mucho
+        una vez cada hud_interval frames según la calidad.
+        """
+        hud = self._hud
+        key = (self.score, self.player.health, self.player.max_health, self.ui_bar, self.hud_font)
+        if hud["key"] != key:
+            if hud["key"] is None or hud["frames"] >= self.quality_setting("hud_interval", 1):
+                # Superficie nueva en cada recomposición, como la capa estática:
+                # el backend de texturas sube la nueva en vez de reutilizar la vieja
+                hud["surface"] = pygame.Surface(self.HUD_RECT.size, pygame.SRCALPHA)
+                self.render_hud(hud["surface"])
+                hud["key"] = key
+                hud["frames"] = 0
+        hud["frames"] += 1
+        surface.blit(hud["surface"], self.HUD_RECT, special_flags=pygame.BLEND_PREMULTIPLIED)
+    
+    def render_hud(self, surface: pygame.Surface):
+        """
+        Compone la puntuación y la salud en la superficie del HUD
+        
+        Se compone con alfa premultiplicado para que los bordes semitransparentes
+        queden igual que dibujando directamente sobre la pantalla.
+        """
+        premultiplied = pygame.BLEND_PREMULTIPLIED
         # Dibujar UI Bar si existe
         if self.ui_bar:
             try:
-                surface.blit(self.ui_bar, (10, 10))
+                surface.blit(self.ui_bar.premul_alpha(), (10, 10), special_flags=premultiplied)
+                if self.hud_font:
+                    # Contadores con la fuente de números de lums (un blits() cada uno)
+                    self.hud_font.draw(surface, f"{self.score}", (50, 25), premultiplied)
+                    self.hud_font.draw(surface, f"{self.player.health}/{self.player.max_health}",
+                                       (50, 65), premultiplied)
+                    return
                 # Dibujar puntuación sobre la barra UI
-                font_large = pygame.font.Font(None, 36)
-                font_small = pygame.font.Font(None, 28)
-                
-                score_text = font_large.render(f"{self.score}", True, (255, 215, 0))
-                surface.blit(score_text, (50, 25))
+                score_text = text_cache.render(f"{self.score}", (255, 215, 0), None, 36)
+                surface.blit(score_text.premul_alpha(), (50, 25), special_flags=premultiplied)
                 
                 # Salud
-                health_text = font_small.render(f"{self.player.health}/{self.player.max_health}", True, (255, 100, 100))
-                surface.blit(health_text, (50, 65))
+                health_text = text_cache.render(f"{self.player.health}/{self.player.max_health}",
+                                                (255, 100, 100), None, 28)
+                surface.blit(health_text.premul_alpha(), (50, 65), special_flags=premultiplied)
             except Exception as e:
                 print(f"Error dibujando UI bar: {e}")
         else:
             # Fallback a HUD simple sin barra UI
             try:
-                font_large = pygame.font.Font(None, 40)
-                font_small = pygame.font.Font(None, 32)
-                
                 # Panel HUD de fondo semitransparente
-                hud_surface = pygame.Surface((250, 100))
-                hud_surface.set_alpha(200)
-                hud_surface.fill((0, 0, 0))
-                surface.blit(hud_surface, (10, 10))
+                surface.fill((0, 0, 0, 200), (10, 10, 250, 100))
                 
                 # Puntuación
-                score_text = font_large.render(f"Score: {self.score}", True, (255, 215, 0))
-                surface.blit(score_text, (20, 20))
+                score_text = text_cache.render(f"Score: {self.score}", (255, 215, 0), None, 40)
+                surface.blit(score_text.premul_alpha(), (20, 20), special_flags=premultiplied)
                 
                 # Salud
-                health_text = font_small.render(f"Health: {self.player.health}/{self.player.max_health}", True, (255, 100, 100))
-                surface.blit(health_text, (20, 60))
+                health_text = text_cache.render(f"Health: {self.player.health}/{self.player.max_health}",
+                                                (255, 100, 100), None, 32)
+                surface.blit(health_text.premul_alpha(), (20, 60), special_flags=premultiplied)
             except Exception as e:
                 print(f"Error dibujando HUD: {e}")
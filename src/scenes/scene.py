@@ -1,9 +1,14 @@
 """Sistema de escenas del juego"""
 
+import time
 import pygame
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from src.entities.entity import Entity
+from src.render.layers import RenderLayers
+from src.render.postfx import PostEffects
+from src.render.queue import RenderQueue
+from src.utils.tracing import tracer
 
 
 class Scene(ABC):
@@ -20,8 +25,28 @@ class Scene(ABC):
         self.width = width
         self.height = height
         self.entities: List[Entity] = []
+        # Las mismas entidades por capa de dibujo y profundidad
+        self.render_layers = RenderLayers()
         self.active = True
         self.background_color = (50, 50, 50)
+        # Escena original de la que se copió una instantánea (ella misma si no lo es)
+        self.source = self
+        # Perfilador del engine (lo asigna GameEngine.register_scene)
+        self.profiler = None
+        # Gobernador de calidad del engine (lo asigna GameEngine.register_scene)
+        self.quality = None
+        # Estado de teclado inyectado (headless/tests); None = teclado real
+        self.key_state = None
+        # Posiciones reales guardadas mientras se dibuja interpolado
+        self._saved_positions = []
+        # Capa pre-dibujada de fondo y entidades estáticas (si la escena la usa)
+        self.static_layer = None
+        # Cola de dibujo: las entidades encolan y se vuelca con blits() por capa
+        self.render_queue = RenderQueue()
+        # Efectos de postproceso (destellos, fundidos...); el engine los avanza
+        # en cada paso y aplica la etapa "screen", y las escenas con HUD la
+        # "world" antes de dibujarlo
+        self.post_effects = PostEffects()
     
     @abstractmethod
     def setup(self):
@@ -43,15 +68,154 @@ class Scene(ABC):
         """Dibuja la escena"""
         pass
     
+    def section(self, name: str):
+        """Mide una fase de la escena con el perfilador del engine (si lo hay)"""
+        if self.profiler is None:
+            return tracer.span(name)
+        return self.profiler.section(name)
+    
+    def quality_setting(self, key: str, default):
+        """Obtiene un ajuste del nivel de calidad actual (o el valor por defecto)"""
+        if self.quality is None:
+            return default
+        return self.quality.get(key)
+    
+    def draw_entities(self, surface: pygame.Surface, entities: Optional[List[Entity]] = None):
+        """
+        Dibuja las entidades a través de la cola de dibujo
+        
+        Cada entidad encola su imagen con submit() y la cola se vuelca con un
+        blits() por capa. Si se perfila, se mide el coste de encolar por tipo
+        y el del volcado.
+        
+        Args:
+            surface: Superficie donde dibujar
+            entities: Entidades a dibujar (por defecto todas las de la escena, por capas)
+        """
+        if entities is None:
+            entities = self.render_layers
+        queue = self.render_queue
+        profiler = self.profiler
+        if profiler is None or not profiler.enabled:
+            with tracer.span("draw_entities", "scene"):
+                for entity in entities:
+                    try:
+                        entity.submit(queue)
+                    except Exception as e:
+                        print(f"Error dibujando entidad: {e}")
+                queue.flush(surface)
+            return
+        
+        perf_counter = time.perf_counter
+        for entity in entities:
+            start = perf_counter()
+            try:
+                entity.submit(queue)
+            except Exception as e:
+                print(f"Error dibujando entidad: {e}")
+            profiler.add(f"draw:{type(entity).__name__}", (perf_counter() - start) * 1000.0)
+        start = perf_counter()
+        queue.flush(surface)
+        profiler.add("draw:blits", (perf_counter() - start) * 1000.0)
+    
+    def draw_dirty(self, surface: pygame.Surface, renderer):
+        """
+        Dibuja la escena con el renderizador de rectángulos sucios
+        
+        Por defecto dibuja todo; las escenas con fondo fijo lo redefinen para
+        restaurar solo las regiones que han cambiado.
+        
+        Args:
+            surface: Superficie donde dibujar
+            renderer: DirtyRectRenderer del engine
+        """
+        surface.fill((0, 0, 0))
+        self.draw(surface)
+        renderer.full_frame()
+    
+    def load_assets(self):
+        """Carga los recursos que necesitan el display inicializado"""
+        pass
+    
+    def schedule_assets(self, scheduler):
+        """
+        Planifica la carga de recursos como trabajo diferido del engine
+        
+        Args:
+            scheduler: FrameScheduler del engine
+        
+        Returns:
+            Trabajos de carga (lo que deba esperar a los recursos depende de ellos)
+        """
+        return [scheduler.schedule(self.load_assets, name=f"{type(self).__name__}.load_assets")]
+    
+    def get_pressed_keys(self):
+        """Obtiene el estado del teclado (real o inyectado)"""
+        if self.key_state is not None:
+            return self.key_state
+        return pygame.key.get_pressed()
+    
     def add_entity(self, entity: Entity):
-        """Añade una entidad a la escena"""
+        """Añade una entidad a la escena (y a su capa de dibujo)"""
         self.entities.append(entity)
+        self.render_layers.add(entity)
+        if entity.static and self.static_layer:
+            self.static_layer.invalidate(entity.get_draw_rect())
     
     def remove_entity(self, entity: Entity):
         """Elimina una entidad de la escena"""
         if entity in self.entities:
             self.entities.remove(entity)
+            self.render_layers.remove(entity)
+            if entity.static and self.static_layer:
+                self.static_layer.invalidate(entity.get_draw_rect())
     
     def get_entities_by_type(self, entity_type: type) -> List[Entity]:
         """Obtiene todas las entidades de un tipo específico"""
         return [e for e in self.entities if isinstance(e, entity_type)]
+    
+    def snapshot(self) -> "Scene":
+        """
+        Crea una instantánea de la escena que solo se usa para dibujar
+        
+        La instantánea comparte recursos con la escena pero tiene sus propias
+        copias de las entidades, así que puede dibujarse en un hilo mientras
+        la escena original se sigue simulando en otro.
+        """
+        snap = object.__new__(type(self))
+        snap.__dict__.update(self.__dict__)
+        snap.source = self
+        snap.entities = [entity.snapshot() for entity in self.entities]
+        snap.render_layers = self.render_layers.copy(dict(zip(self.entities, snap.entities)))
+        snap.post_effects = self.post_effects.snapshot()
+        snap._saved_positions = []
+        return snap
+    
+    def store_previous_positions(self):
+        """Guarda la posición de todas las entidades antes de un paso de simulación"""
+        for entity in self.entities:
+            entity.store_previous_position()
+    
+    def begin_interpolation(self, alpha: float):
+        """
+        Coloca las entidades en su posición interpolada para dibujarlas
+        
+        Args:
+            alpha: Fracción del paso de simulación transcurrida
+        """
+        saved = self._saved_positions
+        saved.clear()
+        for entity in self.entities:
+            if entity.x == entity.prev_x and entity.y == entity.prev_y:
+                continue
+            saved.append((entity, entity.x, entity.y))
+            entity.x, entity.y = entity.get_interpolated_position(alpha)
+            entity.update_rect()
+    
+    def end_interpolation(self):
+        """Restaura la posición real de las entidades tras dibujar"""
+        for entity, x, y in self._saved_positions:
+            entity.x = x
+            entity.y = y
+            entity.update_rect()
+        self._saved_positions.clear()
@@ -0,0 +1,120 @@
+"""Localización y decodificación anticipada de recursos"""
+
+import glob
+import os
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import pygame
+
+
+def get_base_path():
+    """Obtiene la ruta base de la aplicacion (compatible con PyInstaller)"""
+    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+        # Ejecutable PyInstaller - usa MEIPASS
+        return sys._MEIPASS
+    elif getattr(sys, 'frozen', False):
+        # Ejecutable PyInstaller sin MEIPASS
+        return os.path.dirname(sys.executable)
+    else:
+        # Ejecucion desde script
+        return os.getcwd()
+
+
+def find_asset(*patterns: str) -> Optional[str]:
+    """
+    Busca un recurso probando patrones (admiten comodines) relativos a la ruta base
+
+    Returns:
+        Ruta absoluta del primer archivo encontrado, o None
+    """
+    base_path = get_base_path()
+    for pattern in patterns:
+        matches = glob.glob(os.path.join(base_path, pattern))
+        if matches:
+            return matches[0]
+    return None
+
+
+class AssetLoader:
+    """
+    Decodifica imágenes en hilos de fondo antes de que se necesiten
+
+    pygame.image.load() suelta el GIL mientras SDL_image decodifica, así que los
+    PNG grandes pueden decodificarse mientras el hilo principal crea la ventana
+    o monta la escena. Las superficies devueltas están sin convertir: convert()
+    necesita el display y lo hace quien las usa.
+    """
+
+    def __init__(self, workers: int = 2):
+        """
+        Inicializa el cargador
+
+        Args:
+            workers: Hilos de decodificación
+        """
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def preload(self, paths: Iterable[Optional[str]]):
+        """
+        Empieza a decodificar imágenes en segundo plano
+
+        Args:
+            paths: Rutas de las imágenes (las None o inexistentes se ignoran)
+        """
+        with self._lock:
+            for path in paths:
+                if not path or path in self._pending or not os.path.exists(path):
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                        thread_name_prefix="asset-decode")
+                self._pending[path] = self._executor.submit(pygame.image.load, path)
+
+    def wait(self, path: str):
+        """
+        Generador que decodifica una imagen en segundo plano y cede hasta que
+        está lista (para los trabajos por porciones del FrameScheduler)
+
+        Args:
+            path: Ruta de la imagen
+        """
+        self.preload([path])
+        with self._lock:
+            future = self._pending.get(path)
+        # Se cede la decodificación en curso: run_now() la espera en lugar de girar
+        while future is not None and not future.done():
+            yield future
+
+    def load(self, path: str) -> pygame.Surface:
+        """
+        Obtiene una imagen decodificada (espera a la precarga si está en curso)
+
+        Args:
+            path: Ruta de la imagen
+
+        Returns:
+            Superficie sin convertir
+        """
+        with self._lock:
+            future = self._pending.pop(path, None)
+        if future is not None:
+            return future.result()
+        return pygame.image.load(path)
+
+    def shutdown(self):
+        """Descarta las precargas pendientes y libera los hilos"""
+        with self._lock:
+            self._pending.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# Cargador global compartido por escenas y entidades
+assets = AssetLoader()
@@ -0,0 +1,134 @@
+"""Política del recolector de basura durante el juego"""
+
+import gc
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from src.utils.tracing import tracer
+
+
+class GCManager:
+    """
+    Controla cuándo recolecta el GC cíclico de Python
+
+    - Tras montar una escena y cargar sus recursos, congela (gc.freeze) los
+      objetos de larga vida para que las recolecciones no los recorran.
+    - Durante el juego retrasa las recolecciones completas (generación 2)
+      subiendo su umbral; las generaciones jóvenes siguen siendo automáticas.
+    - En transiciones y cargas hace una recolección completa explícita.
+    - Mide cada pausa con gc.callbacks.
+    """
+
+    # Umbral de la generación 2 durante el juego (número de recolecciones de gen 1)
+    GAMEPLAY_GEN2_THRESHOLD = 1000
+
+    def __init__(self, enabled: bool = True, window: int = 600):
+        """
+        Inicializa el gestor
+
+        Args:
+            enabled: Si se aplica la política (si no, solo se miden pausas)
+            window: Número de pausas recientes que se conservan
+        """
+        self.enabled = enabled
+        self.pauses: Deque[Tuple[int, float]] = deque(maxlen=window)
+        self.collections = [0, 0, 0]
+        self.total_pause_ms = 0.0
+        self.max_pause_ms = 0.0
+        self.profiler = None
+        self.in_gameplay = False
+        self._default_threshold = gc.get_threshold()
+        self._start_ns: Optional[int] = None
+        self._installed = False
+
+    def install(self):
+        """Registra el callback de medición de pausas"""
+        if not self._installed:
+            gc.callbacks.append(self._on_gc)
+            self._installed = True
+
+    def uninstall(self):
+        """Quita el callback y restaura el comportamiento por defecto del GC"""
+        if self._installed:
+            gc.callbacks.remove(self._on_gc)
+            self._installed = False
+        self.end_gameplay()
+        gc.unfreeze()
+
+    def _on_gc(self, phase: str, info: Dict):
+        """Callback de gc: mide la duración de cada recolección"""
+        if phase == "start":
+            self._start_ns = time.perf_counter_ns()
+            return
+        if self._start_ns is None:
+            return
+        end_ns = time.perf_counter_ns()
+        pause_ms = (end_ns - self._start_ns) / 1e6
+        generation = info.get("generation", 0)
+        self.pauses.append((generation, pause_ms))
+        self.collections[generation] += 1
+        self.total_pause_ms += pause_ms
+        if pause_ms > self.max_pause_ms:
+            self.max_pause_ms = pause_ms
+        if tracer.capturing:
+            tracer.complete(f"gc gen{generation}", self._start_ns, end_ns, "gc")
+        if self.profiler is not None and self.profiler.enabled:
+            self.profiler.add("gc", pause_ms)
+        self._start_ns = None
+
+    def begin_loading(self):
+        """Transición o carga: vuelve a los umbrales normales, descongela y recolecta todo lo de la escena anterior"""
+        if not self.enabled:
+            return
+        self.end_gameplay()
+        gc.unfreeze()
+        gc.collect()
+
+    def settle(self):
+        """Fin de la carga: recolecta, congela lo cargado y pasa a modo juego"""
+        if not self.enabled:
+            return
+        gc.collect()
+        gc.freeze()
+        self.begin_gameplay()
+        print(f"[GC] {gc.get_freeze_count()} objetos congelados")
+
+    def begin_gameplay(self):
+        """Retrasa las recolecciones completas mientras se juega"""
+        if not self.enabled or self.in_gameplay:
+            return
+        self._default_threshold = gc.get_threshold()
+        gen0, gen1, _ = self._default_threshold
+        gc.set_threshold(gen0, gen1, self.GAMEPLAY_GEN2_THRESHOLD)
+        self.in_gameplay = True
+
+    def end_gameplay(self):
+        """Restaura los umbrales por defecto"""
+        if self.in_gameplay:
+            gc.set_threshold(*self._default_threshold)
+            self.in_gameplay = False
+
+    def report(self) -> Dict[str, float]:
+        """
+        Obtiene un resumen de las pausas medidas
+
+        Returns:
+            Recolecciones por generación, pausa total, máxima y p95 (ms)
+        """
+        recent = sorted(pause for _, pause in self.pauses)
+        p95 = recent[max(0, int(len(recent) * 0.95) - 1)] if recent else 0.0
+        return {
+            "gen0": self.collections[0],
+            "gen1": self.collections[1],
+            "gen2": self.collections[2],
+            "total_ms": self.total_pause_ms,
+            "max_ms": self.max_pause_ms,
+            "p95_ms": p95,
+        }
+
+    def print_report(self):
+        """Imprime el resumen de pausas"""
+        r = self.report()
+        print(f"[GC] Recolecciones gen0/gen1/gen2: {r['gen0']}/{r['gen1']}/{r['gen2']} - "
+              f"pausa total {r['total_ms']:.2f} ms, máx {r['max_ms']:.2f} ms, p95 {r['p95_ms']:.3f} ms")
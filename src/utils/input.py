@@ -0,0 +1,149 @@
+"""Estado de entrada del engine"""
+
+import time
+import pygame
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional
+
+
+class KeyState:
+    """
+    Estado de teclado con la misma interfaz que pygame.key.get_pressed()
+
+    Permite inyectar entrada simulada (tests, bots, modo headless) a las escenas
+    que consultan las teclas con keys[pygame.K_*].
+    """
+
+    def __init__(self, pressed: Iterable[int] = ()):
+        """
+        Inicializa el estado de teclado
+
+        Args:
+            pressed: Códigos de tecla (pygame.K_*) pulsados
+        """
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        """Indica si la tecla está pulsada"""
+        return key in self.pressed
+
+    def __repr__(self) -> str:
+        return f"KeyState({sorted(self.pressed)})"
+
+
+NO_KEYS = KeyState()
+
+
+class InputManager:
+    """
+    Subsistema de entrada de baja latencia
+
+    - Filtra en SDL los tipos de evento que el juego no usa (el movimiento del
+      ratón, por ejemplo, ni siquiera llega a la cola de Python).
+    - Vuelve a leer la entrada justo antes de cada paso de simulación.
+    - Mide la latencia entrada-pantalla: desde que el engine observa un cambio
+      de teclado hasta que termina el flip del primer frame simulado con él.
+    """
+
+    # Eventos que se dejan pasar por defecto (USEREVENT incluye todos los
+    # tipos propios: pygame.time.set_timer, pygame.event.custom_type...)
+    DEFAULT_EVENTS = (
+        pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+        pygame.ACTIVEEVENT, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE,
+        pygame.WINDOWCLOSE, pygame.WINDOWFOCUSLOST, pygame.WINDOWFOCUSGAINED,
+        pygame.USEREVENT,
+    )
+
+    def __init__(self, allowed_events: Iterable[int] = DEFAULT_EVENTS, window: int = 300):
+        """
+        Inicializa el subsistema
+
+        Args:
+            allowed_events: Tipos de evento que llegan a las escenas
+            window: Número de medidas de latencia que se conservan
+        """
+        self.allowed_events = set(allowed_events)
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self._observed: Optional[float] = None   # Cambio aún no simulado
+        self._consumed: List[float] = []         # Simulados, pendientes de mostrarse
+        self._queued_seen = False
+
+    def install_filter(self):
+        """Bloquea en SDL todos los eventos que no están permitidos"""
+        pygame.event.set_blocked(None)
+        allowed = set(self.allowed_events)
+        if pygame.USEREVENT in allowed:
+            allowed.update(range(pygame.USEREVENT, pygame.NUMEVENTS))
+        pygame.event.set_allowed(list(allowed))
+
+    def allow(self, *event_types: int):
+        """Permite tipos de evento adicionales (p. ej. para una escena con ratón)"""
+        self.allowed_events.update(event_types)
+        if pygame.display.get_init():
+            pygame.event.set_allowed(list(event_types))
+
+    def observe_event(self, event: pygame.event.Event):
+        """Registra un evento de teclado recibido al procesar la cola"""
+        if event.type not in (pygame.KEYDOWN, pygame.KEYUP):
+            return
+        if self._queued_seen:
+            # Ya se observó con peek() al muestrear en el frame anterior
+            return
+        if self._observed is None:
+            self._observed = time.perf_counter()
+
+    def end_events(self):
+        """Marca que la cola de eventos se ha vaciado"""
+        self._queued_seen = False
+
+    def sample(self):
+        """
+        Actualiza el estado de teclado de SDL justo antes de simular
+
+        Los eventos nuevos se quedan en la cola para el siguiente
+        handle_events(), pero la simulación ya ve las teclas pulsadas.
+        """
+        pygame.event.pump()
+        if pygame.event.peek((pygame.KEYDOWN, pygame.KEYUP)):
+            self._queued_seen = True
+            if self._observed is None:
+                self._observed = time.perf_counter()
+
+    def consume(self):
+        """Indica que un paso de simulación ha usado la entrada observada"""
+        if self._observed is not None:
+            self._consumed.append(self._observed)
+            self._observed = None
+
+    def presented(self) -> Optional[float]:
+        """
+        Indica que un frame se ha mostrado en pantalla
+
+        Returns:
+            Latencia (ms) de la entrada más antigua mostrada en este frame, si la hay
+        """
+        if not self._consumed:
+            return None
+        now = time.perf_counter()
+        latency = (now - self._consumed[0]) * 1000.0
+        for observed in self._consumed:
+            self.latencies.append((now - observed) * 1000.0)
+        self._consumed.clear()
+        return latency
+
+    def report(self) -> Dict[str, float]:
+        """
+        Obtiene las estadísticas de latencia entrada-pantalla
+
+        Returns:
+            count, p50, p95 y max en milisegundos
+        """
+        values = sorted(self.latencies)
+        if not values:
+            return {"count": 0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        return {
+            "count": len(values),
+            "p50": values[len(values) // 2],
+            "p95": values[max(0, int(len(values) * 0.95) - 1)],
+            "max": values[-1],
+        }
@@ -0,0 +1,193 @@
+"""Perfilador de frames por fases para el engine"""
+
+import csv
+import json
+import time
+import pygame
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from src.utils.tracing import NULL_SECTION, tracer
+
+
+class _Section:
+    """Context manager que mide una fase, la acumula en el frame actual y la traza"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        self.profiler.add(self.name, (end - self.start) / 1e6)
+        if tracer.capturing:
+            tracer.complete(self.name, self.start, end)
+        return False
+
+
+class FrameProfiler:
+    """
+    Registra cuánto tarda cada fase del frame en ventanas deslizantes
+
+    Cada fase acumula su tiempo dentro del frame; al cerrar el frame el total
+    se guarda en la ventana de esa fase. Desactivado, section() devuelve un
+    context manager vacío y no se mide nada (salvo que haya una captura de
+    traza en curso, en cuyo caso la fase solo se traza).
+    """
+
+    def __init__(self, window: int = 300, enabled: bool = False):
+        """
+        Inicializa el perfilador
+
+        Args:
+            window: Número de frames que conserva cada ventana
+            enabled: Si empieza midiendo
+        """
+        self.window = window
+        self.enabled = enabled
+        self.overlay_visible = False
+        self.samples: Dict[str, Deque[float]] = {}
+        self._sections: Dict[str, _Section] = {}
+        self._frame: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+
+        # Overlay: el texto se recalcula como mucho cada overlay_interval ms
+        self.overlay_interval = 250
+        self._overlay_font = None
+        self._overlay_lines: List[pygame.Surface] = []
+        self._overlay_updated = 0.0
+
+    def toggle(self):
+        """Activa/desactiva la medición y el overlay (tecla F3)"""
+        self.enabled = not self.enabled
+        self.overlay_visible = self.enabled
+        self._frame_start = None
+        print(f"[PROFILER] {'Activado' if self.enabled else 'Desactivado'}")
+
+    def section(self, name: str):
+        """
+        Devuelve un context manager que mide la fase indicada
+
+        Args:
+            name: Nombre de la fase (events, update, draw, flip...)
+        """
+        if not self.enabled:
+            if tracer.capturing:
+                return tracer.span(name)
+            return NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def add(self, name: str, ms: float):
+        """Acumula tiempo (ms) en una fase del frame actual"""
+        self._frame[name] = self._frame.get(name, 0.0) + ms
+
+    def begin_frame(self):
+        """Marca el inicio de un frame"""
+        if not self.enabled:
+            return
+        self._frame.clear()
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Cierra el frame y guarda los tiempos de cada fase"""
+        if not self.enabled or self._frame_start is None:
+            return
+        self._frame["frame"] = (time.perf_counter() - self._frame_start) * 1000.0
+        for name, ms in self._frame.items():
+            window = self.samples.get(name)
+            if window is None:
+                window = self.samples[name] = deque(maxlen=self.window)
+            window.append(ms)
+        self._frame.clear()
+        self._frame_start = None
+
+    def reset(self):
+        """Descarta todas las muestras"""
+        self.samples.clear()
+        self._frame.clear()
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], percent: float) -> float:
+        """Percentil por rango más cercano sobre una lista ordenada"""
+        index = max(0, min(len(sorted_values) - 1, int(round(percent / 100.0 * len(sorted_values))) - 1))
+        return sorted_values[index]
+
+    def stats(self, name: str) -> Dict[str, float]:
+        """
+        Obtiene las estadísticas de una fase
+
+        Returns:
+            Diccionario con count, mean, p50, p95, p99 y max en milisegundos
+        """
+        values = sorted(self.samples.get(name, ()))
+        if not values:
+            return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        return {
+            "count": len(values),
+            "mean": sum(values) / len(values),
+            "p50": self._percentile(values, 50),
+            "p95": self._percentile(values, 95),
+            "p99": self._percentile(values, 99),
+            "max": values[-1],
+        }
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Obtiene las estadísticas de todas las fases"""
+        return {name: self.stats(name) for name in sorted(self.samples)}
+
+    def export_json(self, path: str):
+        """Exporta las estadísticas a un archivo JSON"""
+        data = {"window": self.window, "unit": "ms", "phases": self.report()}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print(f"[PROFILER] Exportado: {path}")
+
+    def export_csv(self, path: str):
+        """Exporta las estadísticas a un archivo CSV"""
+        columns = ["count", "mean", "p50", "p95", "p99", "max"]
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["phase"] + columns)
+            for name, stats in self.report().items():
+                writer.writerow([name] + [round(stats[c], 4) for c in columns])
+        print(f"[PROFILER] Exportado: {path}")
+
+    def draw_overlay(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        """
+        Dibuja las estadísticas por fase en la esquina superior derecha
+        
+        Returns:
+            Región dibujada, o None si el overlay está oculto
+        """
+        if not self.overlay_visible:
+            return None
+
+        now = time.perf_counter() * 1000.0
+        if now - self._overlay_updated >= self.overlay_interval:
+            self._overlay_updated = now
+            if self._overlay_font is None:
+                self._overlay_font = pygame.font.Font(None, 20)
+            lines = ["fase            p50    p95    p99"]
+            for name, stats in self.report().items():
+                lines.append(f"{name[:14]:<14} {stats['p50']:6.2f} {stats['p95']:6.2f} {stats['p99']:6.2f}")
+            self._overlay_lines = [self._overlay_font.render(line, True, (230, 230, 230)) for line in lines]
+
+        if not self._overlay_lines:
+            return None
+        width = max(line.get_width() for line in self._overlay_lines) + 12
+        height = len(self._overlay_lines) * 16 + 8
+        x = surface.get_width() - width - 10
+        surface.fill((0, 0, 0), (x, 10, width, height))
+        for i, line in enumerate(self._overlay_lines):
+            surface.blit(line, (x + 6, 14 + i * 16))
+        return pygame.Rect(x, 10, width, height)
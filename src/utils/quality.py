@@ -0,0 +1,114 @@
+"""Gobernador de calidad adaptativa para mantener el framerate objetivo"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple
+
+
+# Niveles de calidad de mayor a menor. Cada paso recorta trabajo opcional:
+# - hud_interval: cada cuántos frames se vuelve a componer el HUD
+# - background: "full" (imagen) o "flat" (color liso)
+# - effects_density: fracción de partículas/efectos que se generan
+# - offscreen_update_interval: cada cuántos pasos se actualizan las entidades fuera de pantalla
+QUALITY_LEVELS: List[Dict[str, Any]] = [
+    {"name": "alta", "hud_interval": 1, "background": "full", "effects_density": 1.0,
+     "offscreen_update_interval": 1},
+    {"name": "media", "hud_interval": 2, "background": "full", "effects_density": 0.5,
+     "offscreen_update_interval": 2},
+    {"name": "baja", "hud_interval": 4, "background": "full", "effects_density": 0.25,
+     "offscreen_update_interval": 4},
+    {"name": "mínima", "hud_interval": 8, "background": "flat", "effects_density": 0.0,
+     "offscreen_update_interval": 8},
+]
+
+
+class QualityGovernor:
+    """
+    Vigila el tiempo de trabajo de los últimos frames y ajusta la calidad
+
+    Si el percentil 90 supera el presupuesto del frame baja un nivel; si se
+    mantiene por debajo de recover_ratio del presupuesto durante
+    recover_checks evaluaciones seguidas, sube un nivel. Tras cada cambio se
+    vacía la ventana para medir el efecto del nuevo nivel.
+    """
+
+    def __init__(self, target_fps: int = 60, window: int = 60, check_interval: int = 30,
+                 recover_ratio: float = 0.6, recover_checks: int = 4, enabled: bool = True):
+        """
+        Inicializa el gobernador
+
+        Args:
+            target_fps: Framerate que se quiere mantener
+            window: Frames que se tienen en cuenta en cada evaluación
+            check_interval: Cada cuántos frames se evalúa
+            recover_ratio: Fracción del presupuesto por debajo de la cual hay margen
+            recover_checks: Evaluaciones con margen necesarias para subir la calidad
+            enabled: Si ajusta la calidad (si no, se queda en el nivel actual)
+        """
+        self.enabled = enabled
+        self.levels = QUALITY_LEVELS
+        self.level = 0
+        self.budget_ms = 1000.0 / target_fps
+        self.check_interval = check_interval
+        self.recover_ratio = recover_ratio
+        self.recover_checks = recover_checks
+        self.frame_times: Deque[float] = deque(maxlen=window)
+        self.history: List[Tuple[int, str, str]] = []
+        self._frames = 0
+        self._headroom_checks = 0
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """Ajustes del nivel de calidad actual"""
+        return self.levels[self.level]
+
+    def get(self, key: str) -> Any:
+        """Obtiene un ajuste del nivel actual"""
+        return self.levels[self.level][key]
+
+    def record_frame(self, work_ms: float):
+        """
+        Registra el tiempo de trabajo de un frame (sin contar la espera del reloj)
+
+        Args:
+            work_ms: Milisegundos de trabajo del frame
+        """
+        if not self.enabled:
+            return
+        self.frame_times.append(work_ms)
+        self._frames += 1
+        if self._frames % self.check_interval == 0 and len(self.frame_times) == self.frame_times.maxlen:
+            self.evaluate()
+
+    def evaluate(self):
+        """Decide si hay que bajar o subir la calidad"""
+        times = sorted(self.frame_times)
+        p90 = times[int(len(times) * 0.9) - 1]
+
+        if p90 > self.budget_ms:
+            self._headroom_checks = 0
+            if self.level < len(self.levels) - 1:
+                self.set_level(self.level + 1, f"p90 {p90:.1f} ms > {self.budget_ms:.1f} ms")
+        elif p90 < self.budget_ms * self.recover_ratio:
+            self._headroom_checks += 1
+            if self._headroom_checks >= self.recover_checks and self.level > 0:
+                self.set_level(self.level - 1, f"p90 {p90:.1f} ms con margen")
+        else:
+            self._headroom_checks = 0
+
+    def set_level(self, level: int, reason: str = "manual"):
+        """
+        Cambia el nivel de calidad y lo registra
+
+        Args:
+            level: Índice en QUALITY_LEVELS (0 = máxima calidad)
+            reason: Motivo del cambio (para el log)
+        """
+        level = max(0, min(len(self.levels) - 1, level))
+        if level == self.level:
+            return
+        old = self.levels[self.level]["name"]
+        self.level = level
+        self.frame_times.clear()
+        self._headroom_checks = 0
+        self.history.append((self._frames, self.settings["name"], reason))
+        print(f"[QUALITY] {old} -> {self.settings['name']} ({reason})")
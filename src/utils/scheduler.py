@@ -0,0 +1,217 @@
+"""Planificador de trabajo diferido dentro del presupuesto de cada frame"""
+
+import heapq
+import time
+import types
+from concurrent.futures import Future
+from typing import Callable, Iterator, List, Optional, Sequence
+
+from src.config import SCHEDULER_MIN_SLICE_MS
+from src.utils.tracing import tracer
+
+
+def run_now(steps: Iterator):
+    """
+    Ejecuta de una vez un trabajo por porciones (un generador)
+
+    Si una porción cede un Future (una decodificación en segundo plano), se
+    espera a que termine en lugar de volver a preguntar.
+    """
+    for step in steps:
+        if isinstance(step, Future):
+            # Un fallo de la decodificación lo ve el propio trabajo al usar la imagen
+            step.exception()
+
+
+class Job:
+    """
+    Trabajo diferible
+
+    Puede ser una función (se ejecuta de una vez) o un generador: cada next()
+    es una porción de trabajo y el planificador decide entre porciones si
+    queda presupuesto en el frame. Si una porción cede un Future (p. ej. una
+    decodificación en segundo plano), el trabajo espera a que termine sin
+    ocupar el presupuesto. Un trabajo con dependencias (after) no empieza
+    hasta que todas terminan o se cancelan.
+    """
+
+    __slots__ = ("name", "priority", "seq", "func", "after", "generator", "waiting", "done", "cancelled")
+
+    def __init__(self, func: Callable, name: str, priority: int, seq: int, after: Sequence["Job"] = ()):
+        self.name = name
+        self.priority = priority
+        self.seq = seq
+        self.func = func
+        self.after = [job for job in after if job is not None]
+        self.generator: Optional[types.GeneratorType] = None
+        self.waiting: Optional[Future] = None
+        self.done = False
+        self.cancelled = False
+
+    def __lt__(self, other: "Job") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+    def run_slice(self) -> bool:
+        """
+        Ejecuta una porción del trabajo
+
+        Returns:
+            True si el trabajo ha terminado
+        """
+        if self.generator is None:
+            result = self.func()
+            if not isinstance(result, types.GeneratorType):
+                return True
+            self.generator = result
+        try:
+            step = next(self.generator)
+        except StopIteration:
+            return True
+        self.waiting = step if isinstance(step, Future) else None
+        return False
+
+    @property
+    def ready(self) -> bool:
+        """Si puede ejecutar una porción (no espera a un Future ni a otros trabajos)"""
+        if self.after:
+            if not all(job.done or job.cancelled for job in self.after):
+                return False
+            self.after = []
+        return self.waiting is None or self.waiting.done()
+
+    def cancel(self):
+        """Cancela el trabajo si aún no ha terminado"""
+        self.cancelled = True
+
+
+class FrameScheduler:
+    """
+    Ejecuta trabajos diferidos con el tiempo que sobra en cada frame
+
+    Los trabajos salen por prioridad (menor = antes) y orden de llegada. El
+    presupuesto se comprueba antes de cada porción y no se empieza ninguna
+    con menos de min_slice_ms libres: una porción nunca se interrumpe, así
+    que los trabajos largos deben ser generadores de porciones cortas. Si
+    pasan max_starved_frames frames sin presupuesto, se ejecuta una porción
+    igualmente para que el trabajo pendiente no se quede bloqueado bajo carga.
+    """
+
+    def __init__(self, max_starved_frames: int = 30, min_slice_ms: float = SCHEDULER_MIN_SLICE_MS):
+        """
+        Inicializa el planificador
+
+        Args:
+            max_starved_frames: Frames sin presupuesto antes de forzar una porción
+            min_slice_ms: Tiempo libre mínimo para empezar una porción
+        """
+        self.max_starved_frames = max_starved_frames
+        self.min_slice_ms = min_slice_ms
+        self._queue: List[Job] = []
+        self._seq = 0
+        self._starved_frames = 0
+        self.jobs_completed = 0
+
+    @property
+    def pending(self) -> int:
+        """Número de trabajos pendientes"""
+        return sum(1 for job in self._queue if not job.cancelled)
+
+    def schedule(self, func: Callable, name: Optional[str] = None, priority: int = 0,
+                 after: Sequence[Job] = ()) -> Job:
+        """
+        Añade un trabajo diferido
+
+        Args:
+            func: Función o función generadora a ejecutar
+            name: Nombre del trabajo (para trazas y logs)
+            priority: Prioridad (menor = antes)
+            after: Trabajos que deben terminar antes de empezar este
+
+        Returns:
+            El trabajo creado (permite cancelarlo o usarlo como dependencia)
+        """
+        job = Job(func, name or getattr(func, "__name__", "job"), priority, self._seq, after)
+        self._seq += 1
+        heapq.heappush(self._queue, job)
+        return job
+
+    def _next_job(self) -> Optional[Job]:
+        """Primer trabajo (por prioridad) que puede ejecutar una porción"""
+        queue = self._queue
+        while queue and queue[0].cancelled:
+            heapq.heappop(queue)
+        if queue and queue[0].ready:
+            return queue[0]
+        return min((job for job in queue if job.ready and not job.cancelled), default=None)
+
+    def _finish(self, job: Job):
+        """Saca de la cola un trabajo terminado"""
+        queue = self._queue
+        if queue[0] is job:
+            heapq.heappop(queue)
+        else:
+            queue.remove(job)
+            heapq.heapify(queue)
+        job.done = True
+        self.jobs_completed += 1
+
+    def run(self, budget_ms: float) -> int:
+        """
+        Ejecuta trabajos mientras quede presupuesto
+
+        Args:
+            budget_ms: Milisegundos disponibles en este frame
+
+        Returns:
+            Número de porciones ejecutadas
+        """
+        if not self._queue:
+            self._starved_frames = 0
+            return 0
+
+        if budget_ms < self.min_slice_ms:
+            self._starved_frames += 1
+            if self._starved_frames < self.max_starved_frames:
+                return 0
+            budget_ms = 0.0  # Se fuerza una única porción
+
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        min_slice = self.min_slice_ms / 1000.0
+        slices = 0
+        while True:
+            if slices and deadline - time.perf_counter() < min_slice:
+                break
+            job = self._next_job()
+            if job is None:
+                # Nada pendiente o todo esperando a decodificaciones o dependencias
+                break
+
+            with tracer.span(job.name, "scheduler"):
+                try:
+                    finished = job.run_slice()
+                except Exception as e:
+                    print(f"[SCHEDULER] Error en trabajo '{job.name}': {e}")
+                    finished = True
+            slices += 1
+
+            if finished:
+                self._finish(job)
+
+        self._starved_frames = 0
+        return slices
+
+    def flush(self):
+        """Ejecuta todos los trabajos pendientes sin límite de tiempo"""
+        while self._queue:
+            if not self.run(float("inf")):
+                # Solo quedan trabajos esperando: se espera a la primera decodificación
+                waiting = [job for job in self._queue
+                           if not job.cancelled and job.waiting is not None and not job.waiting.done()]
+                if not waiting:
+                    # Dependencias que ya no pueden terminar (no deberían quedar)
+                    blocked = [job.name for job in self._queue if not job.cancelled]
+                    if blocked:
+                        print(f"[SCHEDULER] Trabajos bloqueados: {blocked}")
+                    self._queue.clear()
+                    break
+                min(waiting).waiting.exception()
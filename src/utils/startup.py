@@ -0,0 +1,62 @@
+"""Cronología del arranque del juego"""
+
+import time
+from typing import List, Optional, Tuple
+
+
+class StartupTimer:
+    """
+    Registra cuándo termina cada fase del arranque
+
+    Cada mark() cierra la fase que empezó en la marca anterior. El informe
+    muestra el inicio, la duración y el tiempo acumulado de cada fase para
+    detectar regresiones en el tiempo hasta el primer frame.
+    """
+
+    def __init__(self, origin: Optional[float] = None):
+        """
+        Inicializa el cronómetro
+
+        Args:
+            origin: perf_counter() del inicio del proceso (por defecto, ahora)
+        """
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+        self._last = self.origin
+
+    def mark(self, phase: str):
+        """
+        Cierra una fase del arranque
+
+        Args:
+            phase: Nombre de la fase que acaba de terminar
+        """
+        now = time.perf_counter()
+        self.marks.append((phase, now))
+        self._last = now
+
+    def phases(self) -> List[Tuple[str, float, float]]:
+        """
+        Obtiene las fases registradas
+
+        Returns:
+            Lista de (fase, inicio ms, duración ms) relativos al origen
+        """
+        result = []
+        start = self.origin
+        for phase, end in self.marks:
+            result.append((phase, (start - self.origin) * 1000.0, (end - start) * 1000.0))
+            start = end
+        return result
+
+    @property
+    def total_ms(self) -> float:
+        """Tiempo total desde el origen hasta la última marca"""
+        return (self._last - self.origin) * 1000.0
+
+    def report(self):
+        """Imprime la cronología del arranque"""
+        print("[STARTUP] Fase                      inicio    duración")
+        for phase, start_ms, duration_ms in self.phases():
+            print(f"[STARTUP] {phase:<24} {start_ms:8.1f} ms {duration_ms:8.1f} ms")
+        print(f"[STARTUP] Total hasta la última fase: {self.total_ms:.1f} ms")
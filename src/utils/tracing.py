@@ -0,0 +1,180 @@
+"""Exportación de trazas en formato Chrome trace-event (Perfetto, chrome://tracing)"""
+
+import functools
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class _NullSection:
+    """Context manager vacío usado cuando no se mide nada"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SECTION = _NullSection()
+
+
+class _Span:
+    """Context manager que registra un evento completo ("X") al cerrarse"""
+
+    __slots__ = ("recorder", "name", "cat", "start")
+
+    def __init__(self, recorder: "TraceRecorder", name: str, cat: str):
+        self.recorder = recorder
+        self.name = name
+        self.cat = cat
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.recorder.complete(self.name, self.start, time.perf_counter_ns(), self.cat)
+        return False
+
+
+class TraceRecorder:
+    """
+    Graba spans anidados de los frames en formato trace-event JSON
+
+    La captura se limita a un número de frames (o a una ventana abierta con
+    start() y cerrada con stop()) y a max_events eventos para que los archivos
+    sigan siendo pequeños. Sin captura activa, span() no mide nada.
+    """
+
+    def __init__(self, max_events: int = 200000):
+        """
+        Inicializa el grabador
+
+        Args:
+            max_events: Número máximo de eventos por captura
+        """
+        self.max_events = max_events
+        self.capturing = False
+        self.events: List[Dict] = []
+        self.path: Optional[str] = None
+        self.frames_left = 0
+        self.frame_index = 0
+        self._frame_start = None
+        self._epoch = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    def start(self, frames: int = 0, path: Optional[str] = None):
+        """
+        Empieza una captura
+
+        Args:
+            frames: Frames a capturar antes de parar solo (0 = hasta stop())
+            path: Archivo donde se guarda la traza al terminar
+        """
+        self.events = []
+        self.path = path
+        self.frames_left = frames
+        self.frame_index = 0
+        self._frame_start = None
+        self._epoch = time.perf_counter_ns()
+        self.capturing = True
+        print(f"[TRACE] Captura iniciada ({frames or 'sin límite de'} frames)")
+
+    def stop(self) -> Optional[str]:
+        """
+        Termina la captura y la guarda si se indicó un archivo
+
+        Returns:
+            Ruta del archivo guardado, si la hay
+        """
+        if not self.capturing:
+            return None
+        self.capturing = False
+        if self.path:
+            self.save(self.path)
+        return self.path
+
+    def span(self, name: str, cat: str = "engine"):
+        """
+        Devuelve un context manager que registra un span
+
+        Args:
+            name: Nombre del span
+            cat: Categoría (engine, scene, entity, assets...)
+        """
+        if not self.capturing:
+            return NULL_SECTION
+        return _Span(self, name, cat)
+
+    def complete(self, name: str, start_ns: int, end_ns: int, cat: str = "engine"):
+        """Registra un evento completo con inicio y fin en nanosegundos de perf_counter"""
+        if not self.capturing or len(self.events) >= self.max_events:
+            return
+        self.events.append({
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": (start_ns - self._epoch) / 1000.0,
+            "dur": (end_ns - start_ns) / 1000.0,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        })
+
+    def begin_frame(self):
+        """Marca el inicio de un frame capturado"""
+        if self.capturing:
+            self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self):
+        """Cierra el span del frame y para la captura al agotar los frames"""
+        if not self.capturing or self._frame_start is None:
+            return
+        self.complete(f"frame {self.frame_index}", self._frame_start, time.perf_counter_ns(), "frame")
+        self._frame_start = None
+        self.frame_index += 1
+        if self.frames_left:
+            self.frames_left -= 1
+            if self.frames_left == 0:
+                self.stop()
+
+    def to_dict(self) -> Dict:
+        """Obtiene la traza en formato trace-event"""
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str):
+        """Guarda la traza en un archivo JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+        print(f"[TRACE] Guardado: {path} ({len(self.events)} eventos)")
+
+
+# Grabador global: lo comparten engine, escenas, entidades y cargas de recursos
+tracer = TraceRecorder()
+
+
+def traced(name: str, cat: str = "engine"):
+    """
+    Decorador que registra cada llamada a la función como un span
+
+    Args:
+        name: Nombre del span
+        cat: Categoría del span
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.capturing:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.complete(name, start, time.perf_counter_ns(), cat)
+        return wrapper
+    return decorator
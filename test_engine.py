@@ -139,6 +139,1246 @@ def test_enemy_interaction():
         return False
 
 
+def test_fixed_timestep():
+    """Prueba que la simulación de paso fijo no depende del framerate"""
+    print("\nProbando paso fijo de simulación...")
+    try:
+        import pygame
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        
+        positions = []
+        for frame_time, frames in ((1000 / 60, 60), (1000 / 30, 30), (1000 / 144, 144)):
+            game = GameEngine(fixed_timestep=True)
+            level = LevelScene(1280, 720)
+            game.register_scene("level", level)
+            game.set_scene("level")
+            for _ in range(frames):
+                game.update_fixed(frame_time)
+            positions.append((round(level.player.x, 3), round(level.player.y, 3)))
+        
+        assert positions[0] == positions[1] == positions[2], positions
+        print(f"✓ Misma posición a 60, 30 y 144 FPS: {positions[0]}")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_fixed_timestep: {e}")
+        return False
+
+
+def test_headless_step():
+    """Prueba el modo headless con entrada simulada"""
+    print("\nProbando modo headless...")
+    try:
+        import pygame
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        
+        with GameEngine(headless=True) as game:
+            level = LevelScene(1280, 720)
+            game.register_scene("level", level)
+            game.set_scene("level")
+            
+            start_x = level.player.x
+            frames = game.step(30, inputs=[{pygame.K_LEFT}] * 30)
+            assert frames == 30
+            assert level.player.direction == -1
+            assert level.player.x < start_x
+            assert level.key_state is None
+        
+        assert game.screen is None
+        
+        # Los drivers dummy solo duran lo que dura el engine headless
+        saved = {name: os.environ.get(name) for name in ("SDL_VIDEODRIVER", "SDL_AUDIODRIVER")}
+        try:
+            os.environ["SDL_VIDEODRIVER"] = "x11"
+            os.environ.pop("SDL_AUDIODRIVER", None)
+            with GameEngine(headless=True) as other:
+                other.initialize()
+                assert os.environ["SDL_VIDEODRIVER"] == os.environ["SDL_AUDIODRIVER"] == "dummy"
+            assert os.environ["SDL_VIDEODRIVER"] == "x11"
+            assert "SDL_AUDIODRIVER" not in os.environ
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+        print(f"✓ {frames} frames simulados sin ventana")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_headless_step: {e}")
+        return False
+
+
+def test_profiler():
+    """Prueba el perfilador de frames y su exportación"""
+    print("\nProbando perfilador de frames...")
+    try:
+        import json
+        import tempfile
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        
+        with GameEngine(headless=True) as game:
+            level = LevelScene(1280, 720)
+            game.register_scene("level", level)
+            game.set_scene("level")
+            
+            game.step(10, render=True)
+            assert not game.profiler.samples, "El perfilador desactivado no debe medir"
+            
+            game.profiler.toggle()
+            game.step(20, render=True)
+            report = game.profiler.report()
+            for phase in ("frame", "events", "update", "collision", "draw", "hud", "flip", "draw:Player"):
+                assert report[phase]["count"] == 20, phase
+            assert report["frame"]["p50"] <= report["frame"]["p99"]
+            
+            with tempfile.TemporaryDirectory() as tmp:
+                json_path = os.path.join(tmp, "profile.json")
+                csv_path = os.path.join(tmp, "profile.csv")
+                game.profiler.export_json(json_path)
+                game.profiler.export_csv(csv_path)
+                with open(json_path, encoding="utf-8") as f:
+                    assert "update" in json.load(f)["phases"]
+                with open(csv_path, encoding="utf-8") as f:
+                    assert f.readline().startswith("phase,count")
+        
+        print(f"✓ Frame p50: {report['frame']['p50']:.2f} ms")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_profiler: {e}")
+        return False
+
+
+def test_trace_export():
+    """Prueba la captura de trazas trace-event limitada a N frames"""
+    print("\nProbando exportación de trazas...")
+    try:
+        import json
+        import tempfile
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        from src.utils.tracing import tracer
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+            with GameEngine(headless=True) as game:
+                game.start_trace(3, path)
+                level = LevelScene(1280, 720)
+                game.register_scene("level", level)
+                game.set_scene("level")
+                game.step(10, render=True)
+                assert not tracer.capturing
+            
+            with open(path, encoding="utf-8") as f:
+                events = json.load(f)["traceEvents"]
+        
+        names = [e["name"] for e in events]
+        assert names.count("LevelScene.update") == 3
+        assert "Player.handle_platform_collisions" in names
+        assert "LevelScene.load_background" in names
+        assert all(e["ph"] == "X" for e in events)
+        print(f"✓ Traza de 3 frames con {len(events)} eventos")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_trace_export: {e}")
+        return False
+
+
+def test_frame_scheduler():
+    """Prueba el planificador de trabajo diferido"""
+    print("\nProbando planificador de trabajo diferido...")
+    try:
+        from src.utils.scheduler import FrameScheduler
+        
+        scheduler = FrameScheduler(max_starved_frames=3)
+        order = []
+        
+        def chunks():
+            for i in range(3):
+                order.append(f"chunk{i}")
+                yield
+        
+        scheduler.schedule(lambda: order.append("low"), priority=5)
+        scheduler.schedule(chunks, priority=0)
+        cancelled = scheduler.schedule(lambda: order.append("cancelled"), priority=1)
+        cancelled.cancel()
+        
+        # Sin presupuesto no se ejecuta nada hasta que el trabajo se bloquea
+        assert scheduler.run(0) == 0
+        assert scheduler.run(-5) == 0
+        assert scheduler.run(0) == 1
+        assert order == ["chunk0"]
+        
+        # Con menos tiempo libre que min_slice_ms no se empieza ninguna porción
+        assert scheduler.run(scheduler.min_slice_ms / 2) == 0
+        assert order == ["chunk0"]
+        
+        scheduler.flush()
+        assert order == ["chunk0", "chunk1", "chunk2", "low"], order
+        assert scheduler.pending == 0
+        
+        # Un trabajo que espera a un Future no gasta presupuesto y deja pasar a los demás
+        from concurrent.futures import Future
+        decode = Future()
+        
+        def loading():
+            while not decode.done():
+                yield decode
+            order.append("loaded")
+        
+        scheduler.schedule(loading, priority=0)
+        scheduler.schedule(lambda: order.append("other"), priority=1)
+        assert scheduler.run(50) == 2
+        assert order[-1] == "other" and scheduler.pending == 1
+        decode.set_result(None)
+        scheduler.run(50)
+        assert order[-1] == "loaded" and scheduler.pending == 0
+        
+        # Un trabajo con dependencias espera a que terminen aunque tenga menos prioridad
+        decode = Future()
+        first = scheduler.schedule(loading, priority=0)
+        scheduler.schedule(lambda: order.append("after"), priority=5, after=[first])
+        scheduler.schedule(lambda: order.append("free"), priority=9)
+        scheduler.run(50)
+        assert order[-1] == "free" and scheduler.pending == 2
+        decode.set_result(None)
+        scheduler.flush()
+        assert order[-2:] == ["loaded", "after"], order
+        
+        # Las cargas del nivel van en porciones (decodificación, conversión, capas)
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        with GameEngine(headless=True) as game:
+            game.initialize()
+            game.register_scene("level", LevelScene(1280, 720))
+            # gc.settle no empieza hasta que terminan todas las cargas
+            seen = []
+            settle = game.gc_manager.settle
+            
+            def settle_after_loads():
+                level = game.current_scene
+                seen.append((level.background_loaded, level.ui_bar_loaded,
+                             level.hud_font_loaded, level.player.sprites_loaded))
+                settle()
+            
+            game.gc_manager.settle = settle_after_loads
+            game.set_scene("level")
+            slices = 0
+            while game.scheduler.pending:
+                slices += game.scheduler.run(1000.0)
+            level = game.current_scene
+            assert level.background_loaded and level.player.sprites_loaded
+            assert slices > game.scheduler.jobs_completed
+            assert seen == [(True, True, True, True)], seen
+        print("✓ Prioridades, porciones y cancelación correctas")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_frame_scheduler: {e}")
+        return False
+
+
+def test_gc_policy():
+    """Prueba la política del recolector de basura"""
+    print("\nProbando política del GC...")
+    try:
+        import gc
+        from src.utils.gc_policy import GCManager
+        
+        default_threshold = gc.get_threshold()
+        manager = GCManager()
+        manager.install()
+        try:
+            manager.begin_loading()
+            manager.settle()
+            assert gc.get_freeze_count() > 0
+            assert gc.get_threshold()[2] == GCManager.GAMEPLAY_GEN2_THRESHOLD
+            assert manager.report()["gen2"] >= 1
+            # Una carga nueva vuelve a los umbrales normales
+            manager.begin_loading()
+            assert not manager.in_gameplay
+            assert gc.get_threshold() == default_threshold
+            manager.settle()
+        finally:
+            manager.uninstall()
+        
+        assert gc.get_threshold() == default_threshold
+        assert gc.get_freeze_count() == 0
+        
+        # Con carga diferida se congela lo cargado y se sube el umbral al terminar
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        with GameEngine(headless=True) as game:
+            game.initialize()
+            game.register_scene("level", LevelScene(1280, 720))
+            game.set_scene("level")
+            level = game.current_scene
+            while game.scheduler.pending:
+                loaded = (level.background_loaded and level.ui_bar_loaded
+                          and level.hud_font_loaded and level.player.sprites_loaded)
+                if not loaded:
+                    # Mientras falte alguna carga se sigue con los umbrales normales
+                    assert not game.gc_manager.in_gameplay
+                    assert gc.get_threshold()[2] != GCManager.GAMEPLAY_GEN2_THRESHOLD
+                game.scheduler.run(game.scheduler.min_slice_ms)
+            assert game.gc_manager.in_gameplay and gc.get_freeze_count() > 0
+            # Lo creado por la última carga también queda congelado
+            run_sprites = level.player.sprites["run"]
+            assert run_sprites and not any(obj is run_sprites for obj in gc.get_objects())
+        
+        print(f"✓ Pausas medidas: {manager.report()['gen2']} recolecciones completas")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_gc_policy: {e}")
+        return False
+
+
+def test_pipelined_step():
+    """Prueba que el modo en tubería simula igual que el secuencial"""
+    print("\nProbando simulación en tubería...")
+    try:
+        import pygame
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        
+        positions = []
+        for pipelined in (False, True):
+            with GameEngine(headless=True, pipelined=pipelined, defer_assets=False) as game:
+                level = LevelScene(1280, 720)
+                game.register_scene("level", level)
+                game.set_scene("level")
+                game.step(40, inputs=[{pygame.K_RIGHT}] * 40, render=True)
+                positions.append([(e.x, e.y) for e in level.entities])
+                if pipelined:
+                    snapshot = game._render_snapshot
+                    assert snapshot.source is level
+                    assert snapshot.player is not level.player
+                    assert snapshot.player.x == level.player.x
+        
+        assert positions[0] == positions[1]
+        print("✓ Mismo estado con y sin hilo de simulación")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_pipelined_step: {e}")
+        return False
+
+
+def test_quality_governor():
+    """Prueba que el gobernador baja y recupera la calidad"""
+    print("\nProbando gobernador de calidad...")
+    try:
+        from src.utils.quality import QualityGovernor
+        
+        governor = QualityGovernor(target_fps=60, window=30, check_interval=30, recover_checks=2)
+        for _ in range(60):
+            governor.record_frame(25.0)
+        assert governor.level == 2, governor.level
+        assert governor.get("offscreen_update_interval") > 1
+        
+        for _ in range(30 * 4):
+            governor.record_frame(4.0)
+        assert governor.level == 0, governor.level
+        assert [name for _, name, _ in governor.history] == ["media", "baja", "media", "alta"]
+        
+        # Los enemigos de fuera de pantalla recorren lo mismo aunque se actualicen menos
+        from src.entities.enemy import SimpleEnemy
+        from src.scenes.level import LevelScene
+        from src.utils.input import NO_KEYS
+        positions = []
+        for interval in (1, 4):
+            level = LevelScene(1280, 720)
+            level.key_state = NO_KEYS
+            level.quality = type("Quality", (), {"get": lambda self, key, n=interval: n})()
+            enemy = SimpleEnemy(5000, 100, patrol_range=1000, speed=2.0)
+            level.add_entity(enemy)
+            for _ in range(40):
+                level.update(1000.0 / 60)
+            positions.append(enemy.x)
+        assert abs(positions[0] - positions[1]) < 1e-6 and positions[0] > 5000, positions
+        
+        # Con vsync la espera de flip() al refresco no cuenta como trabajo
+        import time
+        from src.engine import GameEngine
+        # (sin escena: el trabajo del frame es mínimo y la espera, de 20 ms)
+        with GameEngine(headless=True, defer_assets=False, present_mode="vsync", dirty_rects=False) as game:
+            game.initialize()
+            game.backend.present = lambda: time.sleep(0.02)
+            handle_events = game.handle_events
+            
+            def stop_after_frames():
+                handle_events()
+                if game.frame_count >= 90:
+                    game.running = False
+            
+            game.handle_events = stop_after_frames
+            game.run()
+            assert game.present_ms >= 20.0
+            assert game.quality.level == 0, game.quality.history
+        print(f"✓ {len(governor.history)} cambios de calidad registrados")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_quality_governor: {e}")
+        return False
+
+
+def test_input_latency():
+    """Prueba el filtro de eventos y la medida de latencia entrada-pantalla"""
+    print("\nProbando latencia de entrada...")
+    try:
+        import pygame
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        
+        with GameEngine(headless=True, defer_assets=False) as game:
+            level = LevelScene(1280, 720)
+            game.register_scene("level", level)
+            game.set_scene("level")
+            game.initialize()
+            
+            assert pygame.event.get_blocked(pygame.MOUSEMOTION)
+            assert not pygame.event.get_blocked(pygame.KEYDOWN)
+            # Los eventos propios (temporizadores) y el cierre de ventana siguen llegando
+            for event_type in (pygame.USEREVENT, pygame.event.custom_type(), pygame.WINDOWCLOSE):
+                assert not pygame.event.get_blocked(event_type)
+            
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT))
+            game.handle_events()
+            game.advance(game.step_ms, track_input=True)
+            game.draw()
+            
+            report = game.input.report()
+            assert report["count"] == 1
+            assert report["p50"] > 0
+        
+        print(f"✓ Latencia medida: {report['p50']:.2f} ms")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_input_latency: {e}")
+        return False
+
+
+def test_startup_factory():
+    """Prueba la construcción diferida de escenas y la cronología de arranque"""
+    print("\nProbando arranque con escenas diferidas...")
+    try:
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        from src.utils.startup import StartupTimer
+        
+        built = []
+        
+        def factory():
+            built.append(True)
+            return LevelScene(1280, 720)
+        
+        with GameEngine(headless=True, defer_assets=False) as game:
+            timer = StartupTimer()
+            game.startup = timer
+            game.register_scene_factory("level", factory)
+            game.set_scene("level")
+            assert not built, "La escena no debe construirse antes de la ventana"
+            
+            game.step(1, render=True)
+            assert built and game.current_scene is not None
+            phases = [name for name, _, _ in timer.phases()]
+            assert phases == ["display", "escena", "recursos", "primer frame"], phases
+            assert game.startup is None
+        
+        # Con carga diferida, "recursos" se cierra cuando terminan todas las cargas
+        with GameEngine(headless=True) as game:
+            game.initialize()
+            game.startup = StartupTimer()
+            game.register_scene("level", LevelScene(1280, 720))
+            loaded = []
+            mark_startup = game.mark_startup
+            
+            def mark(phase):
+                if phase == "recursos":
+                    level = game.current_scene
+                    loaded.append(level.background_loaded and level.ui_bar_loaded
+                                  and level.hud_font_loaded and level.player.sprites_loaded)
+                mark_startup(phase)
+            
+            game.mark_startup = mark
+            game.set_scene("level")
+            while game.scheduler.pending:
+                game.scheduler.run(1000.0)
+            assert loaded == [True], loaded
+        
+        print(f"✓ Arranque medido: {timer.total_ms:.1f} ms")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_startup_factory: {e}")
+        return False
+
+
+def test_dirty_rects():
+    """Prueba que los rectángulos sucios dan la misma imagen que redibujar todo"""
+    print("\nProbando rectángulos sucios...")
+    try:
+        import pygame
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        
+        frames = []
+        for dirty in (False, True):
+            with GameEngine(headless=True, dirty_rects=dirty, defer_assets=False) as game:
+                game.quality.enabled = False
+                level = LevelScene(1280, 720)
+                # Sin el sprite de 1024 px el jugador ocupa poco y no se fuerza el flip
+                level.player.sprites_loaded = True
+                game.register_scene("level", level)
+                game.set_scene("level")
+                game.step(30, inputs=[{pygame.K_RIGHT}] * 30, render=True)
+                frames.append(pygame.image.tobytes(game.screen, "RGB"))
+                if dirty:
+                    renderer = game.dirty_renderer
+                    assert renderer.full_frames == 1, renderer.full_frames
+                    assert renderer.partial_frames == 29, renderer.partial_frames
+                    area = sum(rect.w * rect.h for rect in renderer.rects)
+        
+        assert frames[0] == frames[1]
+        print(f"✓ Misma imagen presentando {area / (1280 * 720):.0%} de la pantalla")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_dirty_rects: {e}")
+        return False
+
+
+def test_static_layer():
+    """Prueba que la capa estática solo se reconstruye cuando cambia la geometría"""
+    print("\nProbando capa estática...")
+    try:
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        from src.entities.world import Platform, Collectible
+        
+        with GameEngine(headless=True, defer_assets=False) as game:
+            level = LevelScene(1280, 720)
+            game.register_scene("level", level)
+            game.set_scene("level")
+            layer = level.static_layer
+            
+            game.step(5, render=True)
+            builds = layer.builds
+            assert 0 < builds <= layer.cached_chunks
+            
+            # Las entidades móviles no afectan a la capa
+            level.add_entity(Collectible(300, 300))
+            game.step(1, render=True)
+            assert layer.builds == builds
+            
+            # Una plataforma nueva solo rehace el bloque que toca
+            platform = Platform(400, 200, 100, 20)
+            level.add_entity(platform)
+            game.step(1, render=True)
+            assert layer.builds == builds + 1
+            chunk = layer.chunk(0, 0, level.render_layers)
+            assert chunk.get_at((450, 210))[:3] == platform.color
+            
+            level.remove_entity(platform)
+            game.step(1, render=True)
+            assert layer.chunk(0, 0, level.render_layers).get_at((450, 210))[:3] != platform.color
+            assert layer.builds == builds + 2
+            
+            # En un mundo grande solo se dibujan los bloques que se ven
+            level.set_world_size(100000, 720)
+            level.add_entity(Platform(90000, 600, 200, 20))
+            game.step(1, render=True)
+            assert level.static_layer.cached_chunks <= 6
+        
+        print("✓ Capa reconstruida solo al cambiar entidades estáticas")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_static_layer: {e}")
+        return False
+
+
+def test_render_queue():
+    """Prueba que la cola de dibujo agrupa los blits y respeta capas y orden"""
+    print("\nProbando cola de dibujo...")
+    try:
+        import pygame
+        from src.render.queue import RenderQueue
+        
+        surface = pygame.Surface((40, 10))
+        red = pygame.Surface((10, 10))
+        red.fill((255, 0, 0))
+        blue = pygame.Surface((10, 10))
+        blue.fill((0, 0, 255))
+        
+        queue = RenderQueue()
+        queue.submit(blue, (0, 0), layer=1)
+        queue.submit(red, (0, 0))
+        queue.submit(red, (10, 0))
+        # Un dibujo directo entre dos imágenes conserva su turno
+        queue.submit_draw(lambda s: s.fill((0, 255, 0), (10, 0, 20, 10)))
+        queue.submit(red, (20, 0))
+        queue.flush(surface)
+        
+        assert surface.get_at((5, 5))[:3] == (0, 0, 255)   # Capa 1 encima
+        assert surface.get_at((15, 5))[:3] == (0, 255, 0)
+        assert surface.get_at((25, 5))[:3] == (255, 0, 0)
+        assert queue.blit_calls == 3 and queue.items == 5
+        assert not queue.layers
+        
+        # Las imágenes compartidas de enemigos y coleccionables no sobreviven a la pantalla
+        from src.engine import GameEngine
+        from src.entities.enemy import Enemy, SimpleEnemy
+        from src.entities.world import Collectible
+        with GameEngine(headless=True) as game:
+            game.initialize()
+            SimpleEnemy(0, 0).get_image()
+            Collectible.get_image()
+            assert Enemy._images and Collectible._image is not None
+        assert not Enemy._images and Collectible._image is None
+        
+        print("✓ 5 elementos en 3 llamadas a blits()")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_render_queue: {e}")
+        return False
+
+
+def test_hud_cache():
+    """Prueba que el HUD solo se recompone cuando cambian puntuación o salud"""
+    print("\nProbando caché del HUD...")
+    try:
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        from src.render.text import text_cache
+        
+        with GameEngine(headless=True, defer_assets=False) as game:
+            game.quality.enabled = False
+            level = LevelScene(1280, 720)
+            game.register_scene("level", level)
+            game.set_scene("level")
+            
+            composed = []
+            render_hud = level.render_hud
+            level.render_hud = lambda surface: composed.append(1) or render_hud(surface)
+            
+            game.step(10, render=True)
+            assert len(composed) == 1, len(composed)
+            
+            level.score += 10
+            game.step(5, render=True)
+            level.player.health -= 1
+            game.step(5, render=True)
+            assert len(composed) == 3, len(composed)
+            
+            # Volver a un texto ya visto no lo rasteriza otra vez
+            misses = text_cache.misses
+            level.player.health += 1
+            game.step(1, render=True)
+            assert text_cache.misses == misses
+            assert text_cache.font(None, 36) is text_cache.font(None, 36)
+        
+        print(f"✓ HUD recompuesto {len(composed)} veces en 21 frames")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_hud_cache: {e}")
+        return False
+
+
+def test_bitmap_font():
+    """Prueba el recorte de las hojas de glifos y el dibujo con la fuente de mapa de bits"""
+    print("\nProbando fuente de mapa de bits...")
+    try:
+        import pygame
+        from src.render.bitmap_font import load_bitmap_font
+        
+        pygame.display.init()
+        lums = load_bitmap_font("lums", 26)
+        credits = load_bitmap_font("credits", 32)
+        assert sorted(lums.glyphs) == sorted("0123456789/")
+        assert len(credits.glyphs) == 29
+        assert lums.height == 26
+        
+        surface = pygame.Surface((300, 40), pygame.SRCALPHA)
+        rect = lums.draw(surface, "1250/3", (4, 4))
+        assert rect.topleft == (4, 4) and rect.size == lums.size("1250/3")
+        assert surface.get_bounding_rect().colliderect(rect)
+        
+        # Kerning: la barra se acerca a los dígitos
+        assert lums.size("1/")[0] < lums.size("1")[0] + lums.size("/")[0]
+        # Las minúsculas usan el glifo en mayúsculas y los espacios solo avanzan
+        assert credits.size("ab")[0] == credits.size("AB")[0]
+        assert credits.layout("A B")[1][1][0] > credits.layout("AB")[1][1][0]
+        
+        print(f"✓ {len(lums.glyphs) + len(credits.glyphs)} glifos recortados")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_bitmap_font: {e}")
+        return False
+
+
+def test_transform_cache():
+    """Prueba la caché de transformaciones: aciertos, fallos y presupuesto de bytes"""
+    print("\nProbando caché de transformaciones...")
+    try:
+        import pygame
+        from src.render.transform_cache import TransformCache
+        
+        sprite = pygame.Surface((64, 64), pygame.SRCALPHA)
+        sprite.fill((255, 0, 0, 255), (0, 0, 8, 64))
+        cache = TransformCache(budget_bytes=3 * 64 * 64 * 4)
+        
+        assert cache.get(sprite) is sprite
+        flipped = cache.get(sprite, flip_x=True)
+        assert flipped.get_at((63, 0))[:3] == (255, 0, 0)
+        assert cache.get(sprite, flip_x=True) is flipped
+        assert cache.hits == 1 and cache.misses == 1
+        
+        # Los ángulos se redondean al paso de rotación
+        rotated = cache.get(sprite, angle=90)
+        assert cache.get(sprite, angle=91) is rotated
+        assert cache.get(sprite, scale=0.5).get_size() == (32, 32)
+        
+        # Al pasarse del presupuesto se descarta lo menos usado (el volteo)
+        cache.get(sprite, flip_y=True)
+        assert cache.evictions == 1 and cache.bytes <= cache.budget_bytes
+        assert cache.get(sprite, angle=90) is rotated
+        assert cache.get(sprite, flip_x=True) is not flipped
+        
+        print(f"✓ {cache.hits} aciertos, {cache.misses} fallos, {cache.evictions} descartes")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_transform_cache: {e}")
+        return False
+
+
+def test_camera():
+    """Prueba que la cámara sigue al jugador y solo se dibuja lo que se ve"""
+    print("\nProbando cámara...")
+    try:
+        import pygame
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        from src.render.camera import Camera
+        from src.entities.world import Collectible
+        
+        # Zona muerta: no se mueve hasta que el objetivo sale de ella
+        camera = Camera((400, 300), pygame.Rect(0, 0, 2000, 300), deadzone=(0.5, 1.0))
+        camera.follow(pygame.Rect(250, 100, 20, 20))
+        assert camera.x == 0
+        camera.follow(pygame.Rect(330, 100, 20, 20))
+        assert camera.x == 50, camera.x
+        camera.follow(pygame.Rect(5000, 100, 20, 20))
+        assert camera.x == 1600   # Limitada al mundo
+        assert camera.world_to_screen(1700, 50) == (100, 50)
+        
+        with GameEngine(headless=True, defer_assets=False) as game:
+            level = LevelScene(1280, 720)
+            level.player.sprites_loaded = True
+            level.set_world_size(1280 * 4, 720)
+            for i in range(200):
+                collectible = Collectible(40 + i * 25, 500)
+                level.collectibles.append(collectible)
+                level.add_entity(collectible)
+            game.register_scene("level", level)
+            game.set_scene("level")
+            
+            level.player.set_position(3000, 100)
+            game.step(30, render=True)
+            viewport = level.camera.viewport
+            assert viewport.contains(level.player.rect), (viewport, level.player.rect)
+            
+            # Solo se encolan las entidades de la vista
+            drawn = level.render_queue.items
+            visible = [e for e in level.entities if not e.static and viewport.colliderect(e.get_draw_rect())]
+            assert drawn == len(visible) < 100, (drawn, len(visible))
+            # El jugador se dibuja en coordenadas de pantalla, pero sigue en las del mundo
+            assert level.player.x >= 3000 - 50
+        
+        print(f"✓ Vista en x={viewport.x}, {drawn} de {len(level.entities)} entidades dibujadas")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_camera: {e}")
+        return False
+
+
+def test_parallax():
+    """Prueba que las capas parallax se desplazan a su ritmo sin escalar al dibujar"""
+    print("\nProbando fondo parallax...")
+    try:
+        import pygame
+        from src.render.parallax import ParallaxBackground, ParallaxLayer
+        
+        near_image = pygame.Surface((40, 20))
+        near_image.fill((255, 0, 0))
+        background = ParallaxBackground((100, 50))
+        far = background.add_layer(ParallaxLayer(pygame.Surface((64, 32)), 0.0, height=50))
+        near = background.add_layer(ParallaxLayer(near_image, 0.5, y=30))
+        # Escalada una vez al crear la capa, manteniendo la proporción
+        assert (far.width, far.height) == (100, 50)
+        
+        surface = pygame.Surface((100, 50))
+        images = [image for image, _ in background._batch]
+        background.draw(surface, (30, 0))
+        # La capa cercana avanza 15 px: su primera copia empieza en x=-15
+        assert surface.get_at((24, 40))[:3] == (255, 0, 0)
+        background.draw(surface, (1000, 0))
+        assert [image for image, _ in background._batch] == images
+        assert background._slots[1][1][0] == [-(500 % 40), 30]
+        # Las copias cubren todo el ancho con cualquier desplazamiento
+        assert surface.get_at((99, 30))[:3] == (255, 0, 0)
+        
+        print(f"✓ {len(background.layers)} capas en {len(images)} copias")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_parallax: {e}")
+        return False
+
+
+def test_render_scale():
+    """Prueba que la escena dibuja a resolución interna y se escala a la ventana"""
+    print("\nProbando resolución interna...")
+    try:
+        import pygame
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        from src.render.scaler import RenderScaler
+        
+        # Factor entero centrado con bandas; smooth aprovecha todo el ancho
+        assert RenderScaler((320, 180), (1000, 600)).dest_rect == pygame.Rect(20, 30, 960, 540)
+        assert RenderScaler((320, 180), (1000, 600), "smooth").dest_rect.width == 1000
+        
+        with GameEngine(640, 360, headless=True, defer_assets=False, render_preset="nitida") as game:
+            level = LevelScene(640, 360)
+            level.player.sprites_loaded = True
+            game.register_scene("level", level)
+            game.set_scene("level")
+            game.step(5, render=True)
+            
+            assert game.screen.get_size() == (640, 360)
+            assert game.window.get_size() == (1280, 720)
+            assert game.scaler.presents == 5
+            # Cada píxel interno ocupa 2x2 píxeles de la ventana
+            for x, y in ((10, 10), (320, 200), (639, 359)):
+                color = game.screen.get_at((x, y))
+                assert game.window.get_at((x * 2, y * 2)) == color
+                assert game.window.get_at((x * 2 + 1, y * 2 + 1)) == color
+            assert game.scaler.to_internal((641, 401)) == (320, 200)
+        
+        print("✓ 640x360 escalado a 1280x720 con factor entero")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_render_scale: {e}")
+        return False
+
+
+def test_render_backend():
+    """Prueba que el backend de texturas dibuja lo mismo que el de superficies"""
+    print("\nProbando backend de texturas...")
+    try:
+        import pygame
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        
+        frames = {}
+        for backend in ("surface", "texture"):
+            with GameEngine(headless=True, defer_assets=False, backend=backend) as game:
+                level = LevelScene(1280, 720)
+                level.player.sprites_loaded = True
+                game.register_scene("level", level)
+                game.set_scene("level")
+                game.step(5, render=True)
+                if backend == "surface":
+                    frames[backend] = game.screen.copy()
+                    continue
+                # La escena recibe un destino con la interfaz de Surface
+                assert not isinstance(game.screen, pygame.Surface)
+                uploads = game.screen.uploads
+                game.step(5, render=True)
+                assert game.screen.uploads == uploads, "texturas subidas en cada frame"
+                frame = pygame.Surface((1280, 720))
+                game.backend.renderer.to_surface(frame)
+                frames[backend] = frame
+        
+        # Fuera del HUD (alfa premultiplicado) la imagen coincide
+        hud = LevelScene.HUD_RECT
+        for pos in ((640, 100), (375, 525), (100, 700), (900, 300), (1270, 710)):
+            assert not hud.collidepoint(pos)
+            expected = frames["surface"].get_at(pos)
+            actual = frames["texture"].get_at(pos)
+            assert all(abs(a - b) <= 8 for a, b in zip(expected, actual)), (pos, expected, actual)
+        
+        # El filtro de escalado no se queda en el entorno del proceso
+        import os
+        previous = os.environ.pop("SDL_RENDER_SCALE_QUALITY", None)
+        try:
+            with GameEngine(headless=True, backend="texture", window_size=(640, 360)) as game:
+                game.initialize()
+                assert game.backend._target is not None
+                assert "SDL_RENDER_SCALE_QUALITY" not in os.environ
+        finally:
+            if previous is not None:
+                os.environ["SDL_RENDER_SCALE_QUALITY"] = previous
+        
+        print(f"✓ Mismo frame con los dos backends ({uploads} texturas)")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_render_backend: {e}")
+        return False
+
+
+def test_render_layers():
+    """Prueba el orden de dibujo por capas y profundidad"""
+    print("\nProbando capas de dibujo...")
+    try:
+        from src.render.layers import RenderLayers
+        from src.scenes.level import LevelScene
+        from src.entities.player import Player
+        from src.entities.world import Collectible, Platform
+        
+        layers = RenderLayers()
+        a, b, c = Collectible(0, 0), Collectible(10, 0), Collectible(20, 0)
+        platform = Platform(0, 0, 10, 10)
+        b.depth = -1
+        for entity in (a, b, c, platform):
+            layers.add(entity)
+        # Estáticas antes que actores; a igual profundidad, por orden de creación
+        assert list(layers) == [platform, b, a, c]
+        layers.set_depth(b, 5)
+        assert list(layers) == [platform, a, c, b]
+        assert layers.remove(a) and not layers.remove(a)
+        assert list(layers) == [platform, c, b] and len(layers) == 3
+        
+        # El jugador se añade el primero pero se dibuja encima de los demás actores
+        level = LevelScene(1280, 720)
+        order = list(level.render_layers)
+        assert level.render_layers.layer("actors")[-1] is level.player
+        assert all(entity.static for entity in order[:len(level.platforms) + 2])
+        snap = level.snapshot()
+        assert snap.render_layers.layer("actors")[-1] is snap.player
+        
+        print(f"✓ {len(order)} entidades en orden sin reordenar por frame")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_render_layers: {e}")
+        return False
+
+
+def test_particles():
+    """Prueba el emisor de partículas con arrays de NumPy"""
+    print("\nProbando partículas...")
+    try:
+        import pygame
+        from src.render.particles import ParticleEmitter, particle_frames
+        from src.render.queue import RenderQueue
+        from src.scenes.level import LevelScene
+        
+        emitter = ParticleEmitter([particle_frames((255, 0, 0), 4), particle_frames((0, 0, 255), 4)],
+                                  capacity=100, gravity=100.0, seed=1)
+        assert emitter.emit(50, 50, 80, life=(100.0, 100.0)) == 80
+        assert emitter.emit(50, 50, 80, life=(300.0, 300.0)) == 20  # Lleno
+        assert emitter.rect.collidepoint(50, 50)
+        snap = emitter.snapshot()
+        emitter.update(200)
+        # Las de vida corta mueren y las vivas quedan al principio
+        assert emitter.count == 20 and (emitter.life[:20] == 300.0).all()
+        assert snap.count == 100 and len(snap.pos) == 100
+        
+        # Todas las partículas del emisor van en un solo blits()
+        surface = pygame.Surface((100, 100))
+        queue = RenderQueue()
+        emitter.submit(queue)
+        queue.flush(surface)
+        assert queue.blit_calls == 1 and queue.items == 20
+        assert surface.get_bounding_rect().width > 0
+        emitter.update(200)
+        assert emitter.count == 0 and emitter.rect.size == (0, 0)
+        
+        # Recoger un lum suelta un estallido según la densidad de efectos
+        level = LevelScene(1280, 720)
+        collectible = level.collectibles[0]
+        level.player.set_position(collectible.x, collectible.y)
+        level.check_collisions()
+        assert level.lum_particles.count == 24
+        
+        # Dibujar no toca el estado del GC (lo controla GCManager)
+        import gc
+        gc.disable()
+        try:
+            assert len(level.lum_particles.blit_sequence()) == 24 and not gc.isenabled()
+        finally:
+            gc.enable()
+        level.lum_particles.blit_sequence()
+        assert gc.isenabled()
+        
+        # Los lums son aditivos: el fondo negro de sus imágenes no se ve
+        lums = level.lum_particles
+        assert lums.flags == pygame.BLEND_ADD
+        surface = pygame.Surface((200, 200))
+        surface.fill((60, 90, 120))
+        lums.x, lums.y = 100 - collectible.x, 100 - collectible.y
+        lums.draw(surface)
+        pixels = [surface.get_at((x, y))[:3] for x in range(200) for y in range(200)]
+        assert (0, 0, 0) not in pixels and any(p != (60, 90, 120) for p in pixels)
+        lums.x = lums.y = 0
+        level.quality = type("Quality", (), {"get": lambda self, key: 0.0})()
+        assert level.emit_particles(level.puff_particles, 0, 0, 20) == 0
+        
+        print("✓ Partículas vectorizadas y dibujadas en un blits()")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_particles: {e}")
+        return False
+
+
+def test_post_effects():
+    """Prueba los efectos de postproceso con surfarray"""
+    print("\nProbando efectos de postproceso...")
+    try:
+        import pygame
+        from src.render.postfx import PostEffects, tint_surface
+        from src.scenes.level import LevelScene
+        from src.utils.input import NO_KEYS
+        
+        surface = pygame.Surface((64, 32), 0, 32)
+        effects = PostEffects()
+        surface.fill((100, 200, 50))
+        effects.desaturate(1.0)
+        effects.apply(surface, "world")
+        r, g, b, _ = surface.get_at((0, 0))
+        assert r == g == b == (100 * 77 + 200 * 150 + 50 * 29) >> 8
+        
+        # Solo la región pedida y solo los efectos de la etapa
+        effects.desaturate(0.0)
+        effects.flash((255, 0, 0), 1.0, 100.0)
+        surface.fill((0, 0, 0))
+        effects.apply(surface, "screen")
+        assert surface.get_at((0, 0))[:3] == (0, 0, 0)
+        effects.apply(surface, "world", pygame.Rect(0, 0, 16, 32))
+        assert surface.get_at((0, 0))[:3] == (255, 0, 0) and surface.get_at((20, 0))[:3] == (0, 0, 0)
+        effects.update(100.0)
+        assert not effects.active
+        
+        # Fundido animado; la instantánea conserva su intensidad
+        effects.fade_in(200.0)
+        snap = effects.snapshot()
+        effects.update(100.0)
+        assert snap.effects["fade"].amount == 1.0 and effects.effects["fade"].amount == 0.5
+        surface.fill((200, 100, 40))
+        effects.apply(surface, "screen")
+        assert surface.get_at((0, 0))[:3] == (100, 50, 20)
+        
+        # El teñido de imágenes conserva el alfa
+        sprite = pygame.Surface((4, 4), pygame.SRCALPHA)
+        sprite.fill((0, 0, 255, 100))
+        assert tint_surface(sprite, (255, 255, 255), 0.5).get_at((0, 0)) == (127, 127, 255, 100)
+        
+        # Recibir daño enciende el destello del mundo
+        level = LevelScene(1280, 720)
+        level.key_state = NO_KEYS
+        level.player.take_damage(1)
+        level.update(16)
+        assert level.post_effects.effects["flash"].weight > 0
+        
+        # El fundido al cambiar de escena termina también en escenas que no son niveles
+        from src.engine import GameEngine
+        from src.scenes.scene import Scene
+        
+        class PlainScene(Scene):
+            def setup(self):
+                pass
+            
+            def handle_input(self, event):
+                pass
+            
+            def update(self, dt):
+                pass
+            
+            def draw(self, surface):
+                surface.fill((100, 100, 100))
+        
+        with GameEngine(headless=True, dirty_rects=False) as engine:
+            engine.initialize()
+            engine.register_scene("level", LevelScene(engine.width, engine.height))
+            engine.register_scene("plain", PlainScene(engine.width, engine.height))
+            engine.set_scene("level")
+            engine.scheduler.flush()
+            engine.set_scene("plain")
+            engine.step(120, render=True)
+            assert engine.current_scene.post_effects.effects["fade"].weight == 0
+            assert engine.screen.get_at((640, 360))[:3] == (100, 100, 100)
+        
+        print("✓ Tinte, desaturado, destello y fundido vectorizados")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_post_effects: {e}")
+        return False
+
+
+def test_tilemap():
+    """Prueba el mapa de tiles por bloques"""
+    print("\nProbando mapa de tiles...")
+    try:
+        import pygame
+        from src.render.tilemap import TileMap, make_tiles
+        from src.scenes.level import LevelScene
+        from src.utils.input import NO_KEYS
+        
+        tiles = make_tiles([(100, 150, 100), (120, 90, 60)], 8)
+        rows = ["." * 40] * 18 + ["=" * 40, "#" * 40]
+        tilemap = TileMap.from_rows(rows, {"=": 1, "#": 2}, tiles, tile_size=8, chunk_tiles=4)
+        assert tilemap.data.dtype.itemsize == 1 and tilemap.get_tile(3, 19) == 2
+        
+        # Solo se dibujan (y se guardan) los bloques que se ven
+        surface = pygame.Surface((64, 64))
+        viewport = pygame.Rect(0, 96, 64, 64)
+        tilemap.draw(surface, viewport)
+        assert tilemap.builds == 2 * 2 and tilemap.cached_chunks == 4
+        assert surface.get_at((4, 160 - 96 - 4))[:3] != (0, 0, 0)
+        tilemap.draw(surface, viewport)
+        assert tilemap.builds == 4
+        
+        # Un cambio solo rehace su bloque
+        tilemap.set_tile(1, 18, 0)
+        assert tilemap.cached_chunks == 3
+        tilemap.draw(surface, viewport)
+        assert tilemap.builds == 5
+        
+        # Fuera del mapa no se escribe nada (ni el borde opuesto) y no se descarta nada
+        data, version = tilemap.data.copy(), tilemap.version
+        for column, row in ((-1, 18), (40, 18), (0, -1), (0, 20)):
+            tilemap.set_tile(column, row, 2)
+        tilemap.fill(-8, 18, 4, 2, 2)
+        tilemap.fill(0, 20, 40, 3, 2)
+        assert (tilemap.data == data).all() and tilemap.version == version
+        assert tilemap.cached_chunks == 4
+        
+        # Un relleno que sale del mapa se recorta y solo descarta sus bloques
+        tilemap.fill(-2, 17, 4, 1, 2)
+        assert tilemap.get_tile(0, 17) == tilemap.get_tile(1, 17) == 2
+        assert tilemap.get_tile(2, 17) == 0 and tilemap.get_tile(39, 17) == 0
+        assert tilemap.cached_chunks == 3
+        tilemap.fill(38, 19, 10, 10, 1)
+        assert tilemap.get_tile(39, 19) == 1 and tilemap.get_tile(37, 19) == 2
+        
+        # Los tiles sólidos seguidos de una fila forman un solo bloque de colisión
+        colliders = tilemap.colliders(pygame.Rect(0, 152, 80, 8))
+        assert [c.rect for c in colliders] == [pygame.Rect(0, 152, 80, 8)]
+        
+        # El jugador se apoya en los tiles
+        level = LevelScene(1280, 720)
+        level.key_state = NO_KEYS
+        ground = TileMap(200, 23, make_tiles([(100, 150, 100)]))
+        ground.fill(0, 20, 200, 3, 1)
+        level.set_tilemap(ground)
+        level.platforms = []
+        level.player.set_position(400, 400)
+        for _ in range(60):
+            level.update(16)
+        assert level.world_rect.width == 200 * 32 and level.player.is_on_ground
+        assert level.player.rect.bottom == 20 * 32
+        
+        print(f"✓ {tilemap.builds} bloques dibujados, {len(colliders)} bloque de colisión")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_tilemap: {e}")
+        return False
+
+
+def test_render_recording():
+    """Prueba la grabación de los comandos de dibujo y su reproducción"""
+    print("\nProbando grabación de dibujo...")
+    try:
+        import os
+        import tempfile
+        import pygame
+        from src.engine import GameEngine
+        from src.scenes.level import LevelScene
+        from src.render.recorder import RenderRecording
+        
+        with GameEngine(headless=True, dirty_rects=False) as engine:
+            engine.initialize()
+            level = LevelScene(engine.width, engine.height)
+            engine.register_scene("level", level)
+            engine.set_scene("level")
+            engine.scheduler.flush()
+            engine.step(3, render=True)
+            level.post_effects.flash((255, 0, 0), 0.5, 1000)
+            level.emit_particles(level.lum_particles, 300, 300, 30)
+            
+            # Mientras se graba no se dibuja en pantalla
+            engine.screen.fill((1, 2, 3))
+            engine.start_recording()
+            engine.draw()
+            assert engine.screen.get_at((0, 0))[:3] == (1, 2, 3)
+            recording = engine.stop_recording()
+            assert len(recording.frames) == 1
+            assert any(line.startswith("effect flash") for line in recording.lines())
+            
+            # Reproducida (también tras guardarla y cargarla) queda igual que dibujando directamente
+            engine.draw()
+            expected = pygame.image.tobytes(engine.screen, "RGB")
+            path = os.path.join(tempfile.mkdtemp(), "frame.rec")
+            recording.save(path)
+            loaded = RenderRecording.load(path)
+            for rec in (recording, loaded):
+                target = pygame.Surface(engine.screen.get_size()).convert()
+                rec.replay(target)
+                assert pygame.image.tobytes(target, "RGB") == expected
+            
+            assert loaded.frames == recording.frames
+            
+            # Las grabaciones no llevan objetos de Python: un archivo pickle no se carga
+            import pickle
+            evil = os.path.join(os.path.dirname(path), "evil.rec")
+            with open(evil, "wb") as f:
+                pickle.dump({"format": 2}, f)
+            try:
+                RenderRecording.load(evil)
+                raise AssertionError("Se ha cargado un archivo pickle")
+            except ValueError:
+                pass
+            
+            # Las superficies se identifican por contenido: dos grabaciones iguales no difieren
+            assert loaded.diff(recording) == []
+            engine.start_recording()
+            engine.draw()
+            again = engine.stop_recording()
+            assert again.diff(recording) == []
+        
+        print(f"✓ {len(recording.frames[0])} comandos, {len(recording.surfaces)} superficies, "
+              f"{os.path.getsize(path) // 1024} KB")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Error en test_render_recording: {e}")
+        return False
+
+
 def main():
     """Ejecuta todas las pruebas"""
     print("=" * 50)
@@ -149,7 +1389,32 @@ def main():
         test_imports,
         test_player_creation,
         test_collision,
-        test_level_creation
+        test_level_creation,
+        test_fixed_timestep,
+        test_headless_step,
+        test_profiler,
+        test_trace_export,
+        test_frame_scheduler,
+        test_gc_policy,
+        test_pipelined_step,
+        test_quality_governor,
+        test_input_latency,
+        test_startup_factory,
+        test_dirty_rects,
+        test_static_layer,
+        test_render_queue,
+        test_hud_cache,
+        test_bitmap_font,
+        test_transform_cache,
+        test_camera,
+        test_parallax,
+        test_render_scale,
+        test_render_backend,
+        test_render_layers,
+        test_particles,
+        test_post_effects,
+        test_tilemap,
+        test_render_recording
     ]
     
     results = []